@@ -0,0 +1,56 @@
+"""
+Per-row cost of decoding a SELECT result in 'Response'.
+
+It compares the previous algorithm (look up the clause, resolve its python type and build a caster for every cell)
+with the 'DecoderPlan' compiled once per statement. No database is needed, rows are generated in memory.
+
+    PYTHONPATH=src python benchmarks/response_decode.py [rows]
+"""
+
+from __future__ import annotations
+import datetime
+import sys
+import timeit
+
+from ormlambda.common.global_checker import GlobalChecker
+from ormlambda.dialects import mysql
+from ormlambda.repository.response import Response
+from ormlambda.sql import clauses
+from test.models import Address
+
+
+def per_cell(response: Response) -> list[tuple]:
+    """Algorithm used by 'Response._clean_response' before the decoder plan"""
+    rows = []
+    for row in response._response_values:
+        new_row = []
+        for i, data in enumerate(row):
+            clause = response._select[response._columns[i]]
+            dtype = response.get_python_type(clause)
+            new_row.append(response._caster.for_value(data, value_type=dtype).from_database)
+        rows.append(tuple(new_row))
+    return rows
+
+
+def main(n_rows: int = 100_000) -> None:
+    dialect = mysql.dialect()
+    select = clauses.Select(Address, GlobalChecker.resolved_callback_object(Address, lambda x: x))
+    query = select.compile(dialect).string
+    columns = tuple(x.alias for x in select.columns)
+
+    now = datetime.datetime(2014, 9, 25, 20, 30, 27)
+    rows = [(i, f"{i} MySakila Drive", None, "Alberta", 300, "", "14033335568", b"\x00" * 25, now) for i in range(n_rows)]
+
+    response = Response(dialect, rows, columns, tuple, select, query=query)
+    assert per_cell(response) == response._clean_response()
+
+    before = min(timeit.repeat(lambda: per_cell(response), number=1, repeat=3))
+    after = min(timeit.repeat(lambda: response._clean_response(), number=1, repeat=3))
+
+    print(f"{n_rows} rows x {len(columns)} columns")
+    print(f"per-cell casters: {before:8.3f} s  {before / n_rows * 1e6:8.2f} us/row")
+    print(f"decoder plan:     {after:8.3f} s  {after / n_rows * 1e6:8.2f} us/row  ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:]))
@@ -14,6 +14,8 @@ from .sql import Column as Column
 from .sql import ColumnProxy as ColumnProxy
 from .sql import Table as Table
 from .sql import ForeignKey as ForeignKey
+from .sql import Relationship as Relationship
+from .sql import Row as Row
 from .sql import TableProxy as TableProxy
 
 
@@ -26,6 +28,7 @@ from .model.base_model import ORM as ORM
 # COMMENT: to avoid relative import we need to import BaseModel after import Table,Column, ForeignKey, IRepositoryBase and Disassembler
 
 from .engine import create_engine as create_engine
+from .engine import create_async_engine as create_async_engine
 from .engine import URL as URL
 from .engine import make_url as make_url
 
@@ -88,8 +91,11 @@ from .sql.column.metadata import Unique as Unique
 from .sql.column.metadata import CheckTypes as CheckTypes
 from .sql.column.metadata import Default as Default
 from .sql.column.metadata import NotNull as NotNull
+from .sql.column.metadata import Deferred as Deferred
 
 from ormlambda.statements.interfaces import IStatements as IStatements
 from ormlambda.engine import Engine as Engine
+from ormlambda.engine import AsyncEngine as AsyncEngine
+from ormlambda.statements import AsyncStatements as AsyncStatements
 
 _util.import_prefix("ormlambda")
@@ -1,4 +1,4 @@
-from typing import Type, Callable, Optional, overload
+from typing import Any, Type, Callable, Optional, overload
 import abc
 
 
@@ -58,6 +58,29 @@ class BaseCaster[TProp, TType](abc.ABC):
     def type_to_cast(self) -> TType:
         return self._type_value
 
+    @classmethod
+    def decoder(cls, type_value: TType) -> Optional[Callable[[Any], Any]]:
+        """
+        Return a function that converts a non-NULL value fetched from the database just like 'from_database' does, without creating a caster per value.
+
+        None means that values can be returned as they come from the driver.
+        Subclasses override it when the conversion doesn't depend on the caster instance.
+        """
+
+        def decode(value: Any) -> Any:
+            return cls(value, type_value).from_database
+
+        return decode
+
+    @staticmethod
+    def converter(func: Callable[[Any], Any], python_type: Type) -> Callable[[Any], Any]:
+        """Build a decoder that applies 'func' only when the value is not already an instance of 'python_type'"""
+
+        def decode(value: Any) -> Any:
+            return value if type(value) is python_type else func(value)
+
+        return decode
+
     @staticmethod
     def return_value_if_exists[TType, **P](func: Callable[P, Optional[TType]]) -> Callable[P, Optional[TType]]:
         def wrapped(self: "BaseCaster") -> Optional[TType]:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 
-from typing import ClassVar, Optional, Type, TYPE_CHECKING, Callable, overload, get_args
+from typing import Any, ClassVar, Optional, Type, TYPE_CHECKING, Callable, overload, get_args
 from types import NoneType
 from ormlambda.caster.interfaces import ICaster
 from ormlambda.common.global_checker import GlobalChecker
@@ -51,20 +51,67 @@ class Caster(ICaster):
 
     @classmethod
     def cast[TProp, TType](cls, value: TProp, type_value: Optional[TypeEngine[TType]] = None) -> BaseCaster[TProp, TType]:
+        column_type = cls._resolve_type(type_value)
+        if not column_type:
+            column_type = type(value)
+
+        return cls._get_caster_class(column_type)(value, column_type)
+
+    @classmethod
+    def decoder[TType](cls, type_value: Optional[TypeEngine[TType]] = None) -> Optional[Callable[[Any], Any]]:
+        """
+        Return the function used to convert the non-NULL values fetched from a column of type 'type_value'. See 'BaseCaster.decoder'.
+
+        When the type is unknown, the caster is chosen from the type of each value, as 'for_value' does.
+        """
+        column_type = cls._resolve_type(type_value)
+        if not column_type:
+
+            def decode(value: Any) -> Any:
+                return cls.cast(value).from_database
+
+            return decode
+
+        return cls._get_caster_class(column_type).decoder(column_type)
+
+    @staticmethod
+    def _resolve_type(type_value: Any) -> Any:
         if len(args := get_args(type_value)) > 1:
             args = [x for x in args if x != NoneType]
 
             type_value = args[0]
 
         if isinstance(type_value, TypeEngine):
-            column_type = type_value.python_type
-        elif not type_value:
-            column_type = type(value)
-        else:
-            column_type = type_value
+            return type_value.python_type
+        return type_value
 
-        caster_class = cls.CASTER_SELECTOR().get(column_type, None)
+    @classmethod
+    def _get_caster_class(cls, column_type: Any) -> Type[BaseCaster]:
+        # COMMENT: 'CASTER_SELECTOR' builds a new dict on each call, so we keep the first one in the namespace of each subclass
+        selector = cls.__dict__.get("_caster_selector", None)
+        if selector is None:
+            selector = cls.CASTER_SELECTOR()
+            cls._caster_selector = selector
+
+        caster_class = selector.get(column_type, None)
         if not caster_class:
             raise ValueError(f"'{column_type}' type has not a Caster class created.")
+        return caster_class
 
-        return caster_class(value, column_type)
+    @classmethod
+    def bindparam(cls, value: Any) -> tuple[str, list[Any]]:
+        """
+        Return the placeholder to render in place of 'value' along with the values that must be bound to it.
+
+        Tuples and lists (i.e. the operand of 'contains') are expanded into one placeholder per item, and None stays inlined as NULL.
+        """
+        if value is None:
+            return cls.cast(value).string_data, []
+
+        if isinstance(value, tuple | list):
+            casters = [cls.cast(x, type(x)) for x in value]
+            wildcards = ", ".join(caster.wildcard_to_where() for caster in casters)
+            return f"({wildcards})", [caster.to_database for caster in casters]
+
+        caster = cls.cast(value, type(value))
+        return caster.wildcard_to_where(), [caster.to_database]
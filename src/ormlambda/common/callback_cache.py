@@ -0,0 +1,370 @@
+from __future__ import annotations
+import builtins
+import datetime
+import dis
+import decimal
+import enum
+import types
+from typing import Any, Callable, Hashable, Iterable, Optional, TYPE_CHECKING
+
+from ormlambda import util
+from ormlambda.common.enums import ConditionType
+
+if TYPE_CHECKING:
+    from ormlambda import Table
+    from ormlambda.sql.types import SelectCol
+
+
+type Resolver = Callable[[type[Table], Callable[..., Any]], list[SelectCol]]
+
+LITERAL_TYPES = (
+    type(None),
+    bool,
+    int,
+    float,
+    str,
+    bytes,
+    decimal.Decimal,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    enum.Enum,
+)
+ITERABLE_LITERAL_TYPES = (tuple, list, set, frozenset)
+
+
+class _TemplateError(Exception):
+    """Raised when the lambda does something with a placeholder other than using it as an operand"""
+
+
+class _Placeholder:
+    """
+    Stands for a literal captured by the lambda while building a template.
+
+    Any operation on it raises, so a template is only built when the lambda passes the value as it is to the comparison operators
+    (x.col == value, x.col.contains(value), x.col.regex(value), ...). In that case the value can be replaced on every call without running the lambda again.
+    """
+
+    __slots__ = ("index",)
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+
+    def __getattr__(self, name: str):
+        raise _TemplateError(name)
+
+    def _raise(self, *args, **kwargs):
+        raise _TemplateError(self.index)
+
+    __bool__ = __eq__ = __ne__ = __lt__ = __le__ = __gt__ = __ge__ = __format__ = __str__ = __call__ = _raise
+    __hash__ = object.__hash__
+
+
+class _RebindableTemplate:
+    __slots__ = ("items",)
+
+    def __init__(self, items: list[SelectCol]) -> None:
+        self.items = items
+
+
+class _ValueTemplate:
+    """The lambda uses its literals in a way we can't rebind, so templates are cached per value"""
+
+    __slots__ = ()
+
+
+VALUE_TEMPLATE = _ValueTemplate()
+
+
+def _is_literal(value: Any) -> bool:
+    if isinstance(value, LITERAL_TYPES):
+        return True
+    if isinstance(value, ITERABLE_LITERAL_TYPES):
+        return all(_is_literal(x) for x in value)
+    return False
+
+
+def _scan_code(code: types.CodeType) -> frozenset[str]:
+    """Return the globals loaded by 'code' and its nested code objects"""
+    names = {instruction.argval for instruction in dis.get_instructions(code) if instruction.opname == "LOAD_GLOBAL"}
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _scan_code(const)
+    return frozenset(names)
+
+
+@util.preload_module(
+    "ormlambda.sql.column",
+    "ormlambda.sql.foreign_key",
+    "ormlambda.sql.table",
+)
+def _is_stable(value: Any) -> bool:
+    """
+    Whether the template may keep what the lambda read from 'value' the first time it ran.
+
+    Models, columns and foreign keys only build clauses, and enum members can't be reassigned. Any other class or module may have
+    its attributes changed between calls (Settings.limit, config.LIMIT, ...) or return something new each time it's called
+    (datetime.datetime.now(), next(counter), ...), so only the ones from ormlambda, which build clauses as well, are accepted.
+    """
+    Column = util.preloaded.sql_column.Column
+    ForeignKey = util.preloaded.sql_foreign_key.ForeignKey
+    Table = util.preloaded.sql_table.Table
+
+    if _is_literal(value) or isinstance(value, Column | ForeignKey | enum.EnumType) or (isinstance(value, type) and issubclass(value, Table)):
+        return True
+
+    if not isinstance(value, type | types.ModuleType):
+        return False
+
+    module = value.__name__ if isinstance(value, types.ModuleType) else value.__module__
+    return module == "ormlambda" or module.startswith("ormlambda.")
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, set | frozenset):
+        return (type(value), frozenset(_freeze(x) for x in value))
+    if isinstance(value, tuple | list):
+        return (type(value), tuple(_freeze(x) for x in value))
+    return (type(value), value)
+
+
+class CallbackCache:
+    """
+    Cache of the columns and comparers returned by `GlobalChecker.resolved_callback_object`.
+
+    Entries are keyed by the code of the lambda, the model, the identity of the non-literal objects it captures (tables, columns, ...)
+    and the value of the module-level literals it reads. The captured literals (closure cells and defaults) are not part of the key:
+    they're rebound into a copy of the template on each call.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 1024) -> None:
+        self._cache: Optional[util.LRUCache] = None
+        self._uncacheable: Optional[util.LRUCache] = None
+        self._scanned: Optional[util.LRUCache] = None
+        self.set_maxsize(maxsize)
+
+    def set_maxsize(self, maxsize: Optional[int]) -> None:
+        if not maxsize:
+            self._cache = self._uncacheable = self._scanned = None
+            return None
+
+        self._cache = util.LRUCache(maxsize)
+        self._uncacheable = util.LRUCache(maxsize)
+        self._scanned = util.LRUCache(maxsize)
+        return None
+
+    def stats(self) -> Optional[util.CacheStats]:
+        return self._cache.stats() if self._cache is not None else None
+
+    def clear(self) -> None:
+        if self._cache is not None:
+            self._cache.clear()
+            self._uncacheable.clear()
+            self._scanned.clear()
+        return None
+
+    def resolve(self, table: type[Table], lambda_func: Callable[..., Any], resolver: Resolver) -> list[SelectCol]:
+        cache = self._cache
+        if cache is None or type(lambda_func) is not types.FunctionType or lambda_func.__kwdefaults__:
+            return resolver(table, lambda_func)
+
+        code = lambda_func.__code__
+        if (code, table) in self._uncacheable:
+            return resolver(table, lambda_func)
+
+        captured = self._get_captured_values(lambda_func)
+        if self._reads_unstable_state(lambda_func, captured):
+            return resolver(table, lambda_func)
+
+        key = self._make_key(table, lambda_func, captured)
+        if key is None:
+            return resolver(table, lambda_func)
+
+        template = cache.get(key)
+        if template is None:
+            template = self._build_template(table, lambda_func, captured, resolver)
+            if template is None:
+                self._uncacheable[(code, table)] = True
+                return resolver(table, lambda_func)
+            cache[key] = template
+
+        if isinstance(template, _RebindableTemplate):
+            return [_clone(x, captured) for x in template.items]
+
+        return self._resolve_by_value(key, table, lambda_func, captured, resolver)
+
+    def _resolve_by_value(self, key: Hashable, table: type[Table], lambda_func: Callable[..., Any], captured: list[Any], resolver: Resolver) -> list[SelectCol]:
+        try:
+            value_key = (key, tuple(_freeze(x) if _is_literal(x) else None for x in captured))
+            hash(value_key)
+        except TypeError:
+            return resolver(table, lambda_func)
+
+        items = self._cache.get(value_key)
+        if items is None:
+            items = resolver(table, lambda_func)
+            if not all(_is_template(x) for x in items):
+                self._uncacheable[(lambda_func.__code__, table)] = True
+                return items
+            self._cache[value_key] = items
+        return [_clone(x) for x in items]
+
+    def _reads_unstable_state(self, lambda_func: types.FunctionType, captured: list[Any]) -> bool:
+        """
+        Whether the lambda reads something that a template would freeze with the value of the first call.
+
+        Only the captured literals are rebound on each call. Whatever the lambda reads from any other global or captured object
+        is evaluated when the template is built, so such lambdas always run again unless '_is_stable' accepts every one of them.
+        """
+        code = lambda_func.__code__
+        names = self._scanned.get(code)
+        if names is None:
+            names = self._scanned[code] = _scan_code(code)
+
+        module_globals = lambda_func.__globals__
+        for name in names:
+            if name in module_globals:
+                value = module_globals[name]
+            elif hasattr(builtins, name):
+                # COMMENT: builtins such as 'next' or 'len' are only read to call them, and 'next' returns something new each time
+                return True
+            else:
+                continue
+            if not _is_stable(value):
+                return True
+
+        # COMMENT: captured literals are part of the key of '_resolve_by_value', so calls over them are fine
+        return not all(_is_stable(value) for value in captured)
+
+    @staticmethod
+    def _get_captured_values(lambda_func: types.FunctionType) -> list[Any]:
+        cells = [cell.cell_contents for cell in lambda_func.__closure__] if lambda_func.__closure__ else []
+        return cells + list(lambda_func.__defaults__ or ())
+
+    @util.preload_module(
+        "ormlambda.sql.column",
+        "ormlambda.sql.foreign_key",
+    )
+    @staticmethod
+    def _make_key(table: type[Table], lambda_func: types.FunctionType, captured: list[Any]) -> Optional[Hashable]:
+        Column = util.preloaded.sql_column.Column
+        ForeignKey = util.preloaded.sql_foreign_key.ForeignKey
+
+        objects = []
+        for value in captured:
+            if _is_literal(value):
+                objects.append(None)
+            # COMMENT: the template holds a reference to the captured objects so their id can't be reused while it lives in the cache
+            elif isinstance(value, type | Column | ForeignKey | types.ModuleType):
+                objects.append((id(value), value))
+            else:
+                # we can't know if the lambda reads mutable state from any other object
+                return None
+
+        code = lambda_func.__code__
+        module_globals = lambda_func.__globals__
+        global_literals = []
+        for name in code.co_names:
+            value = module_globals.get(name, None)
+            if value is not None and _is_literal(value):
+                global_literals.append((name, _freeze(value)))
+
+        try:
+            key = (code, table, tuple(objects), tuple(global_literals))
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    @staticmethod
+    def _build_template(table: type[Table], lambda_func: types.FunctionType, captured: list[Any], resolver: Resolver) -> Optional[_RebindableTemplate | _ValueTemplate]:
+        placeholders = [_Placeholder(i) if _is_literal(value) else value for i, value in enumerate(captured)]
+
+        n_cells = len(lambda_func.__closure__ or ())
+        closure = tuple(types.CellType(x) for x in placeholders[:n_cells]) or None
+        defaults = tuple(placeholders[n_cells:]) or None
+
+        probe = types.FunctionType(lambda_func.__code__, lambda_func.__globals__, lambda_func.__name__, defaults, closure)
+
+        try:
+            items = resolver(table, probe)
+        except Exception:
+            return VALUE_TEMPLATE
+
+        if not all(_is_template(x) for x in items):
+            return VALUE_TEMPLATE
+        return _RebindableTemplate(items)
+
+
+@util.preload_module(
+    "ormlambda.sql.column",
+    "ormlambda.sql.comparer",
+)
+def _is_template(item: Any, operand: bool = False) -> bool:
+    """Check that 'item' only contains nodes that '_clone' knows how to copy and placeholders are only used as operands"""
+    ColumnProxy = util.preloaded.sql_column.ColumnProxy
+    Comparer = util.preloaded.sql_comparer.Comparer
+    ComparerCluster = util.preloaded.sql_comparer.ComparerCluster
+
+    if isinstance(item, _Placeholder):
+        return operand
+
+    if isinstance(item, ColumnProxy):
+        return not isinstance(item.alias, _Placeholder)
+
+    if isinstance(item, Comparer):
+        flags = item._flags if isinstance(item._flags, Iterable) else (item._flags,)
+        if any(isinstance(x, _Placeholder) for x in (item.alias, item.compare, *flags)):
+            return False
+        return _is_template(item.left_condition, True) and _is_template(item.right_condition, True)
+
+    if isinstance(item, ComparerCluster):
+        if isinstance(item.join, _Placeholder):
+            return False
+        return _is_template(item.left_comparer, True) and _is_template(item.right_comparer, True)
+
+    return operand and _is_literal(item)
+
+
+def _copy[T](item: T) -> T:
+    new = object.__new__(type(item))
+    new.__dict__.update(item.__dict__)
+    return new
+
+
+@util.preload_module(
+    "ormlambda.sql.column",
+    "ormlambda.sql.comparer",
+)
+def _clone(item: Any, captured: Optional[list[Any]] = None) -> Any:
+    """Copy the template replacing the placeholders by the values captured in the current call"""
+    ColumnProxy = util.preloaded.sql_column.ColumnProxy
+    Comparer = util.preloaded.sql_comparer.Comparer
+    ComparerCluster = util.preloaded.sql_comparer.ComparerCluster
+
+    if isinstance(item, _Placeholder):
+        return captured[item.index]
+
+    # COMMENT: compiling a query mutates the alias of each ColumnProxy, so every call needs its own instances
+    if isinstance(item, ColumnProxy):
+        return ColumnProxy(item._column, item.path, item.alias)
+
+    if isinstance(item, Comparer):
+        new = _copy(item)
+        new.left_condition = _clone(item.left_condition, captured)
+        new.right_condition = _clone(item.right_condition, captured)
+
+        # COMMENT: keep the same conversion that 'Column.contains' applies when the lambda is executed
+        if isinstance(item.right_condition, _Placeholder) and item.compare == ConditionType.IN.value:
+            value = new.right_condition
+            if not isinstance(value, tuple) and isinstance(value, Iterable):
+                new.right_condition = tuple(value)
+        return new
+
+    if isinstance(item, ComparerCluster):
+        new = _copy(item)
+        new.left_comparer = _clone(item.left_comparer, captured)
+        new.right_comparer = _clone(item.right_comparer, captured)
+        return new
+
+    return item
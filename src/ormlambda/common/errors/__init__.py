@@ -110,3 +110,23 @@ class ColumnError(ValueError):
 
     def __str__(self):
         return f"The column '{self.column.column_name}' does not exist. Check the name you used inside of '{self.clause}' clause."
+
+
+class InvalidCursorError(ValueError):
+    def __init__(self, token: str, reason: str, *args):
+        super().__init__(*args)
+        self.token = token
+        self.reason = reason
+
+    def __str__(self):
+        return f"The pagination cursor '{self.token}' is not valid: {self.reason}. Use the 'next' token of a page returned by 'paginate' with the same 'order_by'"
+
+
+class RelationshipNotLoadedError(RuntimeError):
+    def __init__(self, table: str, name: str, *args):
+        super().__init__(*args)
+        self.table = table
+        self.name = name
+
+    def __str__(self):
+        return f"'{self.name}' of '{self.table}' wasn't loaded. Pass 'load=[{self.table}.{self.name}]' to 'select'"
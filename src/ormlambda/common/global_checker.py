@@ -1,15 +1,17 @@
 from __future__ import annotations
 import re
-from typing import Any, TYPE_CHECKING, Iterable, Callable
+from typing import Any, Optional, TYPE_CHECKING, Iterable, Callable
 
 from ormlambda.common.errors import UnmatchedLambdaParameterError
 from ormlambda.common.errors import NotCallableError
+from ormlambda.common.callback_cache import CallbackCache
 from ormlambda import util
 
 if TYPE_CHECKING:
     from ormlambda.sql.types import SelectCol  # FIXME [ ]: enhance the name
     from ormlambda import TableProxy
     from ormlambda.sql.column import ColumnProxy
+    from ormlambda.util import CacheStats
 
 
 # type LambdaResponse[T] = TableProxy[T] | ColumnProxy[T] | Comparer
@@ -17,13 +19,33 @@ class GlobalChecker[T: TableProxy]:
     FIRST_QUOTE = "`"
     END_QUOTE = "`"
 
+    # COMMENT: the same lambdas are resolved again and again (i.e. inside loops), so we keep the resulting columns and comparers
+    _callback_cache: CallbackCache = CallbackCache(maxsize=1024)
+
     @staticmethod
     def is_lambda_function(obj: Any) -> bool:
         return callable(obj) and not isinstance(obj, type)
 
-    @util.preload_module("ormlambda.sql")
     @classmethod
     def resolved_callback_object(cls, table: T, lambda_func: Callable[[T], Any]) -> tuple[SelectCol, ...]:
+        return cls._callback_cache.resolve(table, lambda_func, cls._resolve_callback)
+
+    @classmethod
+    def set_cache_size(cls, maxsize: Optional[int]) -> None:
+        """Set the number of lambdas kept resolved. Pass 0 or None to disable the cache"""
+        return cls._callback_cache.set_maxsize(maxsize)
+
+    @classmethod
+    def cache_stats(cls) -> Optional[CacheStats]:
+        return cls._callback_cache.stats()
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        return cls._callback_cache.clear()
+
+    @util.preload_module("ormlambda.sql")
+    @classmethod
+    def _resolve_callback(cls, table: T, lambda_func: Callable[[T], Any]) -> tuple[SelectCol, ...]:
         TableProxy = util.preloaded.sql_table.TableProxy
 
         try:
@@ -9,6 +9,7 @@ from ormlambda import BaseRepository
 if TYPE_CHECKING:
     from ormlambda import URL
     from ormlambda.caster.caster import Caster
+    from ormlambda.util import LRUCache
     from ormlambda.repository.interfaces.IRepositoryBase import DBAPIConnection
     from ormlambda.sql.types import DDLCompiler, SQLCompiler, TypeCompiler
 
@@ -60,10 +61,24 @@ class Dialect(abc.ABC):
 
     caster: ClassVar[Type[Caster]]
 
+    compiled_cache: Optional[LRUCache]
+    """Bounded LRU cache of compiled SELECT statements keyed by the structure of the query.
+    Exposes hit, miss and eviction counters through :meth:`.LRUCache.stats`"""
+
+    is_async: ClassVar[bool] = False
+    """True when the DBAPI of the dialect is awaitable, so it must be used through :func:`.create_async_engine`"""
+
     @classmethod
     def get_dialect_cls(cls) -> Type[Dialect]:
         return cls
 
+    @classmethod
+    def get_async_dialect_cls(cls, url: URL) -> Type[Dialect]:
+        """Return the dialect used by :func:`.create_async_engine` when 'url' names this dialect"""
+        if cls.is_async:
+            return cls
+        raise NotImplementedError(f"The '{cls.name}' dialect doesn't provide an asyncio driver")
+
     @classmethod
     @abc.abstractmethod
     def get_pool_class(cls, url: URL) -> Type[BaseRepository]: ...
@@ -1,5 +1,6 @@
 from ormlambda.dialects import Dialect
 from ormlambda.sql import compiler
+from ormlambda import util
 from typing import Optional, Any
 from types import ModuleType
 
@@ -11,16 +12,22 @@ class DefaultDialect(Dialect):
     ddl_compiler = compiler.DDLCompiler
     type_compiler_cls = compiler.GenericTypeCompiler
     default_paramstyle = "named"
+    default_compiled_cache_size = 500
 
     def __init__(
         self,
         dbapi: Optional[ModuleType] = None,  # type: ignore
+        compiled_cache_size: Optional[int] = default_compiled_cache_size,
         **kwargs: Any,
     ):
         self.dbapi = dbapi
 
+        # COMMENT: compiled SQL of select queries keyed by the structure of the QueryBuilder. Set 'compiled_cache_size' to 0 or None to disable it
+        self.compiled_cache: Optional[util.LRUCache] = util.LRUCache(compiled_cache_size) if compiled_cache_size else None
+
         if self.dbapi is not None:
-            self.paramstyle = self.dbapi.paramstyle
+            # COMMENT: asyncio drivers (i.e. 'mysql.connector.aio') don't always expose the PEP 249 module globals
+            self.paramstyle = getattr(self.dbapi, "paramstyle", self.default_paramstyle)
         else:
             self.paramstyle = self.default_paramstyle
         self.positional = self.paramstyle in (
@@ -1,5 +1,6 @@
 from . import base as base
 from . import mysqlconnector as mysqlconnector
+from . import aiomysqlconnector as aiomysqlconnector
 
 from .base import BIGINT as BIGINT
 from .base import BIT as BIT
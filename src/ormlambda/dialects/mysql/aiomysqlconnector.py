@@ -0,0 +1,33 @@
+r"""
+.. dialect:: mysql+aiomysqlconnector
+    :name: MySQL Connector/Python (asyncio)
+    :dbapi: mysql.connector.aio
+    :connectstring: mysql+aiomysqlconnector://<user>:<password>@<host>[:<port>]/<dbname>
+
+Used by :func:`.create_async_engine`, which also picks it for plain ``mysql://`` urls.
+"""
+
+from __future__ import annotations
+from types import ModuleType
+from .mysqlconnector import MySQLDialect_mysqlconnector
+
+
+class MySQLDialect_aiomysqlconnector(MySQLDialect_mysqlconnector):
+    driver = "aiomysqlconnector"
+    is_async = True
+    default_paramstyle = "pyformat"
+
+    @classmethod
+    def import_dbapi(cls) -> ModuleType:
+        from mysql.connector import aio
+
+        return aio
+
+    @classmethod
+    def get_pool_class(cls, url):
+        from .repository.async_repository import AsyncMySQLRepository
+
+        return AsyncMySQLRepository
+
+
+dialect = MySQLDialect_aiomysqlconnector
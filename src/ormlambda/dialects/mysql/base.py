@@ -1,6 +1,6 @@
 from __future__ import annotations
 from types import ModuleType
-from ormlambda import ColumnProxy, ForeignKey, TableProxy, Table, Column
+from ormlambda import ColumnProxy, ForeignKey, TableProxy, Table, Column, OrderType
 from ormlambda.sql import compiler
 from ormlambda.sql.clause_info import ClauseInfo
 from ormlambda.common.errors import NotKeysInIFunctionError
@@ -69,12 +69,14 @@ if TYPE_CHECKING:
         Delete,
         Upsert,
         Update,
+        LoadData,
         Limit,
         Offset,
         Where,
         Having,
         Order,
         GroupBy,
+        Seek,
     )
 
     from ormlambda.sql.functions import (
@@ -123,6 +125,8 @@ class MySQLCompiler(compiler.SQLCompiler):
     def visit_column_proxy(self, column: ColumnProxy, **kw) -> str:
         from ormlambda.sql.clause_info import ClauseInfo
 
+        kw.pop("literal_binds", None)
+
         alias_table = column.get_table_chain()
 
         params = {
@@ -141,27 +145,43 @@ class MySQLCompiler(compiler.SQLCompiler):
         return clause_info.query(self.dialect)
 
     def visit_comparer_cluster(self, cluster: ComparerCluster, **kw) -> str:
-        c1 = cluster.left_comparer.compile(self.dialect, **kw).string
-        c2 = cluster.right_comparer.compile(self.dialect, **kw).string
+        c1 = cluster.left_comparer.compile(self.dialect, **kw)
+        c2 = cluster.right_comparer.compile(self.dialect, **kw)
 
-        return f"{c1} {cluster.join} {c2}"
+        self.params.extend(c1.params)
+        self.params.extend(c2.params)
+        return f"{c1.string} {cluster.join} {c2.string}"
 
-    def visit_comparer(self, comparer: Comparer, **kwargs) -> str:
+    def visit_comparer(self, comparer: Comparer, literal_binds: bool = True, **kwargs) -> str:
+        """
+        By default literals are rendered inline. When 'literal_binds' is False they're replaced by placeholders and their values are added to 'params'
+        """
         from ormlambda.sql.comparer import CleanValue, Comparer
 
-        def compile_condition(condition: Any):
+        def compile_condition(condition: Any, flags=None):
             if isinstance(condition, ColumnProxy | Comparer):
                 param = {
                     "alias_clause": None,
+                    "literal_binds": literal_binds,
                     **kwargs,
                 }
-                return condition.compile(self.dialect, **param).string
-            return MySQLCaster.cast(condition, type(condition)).string_data
+                compiled = condition.compile(self.dialect, **param)
+                self.params.extend(compiled.params)
+                return compiled.string
+
+            if literal_binds:
+                return MySQLCaster.cast(condition, type(condition)).string_data
+
+            wildcard, values = MySQLCaster.bindparam(condition)
+            if flags:
+                values = [CleanValue(x, flags).clean() if isinstance(x, str) else x for x in values]
+            self.params.extend(values)
+            return wildcard
 
         lcond = compile_condition(comparer.left_condition)
-        rcond = compile_condition(comparer.right_condition)
+        rcond = compile_condition(comparer.right_condition, comparer._flags)
 
-        if comparer._flags:
+        if comparer._flags and literal_binds:
             rcond = CleanValue(rcond, comparer._flags).clean()
 
         return f"{lcond} {comparer.compare} {rcond}"
@@ -177,7 +197,9 @@ class MySQLCompiler(compiler.SQLCompiler):
         for i in range(n):
             comp = where.comparers[i]
 
-            string = comp.compile(self.dialect, **kw).string
+            compiled = comp.compile(self.dialect, **kw)
+            self.params.extend(compiled.params)
+            string = compiled.string
 
             condition = f"({string})" if isinstance(comp, ComparerCluster) else string
 
@@ -198,7 +220,9 @@ class MySQLCompiler(compiler.SQLCompiler):
         for i in range(n):
             comp = having.comparers[i]
 
-            string = comp.compile(self.dialect, **kw).string
+            compiled = comp.compile(self.dialect, **kw)
+            self.params.extend(compiled.params)
+            string = compiled.string
 
             condition = f"({string})" if isinstance(comp, ComparerCluster) else string
 
@@ -283,10 +307,7 @@ class MySQLCompiler(compiler.SQLCompiler):
 
             elif issubclass(values.__class__, Table):
                 new_list = []
-                for prop in type(values).__dict__.values():
-                    if not isinstance(prop, Column):
-                        continue
-
+                for prop in type(values).get_columns():
                     value = getattr(values, prop.column_name)
                     if __is_valid(prop, value):
                         new_list.append(prop)
@@ -321,6 +342,7 @@ class MySQLCompiler(compiler.SQLCompiler):
         unknown_rows = f"({', '.join(wildcards)})"  # The number of "%s" must match the dict 'dicc_0' length
 
         insert.cleaned_values = [tuple(x) for x in col_values]
+        insert.row_template = unknown_rows
         query = f"INSERT INTO {self.visit_table(insert.table)} {f'({join_cols})'} VALUES {unknown_rows}"
         return query
 
@@ -331,7 +353,9 @@ class MySQLCompiler(compiler.SQLCompiler):
             # COMMENT: We need to change the Where.restrictive due to if we use more than one where, we want to use "OR" instead "AND"
             for x in range(len(delete.where.restrictive)):
                 delete.where.restrictive[x] = "OR"
-            query += " " + delete.where.compile(self.dialect).string
+            where = delete.where.compile(self.dialect, literal_binds=False)
+            delete.cleaned_values = tuple(where.params)
+            query += " " + where.string
         return query
 
     def visit_upsert(self, upsert: Upsert, **kw) -> str:
@@ -404,6 +428,37 @@ class MySQLCompiler(compiler.SQLCompiler):
 
         return f"{query_insert} ON DUPLICATE KEY UPDATE {update_clause};"
 
+    def visit_load_data(self, load: LoadData, **kw) -> str:
+        """
+        Generate a 'LOAD DATA LOCAL INFILE' statement that reads the file written by 'ormlambda.repository.bulk_load'.
+
+        Columns that need a function to be inserted (i.e. 'ST_GeomFromText' for points) are read into user variables
+        and assigned in the SET clause, so the file always holds plain values.
+        """
+        CASTER = self.dialect.caster()
+        targets: list[str] = []
+        assignments: list[str] = []
+
+        for i, column in enumerate(load.columns):
+            wildcard = CASTER.cast(None, column.dtype).wildcard_to_insert()
+            if wildcard == CASTER.PLACEHOLDER:
+                targets.append(column.column_name)
+                continue
+
+            variable = f"@_{i}"
+            targets.append(variable)
+            assignments.append(f"{column.column_name} = {wildcard.replace(CASTER.PLACEHOLDER, variable)}")
+
+        path = str(load.path).replace("\\", "\\\\").replace("'", "\\'")
+        query = (
+            f"LOAD DATA LOCAL INFILE '{path}' INTO TABLE {self.visit_table(load.table)} CHARACTER SET utf8mb4"
+            " FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n'"
+            f" ({', '.join(targets)})"
+        )
+        if assignments:
+            query += f" SET {', '.join(assignments)}"
+        return query
+
     def visit_update(self, update: Update, **kw) -> str:
         class UpdateKeyError(KeyError):
             def __init__(self, table: Type[Table], key: str | ColumnType, *args):
@@ -446,9 +501,10 @@ class MySQLCompiler(compiler.SQLCompiler):
         query = f"UPDATE {update.table.__table_name__} SET {set_query}"
 
         if update.where.comparers:
-            where_string = update.where.compile(self.dialect).string
+            where = update.where.compile(self.dialect, literal_binds=False)
+            update.cleaned_values.extend(where.params)
 
-            query += " " + where_string
+            query += " " + where.string
         update.cleaned_values = tuple(update.cleaned_values)
         return query
 
@@ -499,6 +555,39 @@ class MySQLCompiler(compiler.SQLCompiler):
 
         return f"{ORDER} {', '.join(string_columns)}"
 
+    def visit_seek(self, seek: Seek, literal_binds: bool = True, **kw) -> str:
+        """
+        Rows placed after 'seek.values'. When every column is sorted in the same direction it's rendered as a row comparison, (a, b) > (1, 2).
+        Otherwise it's expanded into (a > 1 OR (a = 1 AND b < 2)), where each column is compared in its own direction
+        """
+
+        def bind(value: Any) -> str:
+            if literal_binds:
+                return MySQLCaster.cast(value, type(value)).string_data
+
+            wildcard, values = MySQLCaster.bindparam(value)
+            self.params.extend(values)
+            return wildcard
+
+        def compare(order_type: OrderType) -> str:
+            return ">" if order_type == OrderType.ASC else "<"
+
+        columns = [x.compile(self.dialect, alias_clause=None).string for x in seek.columns]
+
+        if len(columns) == 1:
+            return f"{columns[0]} {compare(seek.order_type[0])} {bind(seek.values[0])}"
+
+        if seek.is_uniform:
+            values = ", ".join(bind(x) for x in seek.values)
+            return f"({', '.join(columns)}) {compare(seek.order_type[0])} ({values})"
+
+        conditions: list[str] = []
+        for i, column in enumerate(columns):
+            # COMMENT: the placeholders are bound in the same order they're written, so equal values are rendered again for each condition
+            equals = [f"{columns[j]} = {bind(seek.values[j])}" for j in range(i)]
+            conditions.append(" AND ".join([*equals, f"{column} {compare(seek.order_type[i])} {bind(seek.values[i])}"]))
+        return "(" + " OR ".join(f"({x})" if " AND " in x else x for x in conditions) + ")"
+
     def visit_concat(self, concat: Concat, **kw) -> Concat:
         columns: list[str] = []
 
@@ -911,3 +1000,12 @@ class MySQLDialect(default.DefaultDialect):
     @classmethod
     def get_pool_class(cls, url):
         return MySQLRepository
+
+    @classmethod
+    def get_async_dialect_cls(cls, url):
+        if cls.is_async:
+            return cls
+
+        from .aiomysqlconnector import dialect
+
+        return dialect
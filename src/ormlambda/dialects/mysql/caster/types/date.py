@@ -8,6 +8,11 @@ class DateCaster[TType](BaseCaster[datetime, TType]):
     def __init__(self, value: datetime, type_value: TType):
         super().__init__(value, type_value)
 
+    @classmethod
+    def decoder(cls, type_value: TType) -> None:
+        # COMMENT: the driver already returns date and datetime objects
+        return None
+
     def wildcard_to_select(self, value: Optional[str] = None) -> str:
         return Caster.PLACEHOLDER if value is None else value
 
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Callable, Optional
 from ormlambda.caster import BaseCaster, Caster
 from decimal import Decimal
 
@@ -7,6 +7,10 @@ class DecimalCaster[TType](BaseCaster[Decimal, TType]):
     def __init__(self, value: Decimal, type_value: TType):
         super().__init__(value, type_value)
 
+    @classmethod
+    def decoder(cls, type_value: TType) -> Callable[[Any], Any]:
+        return BaseCaster.converter(Decimal, Decimal)
+
     def wildcard_to_select(self, value: Optional[str] = None) -> str:
         return Caster.PLACEHOLDER if value is None else value
 
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Callable, Optional
 from ormlambda.caster import BaseCaster, Caster
 
 
@@ -6,6 +6,10 @@ class IntegerCaster[TType](BaseCaster[int, TType]):
     def __init__(self, value: int, type_value: TType):
         super().__init__(value, type_value)
 
+    @classmethod
+    def decoder(cls, type_value: TType) -> Callable[[Any], Any]:
+        return BaseCaster.converter(int, int)
+
     def wildcard_to_select(self, value: Optional[str] = None) -> str:
         return Caster.PLACEHOLDER if value is None else value
 
@@ -0,0 +1,294 @@
+from __future__ import annotations
+import contextlib
+import time
+from typing import Any, AsyncGenerator, Iterable, Optional, Sequence, Type, override, TYPE_CHECKING
+
+from ormlambda.engine.async_pool import AsyncConnectionPool
+from ormlambda.repository import IAsyncRepositoryBase
+from ormlambda.repository.response import Response
+from ormlambda.repository.batching import PACKET_USAGE, ChunkProgress, ChunkSizer, MultiRowStatement, ProgressCallback
+from ormlambda.caster import Caster
+from ormlambda.events import Events
+
+if TYPE_CHECKING:
+    from mysql.connector.aio import MySQLConnection
+    from ormlambda import URL as _URL
+    from ormlambda.dialects import Dialect
+    from ormlambda.sql.clauses import Select
+
+
+class AsyncMySQLRepository(IAsyncRepositoryBase):
+    """
+    Asyncio counterpart of 'MySQLRepository'.
+
+    Connections are created with the 'connect' coroutine of the DBAPI module returned by 'Dialect.import_dbapi'
+    ('mysql.connector.aio' by default) and kept in an 'AsyncConnectionPool'.
+    """
+
+    def __init__(
+        self,
+        /,
+        url: Optional[_URL] = None,
+        *,
+        dialect: Optional[Dialect] = None,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        host: Optional[str] = None,
+        database: Optional[str] = None,
+        pool_size: int = 5,
+        pool_timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        pool_size: maximum number of connections opened at the same time.
+        pool_timeout: seconds to wait for a connection when all of them are checked out. None waits forever.
+        """
+        self._dialect = dialect
+        self._url = url
+        self._max_allowed_packet: Optional[int] = None
+        self.events: Events = Events()
+
+        # COMMENT: options that only make sense for the blocking pool of 'mysql.connector'
+        for name in ("pool_name", "pool_reset_session", "prepared_statement_cache_size"):
+            kwargs.pop(name, None)
+
+        config = {
+            "user": user if not url else url.username,
+            "password": password if not url else url.password,
+            "host": host if not url else url.host,
+            "database": database if not url else url.database,
+            **kwargs,
+        }
+        if url is not None and url.port:
+            config.setdefault("port", url.port)
+        config.setdefault("connection_timeout", 60)
+
+        self._pool: AsyncConnectionPool[MySQLConnection] = AsyncConnectionPool(
+            dialect.dbapi.connect,
+            pool_size=int(pool_size),
+            timeout=pool_timeout,
+            **{key: value for key, value in config.items() if value is not None},
+        )
+
+    @property
+    def pool(self) -> AsyncConnectionPool[MySQLConnection]:
+        return self._pool
+
+    @contextlib.asynccontextmanager
+    async def get_connection(self) -> AsyncGenerator[MySQLConnection, None]:
+        async with self._pool.get_connection() as cnx:
+            try:
+                yield cnx
+                await cnx.commit()
+            except Exception as exc:
+                await cnx.rollback()
+                raise exc
+
+    @override
+    async def read_sql[TFlavour: Iterable](
+        self,
+        query: str,
+        flavour: tuple | Type[TFlavour] = tuple,
+        params: Optional[Iterable] = None,
+        **kwargs,
+    ) -> tuple[TFlavour]:
+        select: Select = kwargs.pop("select", None)
+
+        async with self.get_connection() as cnx:
+            async with await cnx.cursor(buffered=True) as cursor:
+                with self.events.executing(query, params) as event:
+                    await cursor.execute(query, params or None)
+                    if event:
+                        event.executed(cursor.rowcount)
+                    values: list[tuple] = await cursor.fetchall()
+                    if event:
+                        event.fetched(len(values))
+                columns: tuple[str] = cursor.column_names
+
+        return Response(
+            dialect=self._dialect,
+            response_values=values,
+            columns=columns,
+            flavour=flavour,
+            select=select,
+            query=query,
+        ).response(**kwargs)
+
+    @override
+    async def stream_sql[TFlavour: Iterable](
+        self,
+        query: str,
+        flavour: tuple | Type[TFlavour] = tuple,
+        params: Optional[Iterable] = None,
+        batch_size: int = 1000,
+        **kwargs,
+    ) -> AsyncGenerator[tuple[TFlavour, ...], None]:
+        """Same as 'MySQLRepository.stream_sql'. The pooled connection is held until the generator is exhausted or closed with 'aclose'"""
+        if batch_size < 1:
+            raise ValueError(f"'batch_size' must be a positive integer. You passed '{batch_size}'")
+
+        select: Select = kwargs.pop("select", None)
+
+        async with self.get_connection() as cnx:
+            cursor = await cnx.cursor(buffered=False)
+            try:
+                with self.events.executing(query, params) as event:
+                    await cursor.execute(query, params or None)
+                    if event:
+                        event.executed(cursor.rowcount)
+                columns: tuple[str] = cursor.column_names
+
+                while values := await cursor.fetchmany(batch_size):
+                    if event:
+                        event.fetched(len(values))
+                    yield Response(
+                        dialect=self._dialect,
+                        response_values=values,
+                        columns=columns,
+                        flavour=flavour,
+                        select=select,
+                        query=query,
+                    ).response(**kwargs)
+            finally:
+                if cnx.unread_result:
+                    await cnx.consume_results()
+                await cursor.close()
+
+    @override
+    async def executemany_with_values(self, query: str, values) -> None:
+        async with self.get_connection() as cnx:
+            async with await cnx.cursor(buffered=True) as cursor:
+                with self.events.executing(query, values, many=True) as event:
+                    await cursor.executemany(query, values)
+                    if event:
+                        event.executed(cursor.rowcount)
+        return None
+
+    @override
+    async def execute_chunks(
+        self,
+        statement: MultiRowStatement,
+        rows: Sequence[Sequence[Any]],
+        *,
+        chunk_size: Optional[int] = None,
+        commit_per_chunk: bool = False,
+        on_chunk: Optional[ProgressCallback] = None,
+    ) -> int:
+        """Same as 'MySQLRepository.execute_chunks'"""
+        affected: int = 0
+        done: int = 0
+        total: int = len(rows)
+
+        async with self.get_connection() as cnx:
+            max_bytes = int(await self._get_max_allowed_packet(cnx) * PACKET_USAGE) - statement.size
+            sizer = ChunkSizer(max_bytes, statement.row_size, chunk_size=chunk_size)
+
+            async with await cnx.cursor(buffered=True) as cursor:
+                for index, chunk in enumerate(sizer.split(rows)):
+                    start = time.perf_counter()
+                    query, params = statement.sql(len(chunk)), [value for row in chunk for value in row]
+                    with self.events.executing(query, params) as event:
+                        await cursor.execute(query, params)
+                        if commit_per_chunk:
+                            await cnx.commit()
+                        if event:
+                            event.executed(cursor.rowcount)
+                    elapsed = time.perf_counter() - start
+
+                    sizer.record(len(chunk), elapsed)
+                    done += len(chunk)
+                    affected += max(cursor.rowcount, 0)
+                    if on_chunk is not None:
+                        on_chunk(ChunkProgress(index, len(chunk), done, total, cursor.rowcount, elapsed))
+        return affected
+
+    async def _get_max_allowed_packet(self, cnx: MySQLConnection) -> int:
+        if self._max_allowed_packet is None:
+            async with await cnx.cursor(buffered=True) as cursor:
+                await cursor.execute("SELECT @@max_allowed_packet")
+                self._max_allowed_packet = int((await cursor.fetchone())[0])
+        return self._max_allowed_packet
+
+    @override
+    async def load_data(self, query: str, *, disable_checks: bool = False) -> int:
+        """Same as 'MySQLRepository.load_data'"""
+        async with self.get_connection() as cnx:
+            async with await cnx.cursor(buffered=True) as cursor:
+                if not disable_checks:
+                    return await self._execute_load_data(cursor, query)
+
+                await cursor.execute("SELECT @@SESSION.unique_checks, @@SESSION.foreign_key_checks")
+                previous = await cursor.fetchone()
+                await cursor.execute("SET SESSION unique_checks = 0, foreign_key_checks = 0")
+                try:
+                    return await self._execute_load_data(cursor, query)
+                finally:
+                    await cursor.execute("SET SESSION unique_checks = %s, foreign_key_checks = %s", tuple(previous))
+
+    async def _execute_load_data(self, cursor, query: str) -> int:
+        with self.events.executing(query) as event:
+            await cursor.execute(query)
+            if event:
+                event.executed(cursor.rowcount)
+        return cursor.rowcount
+
+    @override
+    async def execute_with_values(self, query: str, values) -> None:
+        async with self.get_connection() as cnx:
+            async with await cnx.cursor(buffered=True) as cursor:
+                with self.events.executing(query, values) as event:
+                    await cursor.execute(query, values)
+                    if event:
+                        event.executed(cursor.rowcount)
+        return None
+
+    @override
+    async def execute(self, query: str) -> None:
+        async with self.get_connection() as cnx:
+            async with await cnx.cursor(buffered=True) as cursor:
+                with self.events.executing(query) as event:
+                    await cursor.execute(query)
+                    if event:
+                        event.executed(cursor.rowcount)
+        return None
+
+    @override
+    async def database_exists(self, name: str) -> bool:
+        # COMMENT: the pooled connections can't be used if the database they point to doesn't exist, so we open a new one without it
+        config = {key: value for key, value in self._pool.config.items() if key != "database"}
+        cnx = await self._dialect.dbapi.connect(**config)
+        try:
+            async with await cnx.cursor(buffered=True) as cursor:
+                await cursor.execute(f"SHOW DATABASES LIKE {Caster.PLACEHOLDER};", (name,))
+                res = await cursor.fetchmany(1)
+        finally:
+            await cnx.close()
+        return len(res) > 0
+
+    @override
+    async def table_exists(self, name: str) -> bool:
+        async with self.get_connection() as cnx:
+            async with await cnx.cursor(buffered=True) as cursor:
+                await cursor.execute(f"SHOW TABLES LIKE {Caster.PLACEHOLDER};", (name,))
+                res = await cursor.fetchmany(1)
+        return len(res) > 0
+
+    @property
+    def database(self) -> Optional[str]:
+        return self._pool.config.get("database", None)
+
+    async def set_database(self, name: str) -> None:
+        """Point every new connection to 'name'. Idle connections are closed, and the ones checked out when they're returned"""
+        if not await self.database_exists(name):
+            raise ValueError(f"You cannot set the non-existent '{name}' database.")
+
+        old_pool = self._pool
+        config = {**old_pool.config, "database": name}
+        self._pool = AsyncConnectionPool(self._dialect.dbapi.connect, pool_size=old_pool.pool_size, timeout=old_pool.timeout, **config)
+        await old_pool.close()
+        return None
+
+    @override
+    async def close(self) -> None:
+        await self._pool.close()
+        return None
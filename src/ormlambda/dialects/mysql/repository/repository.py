@@ -1,25 +1,60 @@
 from __future__ import annotations
 import contextlib
 from pathlib import Path
-from typing import Generator, Iterable, Optional, Type, override, TYPE_CHECKING, Unpack
+import time
+from typing import Any, Callable, Generator, Iterable, Literal, Optional, Sequence, Type, override, TYPE_CHECKING, Unpack
 import uuid
+import weakref
 
 # from mysql.connector.pooling import MySQLConnectionPool
 from mysql.connector import MySQLConnection  # noqa: F401
-from mysql.connector.pooling import MySQLConnectionPool  # noqa: F401
+from mysql.connector.pooling import MySQLConnectionPool, PooledMySQLConnection  # noqa: F401
+import mysql.connector
 from ormlambda.repository import BaseRepository
+from ormlambda.engine.pool import QueuePool
 
 # Custom libraries
 from ormlambda.repository.response import Response
+from ormlambda.repository.batching import PACKET_USAGE, ChunkProgress, ChunkSizer, MultiRowStatement, ProgressCallback
 from ormlambda.caster import Caster
+from ormlambda import util
 
 if TYPE_CHECKING:
+    from mysql.connector.cursor import MySQLCursor
     from ormlambda import URL as _URL
     from ormlambda.sql.clauses import Select
     from .pool_types import MySQLArgs
 
 
-class MySQLRepository(BaseRepository[MySQLConnectionPool]):
+type PreparedStatementCache = util.LRUCache[str, tuple[str, MySQLCursor]]
+type PoolClass = Literal["mysql", "queue"] | Type[MySQLConnectionPool] | Type[QueuePool]
+
+
+def _asbool(value: Any) -> bool:
+    # COMMENT: values coming from the url query are strings
+    if isinstance(value, str):
+        return value.strip().lower() in ("true", "yes", "on", "1")
+    return bool(value)
+
+
+def _asfloat(value: Any) -> Optional[float]:
+    if value is None or (isinstance(value, str) and value.strip().lower() == "none"):
+        return None
+    return float(value)
+
+
+# COMMENT: create_engine argument, QueuePool argument and the function that parses it
+QUEUE_POOL_ARGS: tuple[tuple[str, str, Callable[[Any], Any]], ...] = (
+    ("max_overflow", "max_overflow", int),
+    ("pool_timeout", "timeout", _asfloat),
+    ("pool_use_lifo", "use_lifo", _asbool),
+    ("pool_pre_ping", "pre_ping", _asbool),
+    ("pool_recycle", "recycle", float),
+    ("pool_reset_session", "reset_session", _asbool),
+)
+
+
+class MySQLRepository(BaseRepository[MySQLConnectionPool | QueuePool]):
     # def get_connection[**P, TReturn](func: Callable[Concatenate[MySQLRepository, MySQLConnection, P], TReturn]) -> Callable[P, TReturn]:
     #     def wrapper(self: MySQLRepository, *args: P.args, **kwargs: P.kwargs):
     #         with self.get_connection() as cnx:
@@ -42,25 +77,65 @@ class MySQLRepository(BaseRepository[MySQLConnectionPool]):
         password: Optional[str] = None,
         host: Optional[str] = None,
         database: Optional[str] = None,
+        prepared_statement_cache_size: int = 0,
+        pool_class: Optional[PoolClass] = None,
         **kwargs: Unpack[MySQLArgs],
     ):
+        """
+        prepared_statement_cache_size: when greater than 0, statements with bound values are executed through server-side prepared statements.
+            Each pooled connection keeps up to that many of them alive, keyed by SQL text, and closes the least recently used one when it's full.
+        pool_class: 'queue' uses 'QueuePool' instead of 'MySQLConnectionPool', which raises as soon as every connection is in use and never checks them.
+            Besides 'pool_size' and 'pool_reset_session', it accepts 'max_overflow', 'pool_timeout', 'pool_use_lifo', 'pool_pre_ping' and 'pool_recycle'.
+        """
+        pool = self.__get_pool_class(pool_class)
         timeout = self.__add_connection_timeout(kwargs)
         name = self.__add_pool_name(kwargs)
         size = self.__add_pool_size(kwargs)
         attr = kwargs.copy()
         attr["connection_timeout"] = timeout
-        attr["pool_name"] = name
         attr["pool_size"] = size
+        if pool is QueuePool:
+            dialect = attr.get("dialect", None)
+            attr["connect"] = dialect.dbapi.connect if dialect is not None and dialect.dbapi is not None else mysql.connector.connect
+            attr.update(self.__add_queue_pool_args(attr))
+        else:
+            attr["pool_name"] = name
+
+        self._prepared_statement_cache_size: int = int(prepared_statement_cache_size or 0)
+        self._max_allowed_packet: Optional[int] = None
+        self._prepared_statements: weakref.WeakKeyDictionary[MySQLConnection, tuple[int, PreparedStatementCache]] = weakref.WeakKeyDictionary()
+
+        if self._prepared_statement_cache_size:
+            # COMMENT: resetting the session when the connection goes back to the pool deallocates every prepared statement on the server side
+            attr.setdefault("reset_session" if pool is QueuePool else "pool_reset_session", False)
 
         super().__init__(
             user=user if not url else url.username,
             password=password if not url else url.password,
             host=host if not url else url.host,
             database=database if not url else url.database,
-            pool=MySQLConnectionPool,
+            pool=pool,
             **attr,
         )
 
+    @staticmethod
+    def __get_pool_class(pool_class: Optional[PoolClass]) -> Type[MySQLConnectionPool] | Type[QueuePool]:
+        if pool_class is None or pool_class == "mysql":
+            return MySQLConnectionPool
+        if pool_class == "queue":
+            return QueuePool
+        if isinstance(pool_class, type) and issubclass(pool_class, MySQLConnectionPool | QueuePool):
+            return pool_class
+        raise ValueError(f"'pool_class' must be 'mysql' or 'queue'. You passed '{pool_class}'")
+
+    @staticmethod
+    def __add_queue_pool_args(kwargs: MySQLArgs) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        for name, arg, parse in QUEUE_POOL_ARGS:
+            if name in kwargs:
+                args[arg] = parse(kwargs.pop(name))
+        return args
+
     @staticmethod
     def __add_connection_timeout(kwargs: MySQLArgs) -> int:
         if "connection_timeout" not in kwargs.keys():
@@ -82,19 +157,90 @@ class MySQLRepository(BaseRepository[MySQLConnectionPool]):
 
     @contextlib.contextmanager
     def get_connection(self) -> Generator[MySQLConnection, None, None]:
-        with self._pool.get_connection() as cnx:
+        session = self._session.get()
+        if session is not None:
+            # COMMENT: the session commits or rolls back its transaction once, when it ends
+            yield session.connection
+            return None
+
+        with self._pool.get_connection() as pooled:
+            # COMMENT: 'MySQLConnectionPool' wraps the connection while 'QueuePool' returns it as it is
+            cnx = pooled._cnx if isinstance(pooled, PooledMySQLConnection) else pooled
             try:
-                yield cnx._cnx
-                cnx._cnx.commit()
+                yield cnx
+                cnx.commit()
             except Exception as exc:
-                cnx._cnx.rollback()
+                cnx.rollback()
                 raise exc
+            finally:
+                if self._prepared_statement_cache_size and self._pool.reset_session:
+                    self._close_prepared_statements(cnx)
+
+    @property
+    def use_prepared_statements(self) -> bool:
+        return self._prepared_statement_cache_size > 0
+
+    @contextlib.contextmanager
+    def _cursor_for(self, cnx: MySQLConnection, query: str) -> Generator[tuple[MySQLCursor, str], None, None]:
+        """
+        Yield the cursor used to execute 'query' along with the query itself.
+
+        Prepared cursors only skip the PREPARE step when they receive the very same string object they prepared before,
+        so we need to return the cached one instead of the argument.
+        """
+        if not self.use_prepared_statements:
+            with cnx.cursor(buffered=True) as cursor:
+                yield cursor, query
+            return None
+
+        cache = self._get_prepared_statements(cnx)
+        cached = cache.get(query)
+        if cached is None:
+            cached = (query, cnx.cursor(prepared=True))
+            cache[query] = cached
+
+        operation, cursor = cached
+        try:
+            yield cursor, operation
+        except Exception:
+            cache.pop(query)
+            self._close_cursor(query, cached)
+            raise
+
+    def _get_prepared_statements(self, cnx: MySQLConnection) -> PreparedStatementCache:
+        connection_id = cnx.connection_id
+        cached = self._prepared_statements.get(cnx, None)
+
+        # COMMENT: if the pool reconnected this connection, the server no longer knows any of its statements
+        if cached is None or cached[0] != connection_id:
+            cached = (connection_id, util.LRUCache(self._prepared_statement_cache_size, on_evict=self._close_cursor))
+            self._prepared_statements[cnx] = cached
+        return cached[1]
+
+    def _close_prepared_statements(self, cnx: MySQLConnection) -> None:
+        cached = self._prepared_statements.pop(cnx, None)
+        if cached is None:
+            return None
+
+        for query, statement in cached[1].items():
+            self._close_cursor(query, statement)
+        return None
+
+    @staticmethod
+    def _close_cursor(query: str, statement: tuple[str, MySQLCursor]) -> None:
+        try:
+            statement[1].close()
+        except Exception:
+            # COMMENT: the statement is already gone if the connection was lost
+            pass
+        return None
 
     @override
     def read_sql[TFlavour: Iterable](
         self,
         query: str,
         flavour: tuple | Type[TFlavour] = tuple,
+        params: Optional[Iterable] = None,
         **kwargs,
     ) -> tuple[TFlavour]:
         """
@@ -104,14 +250,22 @@ class MySQLRepository(BaseRepository[MySQLConnectionPool]):
         -
             - query:str: string of request to the server
             - flavour: Type[TFlavour]: Useful to return tuple of any Iterable type as dict,set,list...
+            - params: Iterable: values bound to the placeholders of the query
         """
 
         select: Select = kwargs.pop("select", None)
+        # COMMENT: a single pool is the primary itself. See 'RoutingRepository'
+        kwargs.pop("use_primary", None)
+        self._autoflush()
 
         with self.get_connection() as cnx:
-            with cnx.cursor(buffered=True) as cursor:
-                cursor.execute(query)
+            with self._cursor_for(cnx, query) as (cursor, operation), self.events.executing(query, params) as event:
+                cursor.execute(operation, params or None)
+                if event:
+                    event.executed(cursor.rowcount)
                 values: list[tuple] = cursor.fetchall()
+                if event:
+                    event.fetched(len(values))
                 columns: tuple[str] = cursor.column_names
                 return Response(
                     dialect=self._dialect,
@@ -119,8 +273,57 @@ class MySQLRepository(BaseRepository[MySQLConnectionPool]):
                     columns=columns,
                     flavour=flavour,
                     select=select,
+                    query=query,
                 ).response(**kwargs)
 
+    @override
+    def stream_sql[TFlavour: Iterable](
+        self,
+        query: str,
+        flavour: tuple | Type[TFlavour] = tuple,
+        params: Optional[Iterable] = None,
+        batch_size: int = 1000,
+        **kwargs,
+    ) -> Generator[tuple[TFlavour, ...], None, None]:
+        """
+        Same as 'read_sql' but it yields the response in chunks of 'batch_size' rows read from an unbuffered cursor.
+
+        The pooled connection is held until the generator is exhausted or closed.
+        """
+        if batch_size < 1:
+            raise ValueError(f"'batch_size' must be a positive integer. You passed '{batch_size}'")
+
+        select: Select = kwargs.pop("select", None)
+        kwargs.pop("use_primary", None)
+        self._autoflush()
+
+        with self.get_connection() as cnx:
+            cursor: MySQLCursor = cnx.cursor(buffered=False)
+            try:
+                with self.events.executing(query, params) as event:
+                    cursor.execute(query, params or None)
+                    if event:
+                        event.executed(cursor.rowcount)
+                columns: tuple[str] = cursor.column_names
+
+                while values := cursor.fetchmany(batch_size):
+                    if event:
+                        # COMMENT: dispatched once per batch, with the rows of that batch
+                        event.fetched(len(values))
+                    yield Response(
+                        dialect=self._dialect,
+                        response_values=values,
+                        columns=columns,
+                        flavour=flavour,
+                        select=select,
+                        query=query,
+                    ).response(**kwargs)
+            finally:
+                # COMMENT: the connection refuses new queries (and the cursor can't be closed) until the remaining rows are read, which happens when the generator is closed before the end
+                if cnx.unread_result:
+                    cnx.consume_results()
+                cursor.close()
+
     # FIXME [ ]: this method does not comply with the implemented interface
     def create_tables_code_first(self, path: str | Path) -> None:
         return
@@ -147,27 +350,159 @@ class MySQLRepository(BaseRepository[MySQLConnectionPool]):
 
     @override
     def executemany_with_values(self, query: str, values) -> None:
+        if (session := self._deferring()) is not None:
+            return session.queue_executemany(query, values)
+
         with self.get_connection() as cnx:
-            with cnx.cursor(buffered=True) as cursor:
+            with cnx.cursor(buffered=True) as cursor, self.events.executing(query, values, many=True) as event:
                 cursor.executemany(query, values)
+                if event:
+                    event.executed(cursor.rowcount)
         return None
 
     @override
-    def execute_with_values(self, query: str, values) -> None:
+    def execute_chunks(
+        self,
+        statement: MultiRowStatement,
+        rows: Sequence[Sequence[Any]],
+        *,
+        chunk_size: Optional[int] = None,
+        commit_per_chunk: bool = False,
+        on_chunk: Optional[ProgressCallback] = None,
+    ) -> int:
+        """
+        Execute 'statement' once per chunk of 'rows', repeating its group of placeholders as many times as rows has the chunk.
+
+        Chunks are sized so that the statement fits in the 'max_allowed_packet' of the server. If 'chunk_size' is None,
+        the number of rows per chunk adapts to the measured latency, otherwise it is used as the maximum number of rows.
+
+        ATTRIBUTE
+        -
+            - commit_per_chunk: bool: commit after each chunk instead of once at the end. Chunks already committed remain if a later one fails
+            - on_chunk: Callable[[ChunkProgress], Any]: called after each chunk is executed
+
+        Inside a session opened with 'defer=True', the rows are queued until it's flushed unless 'on_chunk' is set.
+        'commit_per_chunk' can't be used inside a session, since committing its connection would also commit every write done
+        before in the session, which could no longer be rolled back.
+
+        RETURN
+        -
+            the sum of the rows affected by each chunk
+        """
+        if commit_per_chunk and self._session.get() is not None:
+            raise ValueError("'commit_per_chunk' can't be used inside a session, which commits or rolls back all its writes once when it ends")
+
+        session = self._deferring()
+        if session is not None and on_chunk is None:
+            # COMMENT: deferred rows are sent along with the rest of their statement when the session is flushed, so nothing has been affected yet
+            session.queue_chunks(statement, rows, chunk_size)
+            return 0
+        self._autoflush()
+
+        affected: int = 0
+        done: int = 0
+        total: int = len(rows)
+
         with self.get_connection() as cnx:
+            max_bytes = int(self._get_max_allowed_packet(cnx) * PACKET_USAGE) - statement.size
+            sizer = ChunkSizer(max_bytes, statement.row_size, chunk_size=chunk_size)
+
             with cnx.cursor(buffered=True) as cursor:
-                cursor.execute(query, values)
+                for index, chunk in enumerate(sizer.split(rows)):
+                    start = time.perf_counter()
+                    query, params = statement.sql(len(chunk)), [value for row in chunk for value in row]
+                    with self.events.executing(query, params) as event:
+                        cursor.execute(query, params)
+                        if commit_per_chunk:
+                            cnx.commit()
+                        if event:
+                            event.executed(cursor.rowcount)
+                    elapsed = time.perf_counter() - start
+
+                    sizer.record(len(chunk), elapsed)
+                    done += len(chunk)
+                    affected += max(cursor.rowcount, 0)
+                    if on_chunk is not None:
+                        on_chunk(ChunkProgress(index, len(chunk), done, total, cursor.rowcount, elapsed))
+        return affected
+
+    def _get_max_allowed_packet(self, cnx: MySQLConnection) -> int:
+        # COMMENT: it's a global variable, so we only ask the server once per repository
+        if self._max_allowed_packet is None:
+            with cnx.cursor(buffered=True) as cursor:
+                cursor.execute("SELECT @@max_allowed_packet")
+                self._max_allowed_packet = int(cursor.fetchone()[0])
+        return self._max_allowed_packet
+
+    @override
+    def load_data(self, query: str, *, disable_checks: bool = False) -> int:
+        """
+        Execute a 'LOAD DATA LOCAL INFILE' statement and return the number of rows loaded.
+
+        The connection must be created with 'allow_local_infile=True'.
+
+        ATTRIBUTE
+        -
+            - disable_checks: bool: turn off 'unique_checks' and 'foreign_key_checks' in the session while the file is loaded,
+            restoring the previous values afterwards. The server doesn't validate the loaded rows against them later on.
+        """
+        self._autoflush()
+        with self.get_connection() as cnx:
+            with cnx.cursor(buffered=True) as cursor:
+                if not disable_checks:
+                    return self._execute_load_data(cursor, query)
+
+                # COMMENT: pooled connections may not reset the session, so we restore the values we found instead of assuming the defaults
+                cursor.execute("SELECT @@SESSION.unique_checks, @@SESSION.foreign_key_checks")
+                previous = cursor.fetchone()
+                cursor.execute("SET SESSION unique_checks = 0, foreign_key_checks = 0")
+                try:
+                    return self._execute_load_data(cursor, query)
+                finally:
+                    cursor.execute("SET SESSION unique_checks = %s, foreign_key_checks = %s", tuple(previous))
+
+    def _execute_load_data(self, cursor: MySQLCursor, query: str) -> int:
+        with self.events.executing(query) as event:
+            cursor.execute(query)
+            if event:
+                event.executed(cursor.rowcount)
+        return cursor.rowcount
+
+    @override
+    def execute_with_values(self, query: str, values) -> None:
+        if (session := self._deferring()) is not None:
+            return session.queue_execute(query, values)
+
+        with self.get_connection() as cnx:
+            with self._cursor_for(cnx, query) as (cursor, operation), self.events.executing(query, values) as event:
+                cursor.execute(operation, values)
+                if event:
+                    event.executed(cursor.rowcount)
         return None
 
     @override
     def execute(self, query: str) -> None:
+        self._autoflush()
         with self.get_connection() as cnx:
-            with cnx.cursor(buffered=True) as cursor:
+            with cnx.cursor(buffered=True) as cursor, self.events.executing(query) as event:
                 cursor.execute(query)
+                if event:
+                    event.executed(cursor.rowcount)
         return None
 
     @override
     def database_exists(self, name: str) -> bool:
+        if isinstance(self._pool, QueuePool):
+            # COMMENT: changing the config of a 'QueuePool' replaces every connection, so we open a new one without database instead
+            cnx = self._pool.connect(database=None)
+            try:
+                with cnx.cursor(buffered=True) as cursor:
+                    cursor.execute(f"SHOW DATABASES LIKE {Caster.PLACEHOLDER};", (name,))
+                    res = cursor.fetchmany(1)
+            finally:
+                cnx.close()
+            return len(res) > 0
+
         temp_config = self._pool._cnx_config
 
         config_without_db = temp_config.copy()
@@ -194,6 +529,8 @@ class MySQLRepository(BaseRepository[MySQLConnectionPool]):
 
     @property
     def database(self) -> Optional[str]:
+        if isinstance(self._pool, QueuePool):
+            return self._pool.config.get("database", None)
         return self._pool._cnx_config.get("database", None)
 
     @database.setter
@@ -203,6 +540,11 @@ class MySQLRepository(BaseRepository[MySQLConnectionPool]):
         if not self.database_exists(value):
             raise ValueError(f"You cannot set the non-existent '{value}' database.")
 
+        if isinstance(self._pool, QueuePool):
+            self._pool.set_config(**{**self._pool.config, "database": value})
+            self._pool.dispose()
+            return None
+
         old_config: MySQLArgs = self._pool._cnx_config.copy()
         old_config["database"] = value
 
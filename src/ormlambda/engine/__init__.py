@@ -1,3 +1,6 @@
 from .create import create_engine  # noqa: F401
+from .create import create_async_engine  # noqa: F401
 from .url import URL, make_url  # noqa: F401
 from .base import Engine  # noqa: F401
+from .base import AsyncEngine  # noqa: F401
+from .pool import QueuePool, PoolStats, PoolTimeoutError  # noqa: F401
@@ -0,0 +1,127 @@
+from __future__ import annotations
+import asyncio
+import contextlib
+from typing import Any, AsyncGenerator, Awaitable, Callable, Optional
+
+
+class AsyncConnectionPool[TCnx]:
+    """
+    Pool of connections created by an awaitable 'connect' function, usually the 'connect' of an asyncio DBAPI module.
+
+    Connections are opened on demand up to 'pool_size'. When all of them are checked out, 'get_connection' waits
+    until one is returned (at most 'timeout' seconds when it's not None) instead of failing like 'mysql.connector.aio' pool does.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[..., Awaitable[TCnx]],
+        pool_size: int = 5,
+        timeout: Optional[float] = None,
+        **config: Any,
+    ) -> None:
+        if pool_size < 1:
+            raise ValueError(f"'pool_size' must be a positive integer. You passed '{pool_size}'")
+
+        self._connect = connect
+        self._config: dict[str, Any] = config
+        self.pool_size: int = pool_size
+        self.timeout: Optional[float] = timeout
+
+        self._idle: list[TCnx] = []
+        self._opened: int = 0
+        self._available: Optional[asyncio.Semaphore] = None
+        self._closed: bool = False
+
+    def __repr__(self) -> str:
+        return f"{AsyncConnectionPool.__name__}(size={self.pool_size}, opened={self._opened}, idle={len(self._idle)})"
+
+    @property
+    def config(self) -> dict[str, Any]:
+        return self._config
+
+    @property
+    def checkedout(self) -> int:
+        return self._opened - len(self._idle)
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # COMMENT: created lazily so the pool can be built outside of the event loop that uses it
+        if self._available is None:
+            self._available = asyncio.Semaphore(self.pool_size)
+        return self._available
+
+    async def acquire(self) -> TCnx:
+        if self._closed:
+            raise RuntimeError(f"'{AsyncConnectionPool.__name__}' is closed")
+
+        semaphore = self._semaphore()
+        if self.timeout is None:
+            await semaphore.acquire()
+        else:
+            await asyncio.wait_for(semaphore.acquire(), self.timeout)
+
+        try:
+            if self._idle:
+                return self._idle.pop()
+
+            cnx = await self._connect(**self._config)
+            self._opened += 1
+            return cnx
+        except BaseException:
+            semaphore.release()
+            raise
+
+    async def release(self, cnx: TCnx, discard: bool = False) -> None:
+        try:
+            if discard or self._closed:
+                self._opened -= 1
+                await self._close(cnx)
+            else:
+                self._idle.append(cnx)
+        finally:
+            self._semaphore().release()
+
+    @contextlib.asynccontextmanager
+    async def get_connection(self) -> AsyncGenerator[TCnx, None]:
+        cnx = await self.acquire()
+        discard = False
+        try:
+            yield cnx
+        except asyncio.CancelledError:
+            # COMMENT: a cancelled task may leave the connection in the middle of a response, so it can't be reused
+            discard = True
+            raise
+        except BaseException:
+            discard = not await self._is_usable(cnx)
+            raise
+        finally:
+            await self.release(cnx, discard)
+
+    async def close(self) -> int:
+        """Close the idle connections. The ones checked out are closed when they're returned"""
+        self._closed = True
+        closed = 0
+        while self._idle:
+            cnx = self._idle.pop()
+            self._opened -= 1
+            await self._close(cnx)
+            closed += 1
+        return closed
+
+    @staticmethod
+    async def _is_usable(cnx: TCnx) -> bool:
+        is_connected = getattr(cnx, "is_connected", None)
+        if is_connected is None:
+            return True
+        try:
+            return bool(await is_connected())
+        except Exception:
+            return False
+
+    @staticmethod
+    async def _close(cnx: TCnx) -> None:
+        try:
+            await cnx.close()
+        except Exception:
+            # COMMENT: the connection is already gone if the server closed it
+            pass
+        return None
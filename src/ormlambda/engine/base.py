@@ -1,12 +1,20 @@
 from __future__ import annotations
+import contextlib
 from pathlib import Path
-from typing import TYPE_CHECKING, BinaryIO, Literal, Optional, TextIO
+from typing import TYPE_CHECKING, BinaryIO, ContextManager, Literal, Optional, TextIO, Unpack
 from ormlambda.engine import url
 from ormlambda.sql.ddl import CreateSchema, DropSchema, CreateBackup
 from ormlambda import BaseRepository
+from ormlambda.repository import RoutingRepository
 
 if TYPE_CHECKING:
     from ormlambda.dialects import Dialect
+    from ormlambda.repository import IAsyncRepositoryBase
+    from ormlambda.events import Events
+    from ormlambda.repository.session import Session
+    from ormlambda.repository.identity_map import IdentityMap
+    from .slow_query import SlowQueryArgs, SlowQueryLog
+    from .result_cache import CacheBackend, ResultCache
 
 type TypeExists = Literal["fail", "replace", "append"]
 
@@ -16,10 +24,67 @@ class Engine:
         self.repository = repository
         self.dialect = dialect
         self.url = url
+        self.result_cache: Optional[ResultCache] = None
 
     def __repr__(self):
         return f"{Engine.__name__}: {self.url}"
 
+    @property
+    def events(self) -> Events:
+        """Listeners called when the statements of this engine are compiled, executed, fetched and hydrated"""
+        return self.repository.events
+
+    def session(self, defer: bool = False, identity_map: bool = False) -> ContextManager[Session]:
+        """
+        Run every statement inside the block on one pooled connection and one transaction, committed when the block ends.
+        With 'defer=True' the writes are queued and flushed in order, merging consecutive writes of the same statement. See 'Session'.
+        With 'identity_map=True' an identity map is open for as long as the session. See 'identity_map'
+        """
+        return self.repository.session(defer, identity_map)
+
+    def identity_map(self) -> ContextManager[IdentityMap]:
+        """
+        Until the block ends, selects return the instance already loaded for a primary key instead of building a new one,
+        and 'get' returns it without querying the database. See 'IdentityMap'
+        """
+        return self.repository.identity_map()
+
+    def use_primary(self) -> ContextManager[None]:
+        """Run the reads inside the block on the primary when the engine was created with 'replicas'"""
+        if isinstance(self.repository, RoutingRepository):
+            return self.repository.use_primary()
+        return contextlib.nullcontext()
+
+    def cache_results(
+        self,
+        ttl: Optional[float] = 60.0,
+        maxsize: int = 1024,
+        *,
+        path: Optional[str | Path] = None,
+        backend: Optional[CacheBackend] = None,
+        namespace: Optional[str] = None,
+    ) -> ResultCache:
+        """
+        Cache the results of the selects of this engine for 'ttl' seconds, up to 'maxsize' entries, until a write through 'Statements'
+        touches one of the tables they read. They're kept in memory unless 'path' points to a local on-disk store or another 'backend' is passed.
+        Engines connected to different servers that share the store must pass a different 'namespace' each. See 'ResultCache'
+        """
+        from .result_cache import DiskBackend, MemoryBackend, ResultCache
+
+        if backend is None:
+            backend = MemoryBackend(maxsize) if path is None else DiskBackend(path, maxsize)
+
+        if self.result_cache is not None:
+            self.result_cache.close()
+        self.result_cache = ResultCache(backend, ttl=ttl, namespace=namespace)
+        return self.result_cache
+
+    def log_slow_queries(self, threshold: float = 1.0, **kwargs: Unpack[SlowQueryArgs]) -> SlowQueryLog:
+        """Start recording the statements slower than 'threshold' seconds. Call 'close' on the returned object to stop"""
+        from .slow_query import SlowQueryLog
+
+        return SlowQueryLog(self, threshold, **kwargs)
+
     def create_schema(self, schema_name: str, if_exists: TypeExists = "fail") -> None:
         if if_exists == "replace":
             self.drop_schema(schema_name, if_exists)
@@ -91,3 +156,65 @@ class Engine:
     @property
     def name(self) -> str:
         return self.dialect.name
+
+
+class AsyncEngine:
+    """
+    Engine returned by 'create_async_engine'. It compiles with the same dialect as 'Engine', but its repository is awaitable.
+
+    Call 'dispose' before the event loop is closed to release the pooled connections.
+    """
+
+    def __init__(self, repository: IAsyncRepositoryBase, dialect: Dialect, url: url.URL):
+        self.repository = repository
+        self.dialect = dialect
+        self.url = url
+
+    def __repr__(self):
+        return f"{AsyncEngine.__name__}: {self.url}"
+
+    @property
+    def events(self) -> Events:
+        return self.repository.events
+
+    async def __aenter__(self) -> AsyncEngine:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.dispose()
+
+    async def create_schema(self, schema_name: str, if_exists: TypeExists = "fail") -> None:
+        if if_exists == "replace":
+            await self.drop_schema(schema_name, if_exists)
+
+        sql = CreateSchema(schema=schema_name, if_not_exists=if_exists == "append").compile(self.dialect).string
+        try:
+            await self.repository.execute(sql)
+        except Exception:
+            if if_exists == "fail":
+                raise
+
+    async def drop_schema(self, schema_name: str, if_exists: bool = False) -> None:
+        sql = DropSchema(schema=schema_name, if_exists=if_exists).compile(self.dialect).string
+        return await self.repository.execute(sql)
+
+    async def schema_exists(self, schema: str) -> bool:
+        return await self.repository.database_exists(schema)
+
+    async def set_database(self, name: str) -> None:
+        return await self.repository.set_database(name)
+
+    async def dispose(self) -> None:
+        return await self.repository.close()
+
+    @property
+    def engine(self) -> AsyncEngine:
+        return self
+
+    @property
+    def driver(self) -> str:
+        return self.dialect.driver
+
+    @property
+    def name(self) -> str:
+        return self.dialect.name
@@ -1,21 +1,91 @@
 from __future__ import annotations
-from typing import Any
+from typing import Any, Optional, Sequence, Type, TYPE_CHECKING
 
 from ormlambda.engine.url import URL, make_url
+from ormlambda.repository import RoutingRepository
 
 from . import base
 
+if TYPE_CHECKING:
+    from ormlambda.dialects import Dialect
+    from ormlambda.repository.routing import ReplicaSelector
 
-def create_engine(url: URL | str, **kwargs: Any) -> base.Engine:
+
+def create_engine(
+    url: URL | str,
+    *,
+    replicas: Optional[Sequence[URL | str]] = None,
+    replica_selector: ReplicaSelector = "round_robin",
+    read_your_writes: float = 0.0,
+    replica_eject_for: float = 30.0,
+    **kwargs: Any,
+) -> base.Engine:
+    """
+    replicas: urls of read replicas of 'url'. The engine runs select, select_one, count, max, min, sum, stream and paginate on them
+        and everything else on the primary. Each replica gets its own pool, created with the same arguments as the primary.
+    replica_selector: 'round_robin' or 'least_in_flight', which picks the replica with fewer queries running.
+    read_your_writes: seconds after a write during which the reads of the same thread or asyncio task go to the primary.
+    replica_eject_for: seconds that a replica that couldn't be reached is left out.
+
+    See 'RoutingRepository'.
+    """
     # create url.URL object
     u = make_url(url)
-    url, kwargs = u._instantiate_plugins(kwargs)
+    url, options = u._instantiate_plugins(kwargs)
 
     entrypoint = u._get_entrypoint()
     dialect_cls = entrypoint.get_dialect_cls()
 
+    dialect, repository = _create_repository(u, dialect_cls, options)
+
+    if replicas:
+        primary = repository
+        replica_repositories = []
+        for replica in replicas:
+            ru = make_url(replica)
+            if ru.get_backend_name() != u.get_backend_name():
+                raise ValueError(f"Replicas must use the same backend as the primary '{u.get_backend_name()}'. You passed '{ru.get_backend_name()}'")
+
+            # COMMENT: the dialect is shared, so every replica reuses the statements compiled for the primary
+            _, replica_options = ru._instantiate_plugins(kwargs)
+            replica_options.pop("compiled_cache_size", None)
+            replica_repositories.append(dialect.get_dialect_pool_class(ru)(ru, dialect=dialect, **replica_options))
+
+        repository = RoutingRepository(
+            primary,
+            replica_repositories,
+            dialect=dialect,
+            selector=replica_selector,
+            read_your_writes=read_your_writes,
+            eject_for=replica_eject_for,
+        )
+    return base.Engine(repository, dialect, u)
+
+
+def create_async_engine(url: URL | str, **kwargs: Any) -> base.AsyncEngine:
+    """
+    Same as 'create_engine' but the engine runs its queries through an asyncio driver.
+
+    The dialect named by the url provides its asyncio counterpart in 'Dialect.get_async_dialect_cls' (i.e. 'mysql://' uses 'mysql+aiomysqlconnector').
+    Its 'import_dbapi' and 'get_pool_class' hooks return the awaitable driver module and the repository that uses it.
+    """
+    u = make_url(url)
+    url, kwargs = u._instantiate_plugins(kwargs)
+
+    entrypoint = u._get_entrypoint()
+    dialect_cls = entrypoint.get_dialect_cls().get_async_dialect_cls(u)
+
+    dialect, repository = _create_repository(u, dialect_cls, kwargs)
+    return base.AsyncEngine(repository, dialect, u)
+
+
+def _create_repository(u: URL, dialect_cls: Type[Dialect], kwargs: dict[str, Any]):
     dialect_args = {}
     dialect_args["dbapi"] = dialect_cls.import_dbapi()
+    if "compiled_cache_size" in kwargs:
+        # COMMENT: values coming from the url query are strings
+        cache_size = kwargs.pop("compiled_cache_size")
+        dialect_args["compiled_cache_size"] = int(cache_size) if cache_size is not None else None
 
     dialect = dialect_cls(**dialect_args)
 
@@ -23,4 +93,4 @@ def create_engine(url: URL | str, **kwargs: Any) -> base.Engine:
 
     repository_args = {"dialect": dialect, **kwargs}
     repository = repositoryclass(u, **repository_args)
-    return base.Engine(repository, dialect, u)
+    return dialect, repository
@@ -0,0 +1,271 @@
+from __future__ import annotations
+import collections
+import contextlib
+import threading
+import time
+from typing import Any, Callable, Generator, NamedTuple, Optional
+
+
+class PoolTimeoutError(TimeoutError):
+    def __init__(self, pool: QueuePool, timeout: float, *args: object) -> None:
+        super().__init__(*args)
+        self.pool = pool
+        self.timeout = timeout
+
+    def __str__(self) -> str:
+        return f"No connection was returned to the pool in {self.timeout} seconds ({self.pool.pool_size} connections and {self.pool.max_overflow} overflow in use)"
+
+
+class PoolStats(NamedTuple):
+    size: int
+    checkedin: int
+    checkedout: int
+    overflow: int
+    waiters: int
+    checkouts: int
+    timeouts: int
+    recycled: int
+    invalidated: int
+    checkout_time: float
+    max_checkout_time: float
+
+    @property
+    def avg_checkout_time(self) -> float:
+        return self.checkout_time / self.checkouts if self.checkouts else 0.0
+
+
+class _ConnectionRecord[TCnx]:
+    __slots__ = ("connection", "created", "version")
+
+    def __init__(self, connection: TCnx, version: int) -> None:
+        self.connection = connection
+        self.created: float = time.monotonic()
+        self.version = version
+
+
+class QueuePool[TCnx]:
+    """
+    Thread-safe pool of connections created by 'connect(**config)'.
+
+    - pool_size: connections kept open once they've been created.
+    - max_overflow: extra connections opened when the pool is exhausted. They're closed as soon as they're returned. -1 means no limit.
+    - timeout: seconds that 'get_connection' waits for a connection when 'pool_size' + 'max_overflow' are in use. None waits forever.
+    - use_lifo: reuse the most recently returned connection first, so the rest can be closed by the server when they're idle for too long.
+        By default they're reused in FIFO order.
+    - pre_ping: check that the connection is alive with 'is_connected' on checkout and replace it otherwise.
+    - recycle: seconds after which a connection is replaced on checkout. -1 keeps them forever.
+    - reset_session: call 'reset_session' on every connection returned to the pool.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[..., TCnx],
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        timeout: Optional[float] = 30.0,
+        use_lifo: bool = False,
+        pre_ping: bool = False,
+        recycle: float = -1,
+        reset_session: bool = True,
+        **config: Any,
+    ) -> None:
+        if pool_size < 1:
+            raise ValueError(f"'pool_size' must be a positive integer. You passed '{pool_size}'")
+
+        self._connect = connect
+        self._config: dict[str, Any] = config
+        self._version: int = 0
+
+        self.pool_size: int = pool_size
+        self.max_overflow: int = max_overflow
+        self.timeout: Optional[float] = timeout
+        self.use_lifo: bool = use_lifo
+        self.pre_ping: bool = pre_ping
+        self.recycle: float = recycle
+        self.reset_session: bool = reset_session
+
+        self._idle: collections.deque[_ConnectionRecord[TCnx]] = collections.deque()
+        self._opened: int = 0
+        self._waiters: int = 0
+        self._lock = threading.Condition(threading.Lock())
+        self._closed: bool = False
+
+        self._checkouts: int = 0
+        self._timeouts: int = 0
+        self._recycled: int = 0
+        self._invalidated: int = 0
+        self._checkout_time: float = 0.0
+        self._max_checkout_time: float = 0.0
+
+    def __repr__(self) -> str:
+        return f"{QueuePool.__name__}(size={self.pool_size}, max_overflow={self.max_overflow}, opened={self._opened}, idle={len(self._idle)})"
+
+    @property
+    def config(self) -> dict[str, Any]:
+        return self._config
+
+    def set_config(self, **config: Any) -> None:
+        """Replace the connection arguments. Connections opened with the previous ones are replaced the next time they're checked out"""
+        with self._lock:
+            self._config = config
+            self._version += 1
+        return None
+
+    def connect(self, **config: Any) -> TCnx:
+        """Open a connection that doesn't belong to the pool, with 'config' replacing the pool arguments"""
+        return self._connect(**{**self._config, **config})
+
+    @property
+    def max_size(self) -> Optional[int]:
+        return None if self.max_overflow < 0 else self.pool_size + self.max_overflow
+
+    @property
+    def checkedout(self) -> int:
+        return self._opened - len(self._idle)
+
+    def stats(self) -> PoolStats:
+        with self._lock:
+            return PoolStats(
+                size=self.pool_size,
+                checkedin=len(self._idle),
+                checkedout=self._opened - len(self._idle),
+                overflow=max(self._opened - self.pool_size, 0),
+                waiters=self._waiters,
+                checkouts=self._checkouts,
+                timeouts=self._timeouts,
+                recycled=self._recycled,
+                invalidated=self._invalidated,
+                checkout_time=self._checkout_time,
+                max_checkout_time=self._max_checkout_time,
+            )
+
+    def _acquire(self) -> _ConnectionRecord[TCnx]:
+        start = time.perf_counter()
+        deadline = None if self.timeout is None else start + self.timeout
+
+        with self._lock:
+            while True:
+                if self._closed:
+                    raise RuntimeError(f"'{QueuePool.__name__}' is closed")
+
+                if self._idle:
+                    record = self._idle.pop() if self.use_lifo else self._idle.popleft()
+                    break
+
+                if self.max_size is None or self._opened < self.max_size:
+                    # COMMENT: reserve the slot now and open the connection outside the lock
+                    self._opened += 1
+                    record = None
+                    break
+
+                remaining = None if deadline is None else deadline - time.perf_counter()
+                if remaining is not None and remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeoutError(self, self.timeout)
+
+                self._waiters += 1
+                try:
+                    self._lock.wait(remaining)
+                finally:
+                    self._waiters -= 1
+
+        try:
+            record = self._new_record() if record is None else self._validate(record)
+        except BaseException:
+            with self._lock:
+                self._opened -= 1
+                self._lock.notify()
+            raise
+
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._checkouts += 1
+            self._checkout_time += elapsed
+            self._max_checkout_time = max(self._max_checkout_time, elapsed)
+        return record
+
+    def _new_record(self) -> _ConnectionRecord[TCnx]:
+        version = self._version
+        return _ConnectionRecord(self._connect(**self._config), version)
+
+    def _validate(self, record: _ConnectionRecord[TCnx]) -> _ConnectionRecord[TCnx]:
+        if record.version != self._version or (self.recycle >= 0 and time.monotonic() - record.created > self.recycle):
+            with self._lock:
+                self._recycled += 1
+        elif self.pre_ping and not self._is_usable(record.connection):
+            with self._lock:
+                self._invalidated += 1
+        else:
+            return record
+
+        self._close(record.connection)
+        return self._new_record()
+
+    def _release(self, record: _ConnectionRecord[TCnx], discard: bool = False) -> None:
+        if not discard and self.reset_session:
+            try:
+                record.connection.reset_session()
+            except Exception:
+                discard = True
+
+        with self._lock:
+            # COMMENT: overflow connections are closed instead of kept, so the pool shrinks back to 'pool_size'
+            close = discard or self._closed or self._opened > self.pool_size
+            if close:
+                self._opened -= 1
+                self._invalidated += int(discard)
+            else:
+                self._idle.append(record)
+            self._lock.notify()
+
+        if close:
+            self._close(record.connection)
+        return None
+
+    @contextlib.contextmanager
+    def get_connection(self) -> Generator[TCnx, None, None]:
+        record = self._acquire()
+        discard = False
+        try:
+            yield record.connection
+        except BaseException:
+            discard = not self._is_usable(record.connection)
+            raise
+        finally:
+            self._release(record, discard)
+
+    def dispose(self) -> int:
+        """Close the idle connections. The ones checked out are replaced the next time they're used"""
+        with self._lock:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._opened -= len(idle)
+            self._version += 1
+
+        for record in idle:
+            self._close(record.connection)
+        return len(idle)
+
+    def close(self) -> int:
+        """Same as 'dispose' but the pool can't be used anymore. Connections still checked out are closed when they're returned"""
+        self._closed = True
+        return self.dispose()
+
+    @staticmethod
+    def _is_usable(cnx: TCnx) -> bool:
+        is_connected = getattr(cnx, "is_connected", None)
+        if is_connected is None:
+            return True
+        try:
+            return bool(is_connected())
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close(cnx: TCnx) -> None:
+        try:
+            cnx.close()
+        except Exception:
+            # COMMENT: the connection is already gone if the server closed it
+            pass
+        return None
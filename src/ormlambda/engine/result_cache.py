@@ -0,0 +1,286 @@
+from __future__ import annotations
+import abc
+import hashlib
+import logging
+import pickle
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Type, TYPE_CHECKING
+
+from ormlambda.util import LRUCache
+
+if TYPE_CHECKING:
+    from ormlambda import Table
+
+
+log = logging.getLogger(__name__)
+
+type CacheEntry = tuple[Optional[float], frozenset[str], bytes]
+
+
+class CacheBackend(abc.ABC):
+    """
+    Storage of the 'ResultCache'. Values are pickled results, stored along with the moment they expire (a 'time.time()'
+    timestamp, or None to never expire) and the name of every table they were read from.
+    """
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the value stored for 'key', or None if there's none or it has expired"""
+        ...
+
+    @abc.abstractmethod
+    def set(self, key: str, value: bytes, expires: Optional[float], tags: frozenset[str]) -> None: ...
+
+    @abc.abstractmethod
+    def invalidate(self, tags: Iterable[str]) -> int:
+        """Drop every entry tagged with any of 'tags' and return how many were dropped"""
+        ...
+
+    @abc.abstractmethod
+    def clear(self) -> None: ...
+
+    def close(self) -> None:
+        return None
+
+
+class MemoryBackend(CacheBackend):
+    """In-process backend. Keeps up to 'maxsize' entries and discards the least recently used one when full"""
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self._lock = threading.RLock()
+        self._tags: defaultdict[str, set[str]] = defaultdict(set)
+        self._entries: LRUCache[str, CacheEntry] = LRUCache(maxsize, on_evict=self._untag)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _untag(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            for tag in entry[1]:
+                keys = self._tags.get(tag)
+                if keys is not None:
+                    keys.discard(key)
+        return None
+
+    def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires, _, value = entry
+        if expires is not None and expires <= time.time():
+            self._drop(key)
+            return None
+        return value
+
+    def set(self, key: str, value: bytes, expires: Optional[float], tags: frozenset[str]) -> None:
+        with self._lock:
+            self._drop(key)
+            for tag in tags:
+                self._tags[tag].add(key)
+            self._entries[key] = (expires, tags, value)
+        return None
+
+    def _drop(self, key: str) -> bool:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return False
+            self._untag(key, entry)
+            return True
+
+    def invalidate(self, tags: Iterable[str]) -> int:
+        with self._lock:
+            keys = set().union(*(self._tags.pop(tag, ()) for tag in tags))
+            return sum(self._drop(key) for key in keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+        return None
+
+
+class DiskBackend(CacheBackend):
+    """
+    Local on-disk backend stored in the SQLite file at 'path', so entries survive restarts and are shared by every process of the host.
+    Keeps up to 'maxsize' entries and discards the least recently used ones when full.
+
+    Entries are unpickled as they're read, and unpickling can run arbitrary code, so the file must only be writable by the
+    processes that trust each other. Engines connected to different servers that share it need a different 'namespace' each (see 'ResultCache').
+    """
+
+    def __init__(self, path: str | Path, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError(f"'maxsize' must be a positive integer. You passed '{maxsize}'")
+
+        self.path = Path(path)
+        self.maxsize: int = maxsize
+        self._lock = threading.Lock()
+        self._cnx = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._cnx.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL, used REAL NOT NULL);
+            CREATE TABLE IF NOT EXISTS tags (tag TEXT NOT NULL, key TEXT NOT NULL, PRIMARY KEY (tag, key));
+            CREATE INDEX IF NOT EXISTS tags_key ON tags (key);
+            CREATE INDEX IF NOT EXISTS entries_used ON entries (used);
+            """
+        )
+
+    def __repr__(self) -> str:
+        return f"{DiskBackend.__name__}(path={str(self.path)!r}, maxsize={self.maxsize})"
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._cnx.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def get(self, key: str) -> Optional[bytes]:
+        now = time.time()
+        with self._lock:
+            row = self._cnx.execute("SELECT value, expires FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+
+            value, expires = row
+            if expires is not None and expires <= now:
+                self._delete((key,))
+                return None
+
+            self._cnx.execute("UPDATE entries SET used = ? WHERE key = ?", (now, key))
+            return value
+
+    def set(self, key: str, value: bytes, expires: Optional[float], tags: frozenset[str]) -> None:
+        with self._lock, self._cnx:
+            self._cnx.execute("BEGIN")
+            self._cnx.execute("DELETE FROM tags WHERE key = ?", (key,))
+            self._cnx.execute("INSERT OR REPLACE INTO entries (key, value, expires, used) VALUES (?, ?, ?, ?)", (key, value, expires, time.time()))
+            self._cnx.executemany("INSERT OR IGNORE INTO tags (tag, key) VALUES (?, ?)", [(tag, key) for tag in tags])
+
+            overflow = self._cnx.execute("SELECT COUNT(*) FROM entries").fetchone()[0] - self.maxsize
+            if overflow > 0:
+                self._delete(tuple(x for (x,) in self._cnx.execute("SELECT key FROM entries ORDER BY used LIMIT ?", (overflow,))))
+        return None
+
+    def _delete(self, keys: tuple[str, ...]) -> int:
+        if not keys:
+            return 0
+        placeholders = ", ".join("?" * len(keys))
+        self._cnx.execute(f"DELETE FROM tags WHERE key IN ({placeholders})", keys)
+        return self._cnx.execute(f"DELETE FROM entries WHERE key IN ({placeholders})", keys).rowcount
+
+    def invalidate(self, tags: Iterable[str]) -> int:
+        tags = tuple(tags)
+        if not tags:
+            return 0
+
+        with self._lock, self._cnx:
+            self._cnx.execute("BEGIN")
+            keys = self._cnx.execute(f"SELECT DISTINCT key FROM tags WHERE tag IN ({', '.join('?' * len(tags))})", tags)
+            return self._delete(tuple(x for (x,) in keys))
+
+    def clear(self) -> None:
+        with self._lock, self._cnx:
+            self._cnx.execute("BEGIN")
+            self._cnx.execute("DELETE FROM tags")
+            self._cnx.execute("DELETE FROM entries")
+        return None
+
+    def close(self) -> None:
+        with self._lock:
+            self._cnx.close()
+        return None
+
+
+class ResultCache:
+    """
+    Results of the selects of an engine, enabled with 'engine.cache_results()'.
+
+    Entries are keyed by the compiled SQL, its bound values, the flavour requested and the database it ran on, since compiled
+    queries don't name it. Engines connected to different servers that share a backend must set a different 'namespace', which is
+    part of the key as well. Entries expire after 'ttl' seconds (never when None)
+    and are tagged with every table the select reads, including the ones reached through joins. Any insert, update, upsert, delete or
+    bulk load made through 'Statements' on one of those tables drops them. Writes made in any other way must call 'invalidate'.
+
+    Reads inside a session or with 'use_primary' always go to the database. Streams aren't cached.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None, *, ttl: Optional[float] = 60.0, namespace: Optional[str] = None) -> None:
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"'ttl' must be a positive number or None. You passed '{ttl}'")
+
+        self.backend: CacheBackend = backend if backend is not None else MemoryBackend()
+        self.ttl: Optional[float] = ttl
+        self.namespace: Optional[str] = namespace
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __repr__(self) -> str:
+        return f"{ResultCache.__name__}(backend={self.backend!r}, ttl={self.ttl}, hits={self.hits}, misses={self.misses})"
+
+    def key(self, query: str, params: Optional[Iterable[Any]], flavour: Optional[Type], database: Optional[str] = None) -> str:
+        flavour_name = None if flavour is None else f"{flavour.__module__}.{flavour.__qualname__}"
+        # COMMENT: 'repr' keeps the type of the values, so 1 and '1' don't share an entry
+        return hashlib.blake2b(repr((self.namespace, database, query, tuple(params or ()), flavour_name)).encode(), digest_size=20).hexdigest()
+
+    def fetch[TValue](
+        self,
+        query: str,
+        params: Optional[Iterable[Any]],
+        flavour: Optional[Type],
+        tables: frozenset[str],
+        read: Callable[[], TValue],
+        database: Optional[str] = None,
+    ) -> TValue:
+        """Return the cached result of the select run on 'database', or call 'read' and store what it returns"""
+        key = self.key(query, params, flavour, database)
+
+        hit, result = self.lookup(key)
+        if hit:
+            return result
+
+        result = read()
+        self.store(key, result, tables)
+        return result
+
+    def lookup(self, key: str) -> tuple[bool, Any]:
+        """Return whether 'key' is cached along with its result"""
+        value = self.backend.get(key)
+        if value is None:
+            self.misses += 1
+            return False, None
+
+        self.hits += 1
+        return True, pickle.loads(value)
+
+    def store(self, key: str, result: Any, tables: frozenset[str]) -> None:
+        try:
+            value = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as error:
+            log.warning(f"Result not cached because it can't be pickled: {error}")
+            return None
+
+        expires = None if self.ttl is None else time.time() + self.ttl
+        return self.backend.set(key, value, expires, tables)
+
+    def invalidate(self, *tables: Type[Table] | str) -> int:
+        """Drop every result read from any of 'tables' (models or table names)"""
+        return self.backend.invalidate(x if isinstance(x, str) else x.__table_name__ for x in tables)
+
+    def clear(self) -> None:
+        return self.backend.clear()
+
+    def close(self) -> None:
+        return self.backend.close()
+
+
+__all__ = [
+    "CacheBackend",
+    "MemoryBackend",
+    "DiskBackend",
+    "ResultCache",
+]
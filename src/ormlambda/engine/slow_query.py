@@ -0,0 +1,174 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+import datetime
+import inspect
+import json
+import logging
+import logging.handlers
+from pathlib import Path
+import random
+from typing import Any, Callable, NamedTuple, Optional, TypedDict, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ormlambda.engine.base import Engine
+    from ormlambda.events import EventContext
+
+
+log = logging.getLogger(__name__)
+
+EXPLAINABLE: tuple[str, ...] = ("SELECT", "INSERT", "UPDATE", "DELETE", "REPLACE")
+DEFAULT_MAX_BYTES: int = 10 * 1024 * 1024
+
+
+class SlowQuery(NamedTuple):
+    sql: str
+    params: Any
+    duration: float
+    rowcount: int
+    timestamp: datetime.datetime
+    explain: Optional[Any] = None
+    explain_error: Optional[str] = None
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "timestamp": self.timestamp.isoformat(),
+                "duration": round(self.duration, 6),
+                "rowcount": self.rowcount,
+                "sql": self.sql,
+                "params": self.params,
+                "explain": self.explain,
+                "explain_error": self.explain_error,
+            },
+            default=str,
+        )
+
+
+type SlowQueryCallback = Callable[[SlowQuery], Any]
+
+
+class SlowQueryArgs(TypedDict, total=False):
+    path: Optional[str | Path]
+    callback: Optional[SlowQueryCallback]
+    explain_sample_rate: float
+    max_bytes: int
+    backup_count: int
+
+
+class SlowQueryLog:
+    """
+    Record every statement executed by 'engine' that takes longer than 'threshold' seconds.
+
+    Each 'SlowQuery' has the SQL, its bound values, the duration and the row count. For a sample of them ('explain_sample_rate'),
+    it also has the output of 'EXPLAIN FORMAT=JSON', which runs with the same values on another pooled connection.
+    The EXPLAIN and the output run in a background thread, so the statement that was slow doesn't wait for them.
+
+    Records are written as JSON lines to 'path', rotated when the file reaches 'max_bytes', and/or passed to 'callback'.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        threshold: float = 1.0,
+        *,
+        path: Optional[str | Path] = None,
+        callback: Optional[SlowQueryCallback] = None,
+        explain_sample_rate: float = 0.1,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backup_count: int = 5,
+    ) -> None:
+        if path is None and callback is None:
+            raise ValueError("'path' or 'callback' must be provided to write the slow queries somewhere")
+
+        if not 0 <= explain_sample_rate <= 1:
+            raise ValueError(f"'explain_sample_rate' must be between 0 and 1. You passed '{explain_sample_rate}'")
+
+        self.engine = engine
+        self.threshold: float = threshold
+        self.callback = callback
+        # COMMENT: the EXPLAIN is run synchronously from the worker thread, so it's only available for blocking repositories
+        self.explain_sample_rate: float = 0.0 if inspect.iscoroutinefunction(engine.repository.read_sql) else explain_sample_rate
+
+        self._handler: Optional[logging.Handler] = None
+        if path is not None:
+            self._handler = logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True)
+            self._handler.setFormatter(logging.Formatter("%(message)s"))
+
+        # COMMENT: a single worker keeps the records in the order they were detected
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ormlambda-slow-query")
+        self.engine.events.listen("after_execute", self._after_execute)
+
+    def __repr__(self) -> str:
+        return f"{SlowQueryLog.__name__}(threshold={self.threshold}, explain_sample_rate={self.explain_sample_rate})"
+
+    def __enter__(self) -> SlowQueryLog:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _after_execute(self, context: EventContext) -> None:
+        if context.elapsed < self.threshold or self._is_explain(context.sql):
+            return None
+
+        explain = not context.many and self._can_explain(context.sql) and random.random() < self.explain_sample_rate
+        self._executor.submit(
+            self._write,
+            context.sql,
+            context.params,
+            context.elapsed,
+            context.rowcount,
+            datetime.datetime.now(),
+            explain,
+        )
+        return None
+
+    @staticmethod
+    def _is_explain(sql: str) -> bool:
+        # COMMENT: the EXPLAIN itself goes through the same repository, so it must not be recorded (nor explained) again
+        return sql.lstrip()[:7].upper() == "EXPLAIN"
+
+    @staticmethod
+    def _can_explain(sql: str) -> bool:
+        return sql.lstrip().split(" ", 1)[0].upper() in EXPLAINABLE
+
+    def _explain(self, sql: str, params: Any) -> Any:
+        (row,) = self.engine.repository.read_sql(f"EXPLAIN FORMAT=JSON {sql}", flavour=dict, params=params)
+        (plan,) = row.values()
+        return json.loads(plan) if isinstance(plan, str | bytes) else plan
+
+    def _write(self, sql: str, params: Any, duration: float, rowcount: int, timestamp: datetime.datetime, explain: bool) -> SlowQuery:
+        plan = error = None
+        if explain:
+            try:
+                plan = self._explain(sql, params)
+            except Exception as exc:
+                error = f"{type(exc).__name__}: {exc}"
+
+        params = list(params) if isinstance(params, tuple) else params
+        record = SlowQuery(sql, params, duration, rowcount, timestamp, plan, error)
+
+        try:
+            if self._handler is not None:
+                self._handler.emit(logging.makeLogRecord({"msg": record.to_json(), "levelno": logging.WARNING, "levelname": "WARNING"}))
+            if self.callback is not None:
+                self.callback(record)
+        except Exception:
+            log.exception("The slow query could not be written")
+        return record
+
+    def flush(self) -> None:
+        """Wait until every slow query detected so far has been written"""
+        self._executor.submit(lambda: None).result()
+        return None
+
+    def close(self) -> None:
+        """Stop listening to the engine and write the pending records"""
+        try:
+            self.engine.events.remove("after_execute", self._after_execute)
+        except ValueError:
+            pass
+        self._executor.shutdown(wait=True)
+        if self._handler is not None:
+            self._handler.close()
+        return None
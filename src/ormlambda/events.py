@@ -0,0 +1,170 @@
+from __future__ import annotations
+import contextlib
+import time
+from typing import Any, Callable, ContextManager, Generator, Literal, Optional
+
+
+type EventName = Literal[
+    "before_compile",
+    "after_compile",
+    "before_execute",
+    "after_execute",
+    "after_fetch",
+    "after_hydrate",
+    "on_error",
+]
+type Listener = Callable[[EventContext], Any]
+
+EVENTS: tuple[EventName, ...] = (
+    "before_compile",
+    "after_compile",
+    "before_execute",
+    "after_execute",
+    "after_fetch",
+    "after_hydrate",
+    "on_error",
+)
+
+# COMMENT: returned instead of a new context manager when nobody listens, so instrumented code only pays for a falsy check
+_NO_CONTEXT: ContextManager[None] = contextlib.nullcontext()
+
+
+class EventContext:
+    """
+    Object received by every listener. The same one is passed to the 'before_*', 'after_*' and 'on_error' listeners of a statement.
+
+    - element: clause compiled ('before_compile'/'after_compile') or model hydrated ('after_hydrate').
+    - sql, params: statement and bound values. 'params' is a sequence of them when 'many' is True.
+    - rowcount: rows affected ('after_execute'), fetched ('after_fetch') or hydrated ('after_hydrate').
+    - started, finished: 'time.monotonic()' when the operation started and when the last event was dispatched.
+    - error: exception received by 'on_error' listeners.
+    """
+
+    __slots__ = (
+        "_events",
+        "element",
+        "sql",
+        "params",
+        "many",
+        "rowcount",
+        "started",
+        "finished",
+        "error",
+    )
+
+    def __init__(
+        self,
+        events: Events,
+        *,
+        element: Any = None,
+        sql: Optional[str] = None,
+        params: Any = None,
+        many: bool = False,
+    ) -> None:
+        self._events = events
+        self.element = element
+        self.sql = sql
+        self.params = params
+        self.many = many
+        self.rowcount: int = -1
+        self.started: float = time.monotonic()
+        self.finished: float = self.started
+        self.error: Optional[BaseException] = None
+
+    def __repr__(self) -> str:
+        return f"{EventContext.__name__}(sql={self.sql!r}, rowcount={self.rowcount}, elapsed={self.elapsed:.6f})"
+
+    @property
+    def elapsed(self) -> float:
+        return self.finished - self.started
+
+    def _dispatch(self, listeners: list[Listener]) -> None:
+        self.finished = time.monotonic()
+        for listener in listeners:
+            listener(self)
+        return None
+
+    def compiled(self, sql: str, params: Any = None) -> None:
+        self.sql = sql
+        self.params = params
+        return self._dispatch(self._events.after_compile)
+
+    def executed(self, rowcount: int) -> None:
+        self.rowcount = rowcount
+        return self._dispatch(self._events.after_execute)
+
+    def fetched(self, rowcount: int) -> None:
+        self.rowcount = rowcount
+        return self._dispatch(self._events.after_fetch)
+
+    def hydrated(self, rowcount: int) -> None:
+        self.rowcount = rowcount
+        return self._dispatch(self._events.after_hydrate)
+
+
+class Events:
+    """
+    Listeners of an engine, shared by its repository and every 'Statements' created with it.
+
+    >>> @engine.events.listens_for("after_execute")
+    ... def log(context: EventContext) -> None:
+    ...     print(context.sql, context.rowcount, context.elapsed)
+    """
+
+    __slots__ = EVENTS
+
+    def __init__(self) -> None:
+        for name in EVENTS:
+            setattr(self, name, [])
+
+    def __repr__(self) -> str:
+        return f"{Events.__name__}({', '.join(f'{name}={len(getattr(self, name))}' for name in EVENTS if getattr(self, name))})"
+
+    def _get_listeners(self, name: EventName) -> list[Listener]:
+        if name not in EVENTS:
+            raise ValueError(f"'{name}' is not a valid event. Use one of {EVENTS}")
+        return getattr(self, name)
+
+    def listen(self, name: EventName, listener: Listener) -> Listener:
+        self._get_listeners(name).append(listener)
+        return listener
+
+    def listens_for(self, name: EventName) -> Callable[[Listener], Listener]:
+        return lambda listener: self.listen(name, listener)
+
+    def remove(self, name: EventName, listener: Listener) -> None:
+        return self._get_listeners(name).remove(listener)
+
+    def clear(self) -> None:
+        for name in EVENTS:
+            getattr(self, name).clear()
+        return None
+
+    def compiling(self, element: Any) -> ContextManager[Optional[EventContext]]:
+        """Context manager that yields an 'EventContext' to call 'compiled' on, or None when there are no compile listeners"""
+        if not (self.before_compile or self.after_compile or self.on_error):
+            return _NO_CONTEXT
+        return self._context(self.before_compile, element=element)
+
+    def executing(self, sql: str, params: Any = None, many: bool = False) -> ContextManager[Optional[EventContext]]:
+        """Context manager that yields an 'EventContext' to call 'executed' and 'fetched' on, or None when there are no execution listeners"""
+        if not (self.before_execute or self.after_execute or self.after_fetch or self.on_error):
+            return _NO_CONTEXT
+        return self._context(self.before_execute, sql=sql, params=params, many=many)
+
+    def hydrating(self, element: Any, sql: Optional[str] = None, params: Any = None) -> ContextManager[Optional[EventContext]]:
+        """Context manager that yields an 'EventContext' to call 'hydrated' on, or None when there are no 'after_hydrate' listeners"""
+        if not (self.after_hydrate or self.on_error):
+            return _NO_CONTEXT
+        return self._context([], element=element, sql=sql, params=params)
+
+    @contextlib.contextmanager
+    def _context(self, before: list[Listener], **kwargs: Any) -> Generator[EventContext, None, None]:
+        context = EventContext(self, **kwargs)
+        context._dispatch(before)
+        try:
+            yield context
+        except Exception as error:
+            context.error = error
+            context._dispatch(self.on_error)
+            raise
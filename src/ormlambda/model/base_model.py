@@ -3,8 +3,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Type
 
-from ormlambda.statements import Statements
-from ormlambda.engine import Engine
+from ormlambda.statements import Statements, AsyncStatements
+from ormlambda.engine import Engine, AsyncEngine
 
 if TYPE_CHECKING:
     from ormlambda.statements.interfaces import IStatements
@@ -15,10 +15,13 @@ class BaseModel[T]:
     This class contains those methods to make query to a table
     """
 
-    def __new__(cls, model: Type[T], engine: Engine) -> IStatements[T]:
+    def __new__(cls, model: Type[T], engine: Engine | AsyncEngine) -> IStatements[T]:
         if engine is None:
             raise ValueError("`None` cannot be passed to the `repository` attribute when calling the `BaseModel` class")
 
+        if isinstance(engine, AsyncEngine):
+            return AsyncStatements(model, engine)
+
         if not isinstance(engine, Engine):
             raise ValueError(f"`{engine}` is not a valid `Engine` instance")
 
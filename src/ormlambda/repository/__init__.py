@@ -1,2 +1,6 @@
 from .interfaces import IRepositoryBase  # noqa: F401
+from .interfaces import IAsyncRepositoryBase  # noqa: F401
 from .base_repository import BaseRepository  # noqa: F401
+from .session import Session  # noqa: F401
+from .routing import RoutingRepository  # noqa: F401
+from .identity_map import IdentityMap  # noqa: F401
@@ -1,6 +1,10 @@
 from __future__ import annotations
-from typing import Generator, Optional, Type, Unpack, TYPE_CHECKING
+import contextvars
+from typing import ContextManager, Generator, Optional, Type, Unpack, TYPE_CHECKING
 from ormlambda.repository import IRepositoryBase
+from ormlambda.events import Events
+from .session import Session, open_session
+from .identity_map import IdentityMap, open_identity_map
 import abc
 
 if TYPE_CHECKING:
@@ -24,6 +28,9 @@ class BaseRepository[TPool](IRepositoryBase):
     ) -> None:
         self._dialect = dialect
         self._url = url
+        self.events: Events = Events()
+        self._session: contextvars.ContextVar[Optional[Session]] = contextvars.ContextVar(f"session_{id(self)}", default=None)
+        self._identity_map: contextvars.ContextVar[Optional[IdentityMap]] = contextvars.ContextVar(f"identity_map_{id(self)}", default=None)
 
         self._user = user
         self._password = password
@@ -46,3 +53,33 @@ class BaseRepository[TPool](IRepositoryBase):
     @property
     def pool(self) -> TPool:
         return self._pool
+
+    @property
+    def current_session(self) -> Optional[Session]:
+        """Session opened by 'session' in the current thread or asyncio task, if any"""
+        return self._session.get()
+
+    def session(self, defer: bool = False, identity_map: bool = False) -> ContextManager[Session]:
+        """Run every statement of the block on the same connection and transaction. See 'Session'"""
+        return open_session(self, defer, identity_map)
+
+    @property
+    def current_identity_map(self) -> Optional[IdentityMap]:
+        """Identity map opened by 'identity_map' in the current thread or asyncio task, if any"""
+        return self._identity_map.get()
+
+    def identity_map(self) -> ContextManager[IdentityMap]:
+        """Return the instance already loaded for a primary key instead of building a new one until the block ends. See 'IdentityMap'"""
+        return open_identity_map(self)
+
+    def _deferring(self) -> Optional[Session]:
+        """Session that must queue the writes instead of sending them"""
+        session = self._session.get()
+        return session if session is not None and session.deferring else None
+
+    def _autoflush(self) -> None:
+        # COMMENT: reads and any other statement must see the writes queued before them
+        session = self._session.get()
+        if session is not None and session.deferring:
+            session.flush()
+        return None
@@ -0,0 +1,159 @@
+from __future__ import annotations
+import datetime
+import decimal
+from typing import Any, Callable, Iterator, NamedTuple, Optional, Sequence
+
+
+# COMMENT: fraction of 'max_allowed_packet' we allow a statement to take. The rest is left for the protocol header and our estimation errors
+PACKET_USAGE: float = 0.9
+DEFAULT_CHUNK_SIZE: int = 1000
+MAX_CHUNK_SIZE: int = 50_000
+TARGET_LATENCY: float = 0.5
+
+# COMMENT: characters escaped by the driver when a value is interpolated into the statement, each of them takes an extra byte
+ESCAPED_BYTES: tuple[bytes, ...] = (b"\\", b"'", b'"', b"\n", b"\r", b"\x00", b"\x1a")
+
+# COMMENT: upper bound of the length of the literals the driver writes for fixed size values
+FIXED_SIZES: dict[type, int] = {
+    bool: 5,
+    int: 21,
+    float: 26,
+    datetime.datetime: 30,
+    datetime.date: 12,
+    datetime.time: 20,
+    datetime.timedelta: 20,
+}
+
+
+class ChunkProgress(NamedTuple):
+    index: int
+    rows: int
+    done: int
+    total: int
+    rowcount: int
+    elapsed: float
+
+
+type ProgressCallback = Callable[[ChunkProgress], Any]
+
+
+def estimate_value_size(value: Any) -> int:
+    """Estimate the bytes 'value' takes once the driver writes it as a literal inside the statement"""
+    if value is None:
+        return 4
+
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+
+    if isinstance(value, bytes | bytearray):
+        return len(value) + 2 + sum(value.count(x) for x in ESCAPED_BYTES)
+
+    size = FIXED_SIZES.get(type(value), None)
+    if size is not None:
+        return size
+
+    if isinstance(value, decimal.Decimal):
+        return len(str(value))
+
+    # COMMENT: anything else (json, enums, ...) is converted to a string, which in the worst case gets every character escaped
+    return 2 * len(str(value).encode("utf-8")) + 2
+
+
+def estimate_row_size(row: Sequence[Any]) -> int:
+    return sum(estimate_value_size(x) for x in row)
+
+
+class MultiRowStatement:
+    """
+    Statement whose group of placeholders ('row') is repeated once per row of the chunk that is executed.
+
+    - INSERT INTO t (a, b) VALUES (%s, %s), (%s, %s) ...  -> row = '(%s, %s)'
+    - DELETE FROM t WHERE t.pk IN (%s, %s, ...)           -> row = '%s'
+    """
+
+    __slots__ = ("head", "row", "tail", "sep")
+
+    def __init__(self, head: str, row: str, tail: str = "", sep: str = ", ") -> None:
+        self.head: str = head
+        self.row: str = row
+        self.tail: str = tail
+        self.sep: str = sep
+
+    def __repr__(self) -> str:
+        return f"{MultiRowStatement.__name__}({self.head!r}, {self.row!r}, {self.tail!r})"
+
+    @classmethod
+    def from_query(cls, query: str, row: str, *, last: bool = False) -> MultiRowStatement:
+        """Split the single-row 'query' around the first (or the last) occurrence of 'row'"""
+        head, found, tail = query.rpartition(row) if last else query.partition(row)
+        if not found:
+            raise ValueError(f"'{row}' not found in the query '{query}'")
+        return cls(head, row, tail)
+
+    @property
+    def size(self) -> int:
+        """Length of the statement without any row"""
+        return len(self.head.encode("utf-8")) + len(self.tail.encode("utf-8"))
+
+    @property
+    def row_size(self) -> int:
+        """Length of the placeholders of one row, which are replaced by its values"""
+        return len(self.row) + len(self.sep) - 2 * self.row.count("%s")
+
+    def sql(self, rows: int) -> str:
+        return self.head + self.sep.join([self.row] * rows) + self.tail
+
+
+class ChunkSizer:
+    """
+    Split rows into chunks that fit in 'max_bytes' and contain at most 'rows' rows each.
+
+    If 'chunk_size' is None the number of rows is adapted after every chunk so that each of them takes about 'target_latency' seconds.
+    The next size is proportional to the one we measured, and it never shrinks to less than half or grows beyond twice the last one.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        row_overhead: int = 0,
+        chunk_size: Optional[int] = None,
+        target_latency: float = TARGET_LATENCY,
+        max_chunk_size: int = MAX_CHUNK_SIZE,
+    ) -> None:
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError(f"'chunk_size' must be a positive integer. You passed '{chunk_size}'")
+
+        self.max_bytes: int = max_bytes
+        self.row_overhead: int = row_overhead
+        self.adaptive: bool = chunk_size is None
+        self.rows: int = chunk_size if chunk_size is not None else min(DEFAULT_CHUNK_SIZE, max_chunk_size)
+        self.target_latency: float = target_latency
+        self.max_chunk_size: int = max_chunk_size
+
+    def split[T: Sequence[Any]](self, rows: Sequence[T]) -> Iterator[Sequence[T]]:
+        # COMMENT: 'self.rows' is read before building each chunk, so the caller can 'record' the previous one in between
+        start = 0
+        total = len(rows)
+        while start < total:
+            end = start
+            size = 0
+            limit = min(total, start + self.rows)
+            while end < limit:
+                row_size = estimate_row_size(rows[end]) + self.row_overhead
+                # COMMENT: a row bigger than the packet is sent on its own, so the server reports the error
+                if end > start and size + row_size > self.max_bytes:
+                    break
+                size += row_size
+                end += 1
+
+            yield rows[start:end]
+            start = end
+
+    def record(self, rows: int, elapsed: float) -> int:
+        """Update the number of rows of the next chunk with the latency of the last one"""
+        if not self.adaptive or elapsed <= 0:
+            return self.rows
+
+        proposed = int(rows * self.target_latency / elapsed)
+        self.rows = max(1, min(self.max_chunk_size, self.rows * 2, max(self.rows // 2, proposed)))
+        return self.rows
@@ -0,0 +1,170 @@
+from __future__ import annotations
+import asyncio
+import contextlib
+import csv
+import json
+import os
+from pathlib import Path
+import tempfile
+from typing import Any, AsyncGenerator, BinaryIO, Generator, Iterable, Iterator, Literal, Mapping, Optional, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ormlambda import Table
+    from ormlambda.caster import Caster
+    from ormlambda.sql import Column
+
+
+type BulkFormat = Literal["csv", "ndjson"]
+type BulkRow = Table | Mapping[str, Any]
+type BulkSource = Iterable[BulkRow] | str | Path
+
+FORMATS: dict[str, BulkFormat] = {
+    ".csv": "csv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+}
+
+# COMMENT: the file is written with the default format of 'LOAD DATA', which the compiler states explicitly
+FIELD_SEPARATOR: bytes = b"\t"
+LINE_SEPARATOR: bytes = b"\n"
+NULL: bytes = b"\\N"
+ESCAPES: tuple[tuple[bytes, bytes], ...] = (
+    (b"\\", b"\\\\"),
+    (b"\t", b"\\t"),
+    (b"\n", b"\\n"),
+    (b"\r", b"\\r"),
+    (b"\x00", b"\\0"),
+)
+
+
+class BulkRows:
+    """
+    Rows read from the source of 'bulk_load' along with the names of the columns they provide.
+
+    'text' is True when the values come from a CSV file and are already written the way MySQL reads them, so they skip the casters.
+    """
+
+    __slots__ = ("rows", "columns", "text")
+
+    def __init__(self, rows: Iterator[BulkRow], columns: Optional[tuple[str, ...]] = None, text: bool = False) -> None:
+        self.rows: Iterator[BulkRow] = rows
+        self.columns: Optional[tuple[str, ...]] = columns
+        self.text: bool = text
+
+
+def get_format(source: BulkSource, format: Optional[BulkFormat] = None) -> Optional[BulkFormat]:
+    if not isinstance(source, str | Path):
+        return None
+
+    if format is not None:
+        return format
+
+    suffix = Path(source).suffix.lower()
+    if suffix not in FORMATS:
+        raise ValueError(f"Can't infer the format of '{source}' from its extension. Pass 'format' as one of {sorted(set(FORMATS.values()))}")
+    return FORMATS[suffix]
+
+
+def read_source(source: BulkSource, format: Optional[BulkFormat] = None) -> BulkRows:
+    """Return the rows of 'source' lazily, so that files are never loaded in memory as a whole"""
+    format = get_format(source, format)
+
+    if format is None:
+        return BulkRows(iter(source))
+
+    if format == "csv":
+        file = open(source, newline="", encoding="utf-8")
+        reader = csv.DictReader(file)
+        return BulkRows(_close_after(file, reader), tuple(reader.fieldnames or ()), text=True)
+
+    if format == "ndjson":
+        file = open(source, encoding="utf-8")
+        return BulkRows(_close_after(file, (json.loads(line) for line in file if line.strip())))
+
+    raise ValueError(f"'{format}' format is not supported. Use one of {sorted(set(FORMATS.values()))}")
+
+
+def _close_after[T](file, rows: Iterable[T]) -> Iterator[T]:
+    with file:
+        yield from rows
+
+
+def encode_value(value: Any) -> bytes:
+    if value is None:
+        return NULL
+
+    if isinstance(value, bool):
+        value = b"1" if value else b"0"
+    elif isinstance(value, bytes | bytearray):
+        value = bytes(value)
+    elif isinstance(value, float):
+        value = repr(value).encode("ascii")
+    else:
+        value = str(value).encode("utf-8")
+
+    for char, escaped in ESCAPES:
+        if char in value:
+            value = value.replace(char, escaped)
+    return value
+
+
+def get_value(row: BulkRow, name: str) -> Any:
+    if isinstance(row, Mapping):
+        return row.get(name, None)
+    return getattr(row, name)
+
+
+def write_rows(file: BinaryIO, rows: BulkRows, columns: Sequence[Column], caster: Caster) -> int:
+    """Write 'rows' into 'file' using the 'to_database' value of each column. Return the number of rows written"""
+    names = tuple(x.column_name for x in columns)
+    dtypes = tuple(x.dtype for x in columns)
+
+    count = 0
+    for row in rows.rows:
+        values = []
+        for name, dtype in zip(names, dtypes):
+            value = get_value(row, name)
+            if rows.text:
+                # COMMENT: CSV files can't tell NULL from an empty string, we take empty fields as NULL like pandas does
+                value = value if value != "" else None
+            elif value is not None:
+                value = caster.cast(value, dtype).to_database
+            values.append(encode_value(value))
+
+        file.write(FIELD_SEPARATOR.join(values) + LINE_SEPARATOR)
+        count += 1
+    return count
+
+
+@contextlib.contextmanager
+def infile(rows: BulkRows, columns: Sequence[Column], caster: Caster, tmp_dir: Optional[str | Path] = None) -> Generator[Path, None, None]:
+    """
+    Yield the path of a temporary file with 'rows' written in it, and remove the file afterwards.
+
+    The driver reads 'LOAD DATA LOCAL INFILE' files by path, so it has to be a real file.
+    If the connection sets 'allow_local_infile_in_path', 'tmp_dir' must be inside that directory.
+    """
+    with tempfile.NamedTemporaryFile("wb", suffix=".tsv", dir=tmp_dir, delete=False) as file:
+        path = Path(file.name)
+        try:
+            write_rows(file, rows, columns, caster)
+        except Exception:
+            file.close()
+            os.remove(path)
+            raise
+
+    try:
+        yield path
+    finally:
+        os.remove(path)
+
+
+@contextlib.asynccontextmanager
+async def async_infile(rows: BulkRows, columns: Sequence[Column], caster: Caster, tmp_dir: Optional[str | Path] = None) -> AsyncGenerator[Path, None]:
+    """Same as 'infile' but the file is written in a worker thread so the event loop isn't blocked"""
+    context = infile(rows, columns, caster, tmp_dir)
+    path = await asyncio.to_thread(context.__enter__)
+    try:
+        yield path
+    finally:
+        await asyncio.to_thread(context.__exit__, None, None, None)
@@ -0,0 +1,116 @@
+from __future__ import annotations
+import datetime
+import decimal
+import sys
+from typing import Any, Callable, Iterable, Literal, Optional, Type, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+
+COLUMNS: Literal["columns"] = "columns"
+
+# COMMENT: python types whose values are already returned by the driver in a form numpy can convert without going through the caster
+NUMPY_DTYPES: dict[type, str] = {
+    bool: "bool",
+    int: "int64",
+    float: "float64",
+    datetime.datetime: "datetime64[us]",
+    datetime.date: "datetime64[D]",
+    datetime.timedelta: "timedelta64[us]",
+    decimal.Decimal: "object",
+    str: "object",
+}
+
+# COMMENT: dtypes that can't hold NULL values and the ones we use instead, same as pandas does
+NULLABLE_DTYPES: dict[str, str] = {
+    "int64": "float64",
+    "bool": "object",
+}
+
+
+def is_dataframe(flavour: Any) -> bool:
+    # COMMENT: if the user passed 'pandas.DataFrame' as flavour, pandas was already imported, so we never import it ourselves
+    pandas = sys.modules.get("pandas", None)
+    return pandas is not None and flavour is pandas.DataFrame
+
+
+def is_columnar(flavour: Any) -> bool:
+    return (isinstance(flavour, str) and flavour == COLUMNS) or is_dataframe(flavour)
+
+
+def numpy_dtype(python_type: Optional[Type]) -> str:
+    """Return the numpy dtype used to store the values of 'python_type'. Anything we don't know is kept as 'object'"""
+    if not isinstance(python_type, type):
+        return "object"
+
+    # COMMENT: 'datetime' is a subclass of 'date' and 'bool' of 'int', so we walk the MRO instead of using issubclass
+    for type_ in python_type.__mro__:
+        if type_ in NUMPY_DTYPES:
+            return NUMPY_DTYPES[type_]
+    return "object"
+
+
+def import_numpy():
+    """numpy isn't a dependency of ormlambda but of its 'columns' extra, so we say how to get it when it's missing"""
+    try:
+        import numpy as np
+    except ImportError as exc:
+        raise ModuleNotFoundError(f"The '{COLUMNS}' flavour needs numpy. Install it with 'pip install ormlambda[columns]'", name="numpy") from exc
+    return np
+
+
+def _object_array(values: Iterable[Any]) -> np.ndarray:
+    np = import_numpy()
+
+    # COMMENT: np.array would build a multidimensional array from values that are sequences themselves (i.e. json lists)
+    values = tuple(values)
+    array = np.empty(len(values), dtype="object")
+    for i, value in enumerate(values):
+        array[i] = value
+    return array
+
+
+def to_columns(
+    columns: Iterable[str],
+    rows: list[tuple],
+    python_types: Iterable[Optional[Type]],
+    parser: Callable[[Any, Optional[Type]], Any],
+) -> dict[str, np.ndarray]:
+    """
+    Transpose 'rows' into one numpy array per column.
+
+    Columns whose type has a native numpy dtype are converted straight from the driver values.
+    The rest of them (json, points, bytes, ...) go through 'parser' value by value and are stored in 'object' arrays.
+    """
+    np = import_numpy()
+
+    columns = tuple(columns)
+    transposed = tuple(zip(*rows)) if rows else tuple(() for _ in columns)
+
+    result: dict[str, np.ndarray] = {}
+    for name, values, python_type in zip(columns, transposed, python_types):
+        dtype = numpy_dtype(python_type)
+
+        if dtype == "object":
+            if python_type not in NUMPY_DTYPES:
+                values = (parser(x, python_type) for x in values)
+            result[name] = _object_array(values)
+            continue
+
+        if None in values:
+            dtype = NULLABLE_DTYPES.get(dtype, dtype)
+
+        try:
+            result[name] = np.array(values, dtype=dtype)
+        except (TypeError, ValueError, OverflowError):
+            # COMMENT: the driver returned something that doesn't match the declared type of the column
+            result[name] = _object_array(values)
+    return result
+
+
+def to_dataframe(columns: dict[str, np.ndarray]) -> pd.DataFrame:
+    import pandas as pd
+
+    return pd.DataFrame(columns, copy=False)
@@ -0,0 +1,53 @@
+from __future__ import annotations
+from typing import Any, Callable, Iterable, Optional, Type, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ormlambda.caster import Caster
+
+
+type Decoder = Callable[[Any], Any]
+
+
+class DecoderPlan:
+    """
+    Functions used to convert the rows fetched for a 'Select', one per column position (None when the column is returned as it is).
+
+    It's built once per compiled statement so that decoding a row doesn't need to look up the select clause,
+    resolve the python type or create a caster for every cell.
+    """
+
+    __slots__ = ("columns", "python_types", "decoders", "_steps")
+
+    def __init__(self, columns: tuple[str, ...], python_types: Iterable[Optional[Type]], decoders: Iterable[Optional[Decoder]]) -> None:
+        self.columns: tuple[str, ...] = columns
+        self.python_types: tuple[Optional[Type], ...] = tuple(python_types)
+        self.decoders: tuple[Optional[Decoder], ...] = tuple(decoders)
+        self._steps: tuple[tuple[int, Decoder], ...] = tuple((i, x) for i, x in enumerate(self.decoders) if x is not None)
+
+    def __repr__(self) -> str:
+        return f"{DecoderPlan.__name__}(columns={len(self.columns)}, decoded={len(self._steps)})"
+
+    @classmethod
+    def from_types(cls, caster: Caster, columns: tuple[str, ...], python_types: Iterable[Optional[Type]]) -> DecoderPlan:
+        python_types = tuple(python_types)
+        return cls(columns, python_types, [caster.decoder(x) for x in python_types])
+
+    @property
+    def is_identity(self) -> bool:
+        return not self._steps
+
+    def decode(self, rows: Iterable[tuple]) -> list[tuple]:
+        if self.is_identity:
+            return [tuple(row) for row in rows]
+
+        steps = self._steps
+        result = []
+        for row in rows:
+            new_row = list(row)
+            for i, decode in steps:
+                value = new_row[i]
+                # COMMENT: every caster returns None for NULL values
+                if value is not None:
+                    new_row[i] = decode(value)
+            result.append(tuple(new_row))
+        return result
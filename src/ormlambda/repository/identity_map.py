@@ -0,0 +1,110 @@
+from __future__ import annotations
+import contextlib
+import weakref
+from typing import Any, Callable, Generator, Optional, Type, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ormlambda import Table
+    from ormlambda.repository import BaseRepository
+
+
+type IdentityKey = tuple[Type[Table], Any]
+
+
+class IdentityMap:
+    """
+    Instances loaded while the map is open, keyed by '(table class, primary key)'.
+
+    Open it with 'engine.identity_map()' (or 'engine.session(identity_map=True)') and every select that fetches all the columns
+    of a model returns the instance already loaded for its primary key instead of building a new one, so the same 'City' or
+    'Country' reached through different joins is the same object. 'Statements.get' returns it without querying the database.
+
+    Instances are held through weak references, so they're released as soon as the caller drops them. They aren't refreshed
+    when they're loaded again: updates, deletes, upserts and bulk loads of a table expire all its instances instead.
+    """
+
+    __slots__ = ("_objects",)
+
+    def __init__(self) -> None:
+        self._objects: weakref.WeakValueDictionary[IdentityKey, Table] = weakref.WeakValueDictionary()
+
+    def __repr__(self) -> str:
+        return f"{IdentityMap.__name__}(size={len(self)})"
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __contains__(self, key: IdentityKey) -> bool:
+        return key in self._objects
+
+    def get[T: Table](self, table: Type[T], pk: Any) -> Optional[T]:
+        return self._objects.get((table, pk))
+
+    def add[T: Table](self, instance: T) -> T:
+        """Register 'instance' and return it, or return the instance already registered for its primary key"""
+        table = type(instance)
+        pk = table.get_pk()
+        if pk is None:
+            return instance
+
+        value = instance[pk]
+        if value is None:
+            return instance
+        return self._objects.setdefault((table, value), instance)
+
+    def expire(self, table: Type[Table]) -> None:
+        """Forget every instance of 'table', so the next select builds them from the rows fetched"""
+        for key in [x for x in self._objects.keys() if x[0] is table]:
+            self._objects.pop(key, None)
+        return None
+
+    def clear(self) -> None:
+        self._objects.clear()
+        return None
+
+    def constructor[T: Table](self, table: Type[T], constructor: Callable[[tuple], T], pk_index: int) -> Callable[[tuple], T]:
+        """Wrap the row constructor of 'table' so it only builds the instances whose primary key isn't in the map yet"""
+        objects = self._objects
+
+        def __from_row__(row: tuple) -> T:
+            value = row[pk_index]
+            # COMMENT: a LEFT JOIN without match returns NULL in every column, also in the primary key
+            if value is None:
+                return constructor(row)
+
+            key = (table, value)
+            instance = objects.get(key)
+            if instance is None:
+                instance = objects[key] = constructor(row)
+            return instance
+
+        return __from_row__
+
+
+def current_identity_map(repository: Any) -> Optional[IdentityMap]:
+    """Identity map open for 'repository' in the current thread or asyncio task. Repositories that don't support it return None"""
+    return getattr(repository, "current_identity_map", None)
+
+
+@contextlib.contextmanager
+def open_identity_map(repository: BaseRepository) -> Generator[IdentityMap, None, None]:
+    """Bind a new identity map to the current context until the block ends. Inside another one, the outer map is reused"""
+    current: Optional[IdentityMap] = repository.current_identity_map
+    if current is not None:
+        yield current
+        return None
+
+    identity_map = IdentityMap()
+    token = repository._identity_map.set(identity_map)
+    try:
+        yield identity_map
+    finally:
+        repository._identity_map.reset(token)
+        identity_map.clear()
+
+
+__all__ = [
+    "IdentityMap",
+    "current_identity_map",
+    "open_identity_map",
+]
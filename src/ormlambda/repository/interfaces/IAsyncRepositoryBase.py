@@ -0,0 +1,58 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Iterable, Optional, Sequence, Type, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ormlambda.events import Events
+    from ormlambda.repository.batching import MultiRowStatement, ProgressCallback
+
+
+class IAsyncRepositoryBase(ABC):
+    """Same as 'IRepositoryBase' but every method that talks to the database is awaitable"""
+
+    events: Events
+
+    def __repr__(self) -> str:
+        return f"{IAsyncRepositoryBase.__name__}: {self.__class__.__name__}"
+
+    @abstractmethod
+    async def read_sql[TFlavour: Iterable](self, query: str, flavour: Optional[Type[TFlavour]], params: Optional[Iterable] = None, **kwargs) -> tuple[TFlavour]: ...
+
+    @abstractmethod
+    def stream_sql[TFlavour: Iterable](self, query: str, flavour: Optional[Type[TFlavour]], params: Optional[Iterable] = None, batch_size: int = ..., **kwargs) -> AsyncIterator[tuple[TFlavour, ...]]: ...
+
+    @abstractmethod
+    async def executemany_with_values(self, query: str, values) -> None: ...
+
+    @abstractmethod
+    async def execute_chunks(
+        self,
+        statement: MultiRowStatement,
+        rows: Sequence[Sequence[Any]],
+        *,
+        chunk_size: Optional[int] = None,
+        commit_per_chunk: bool = False,
+        on_chunk: Optional[ProgressCallback] = None,
+    ) -> int: ...
+
+    @abstractmethod
+    async def load_data(self, query: str, *, disable_checks: bool = False) -> int: ...
+
+    @abstractmethod
+    async def execute_with_values(self, query: str, values) -> None: ...
+
+    @abstractmethod
+    async def execute(self, query: str) -> None: ...
+
+    @abstractmethod
+    async def table_exists(self, name: str) -> bool: ...
+
+    @abstractmethod
+    async def database_exists(self, name: str) -> bool: ...
+
+    @abstractmethod
+    async def close(self) -> None: ...
+
+    @property
+    @abstractmethod
+    def database(self) -> Optional[str]: ...
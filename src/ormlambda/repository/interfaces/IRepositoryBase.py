@@ -9,8 +9,14 @@ from typing import (
     Sequence,
     Type,
     Iterable,
+    Iterator,
+    TYPE_CHECKING,
 )
 
+if TYPE_CHECKING:
+    from ormlambda.events import Events
+    from ormlambda.repository.batching import MultiRowStatement, ProgressCallback
+
 
 type _DBAPICursorDescription = Sequence[
     tuple[
@@ -123,15 +129,34 @@ class DBAPIConnection(Protocol):
 
 
 class IRepositoryBase(ABC):
+    events: Events
+
     def __repr__(self) -> str:
         return f"{IRepositoryBase.__name__}: {self.__class__.__name__}"
 
     @abstractmethod
-    def read_sql[TFlavour: Iterable](self, query: str, flavour: Optional[Type[TFlavour]], **kwargs) -> tuple[TFlavour]: ...
+    def read_sql[TFlavour: Iterable](self, query: str, flavour: Optional[Type[TFlavour]], params: Optional[Iterable] = None, **kwargs) -> tuple[TFlavour]: ...
+
+    @abstractmethod
+    def stream_sql[TFlavour: Iterable](self, query: str, flavour: Optional[Type[TFlavour]], params: Optional[Iterable] = None, batch_size: int = ..., **kwargs) -> Iterator[tuple[TFlavour, ...]]: ...
 
     @abstractmethod
     def executemany_with_values(self, query: str, values) -> None: ...
 
+    @abstractmethod
+    def execute_chunks(
+        self,
+        statement: MultiRowStatement,
+        rows: Sequence[Sequence[Any]],
+        *,
+        chunk_size: Optional[int] = None,
+        commit_per_chunk: bool = False,
+        on_chunk: Optional[ProgressCallback] = None,
+    ) -> int: ...
+
+    @abstractmethod
+    def load_data(self, query: str, *, disable_checks: bool = False) -> int: ...
+
     @abstractmethod
     def execute_with_values(self, query: str, values) -> None: ...
 
@@ -1,2 +1,3 @@
 from .IRepositoryBase import IRepositoryBase  # noqa: F401
 from .IDatabaseConnection import IDatabaseConnection  # noqa: F401
+from .IAsyncRepositoryBase import IAsyncRepositoryBase  # noqa: F401
@@ -6,15 +6,19 @@ import shapely as shp
 # Custom libraries
 from ormlambda.sql.clauses import Alias
 from ormlambda import ColumnProxy
+from . import columnar
+from .decoder import DecoderPlan
 
 if TYPE_CHECKING:
     from ormlambda.sql.types import SelectCol
     from ormlambda.sql.clause_info import ClauseInfo
     from ormlambda import Table
     from ormlambda.sql.clauses import Select
+    import numpy as np
+    import pandas as pd
 
 
-type TResponse[TFlavour, *Ts] = TFlavour | tuple[dict[str, tuple[*Ts]]] | tuple[tuple[*Ts]] | tuple[TFlavour]
+type TResponse[TFlavour, *Ts] = TFlavour | tuple[dict[str, tuple[*Ts]]] | tuple[tuple[*Ts]] | tuple[TFlavour] | dict[str, np.ndarray] | pd.DataFrame
 
 
 class Response[TFlavour, *Ts]:
@@ -25,12 +29,14 @@ class Response[TFlavour, *Ts]:
         columns: tuple[str],
         flavour: Type[TFlavour],
         select: Optional[Select] = None,
+        query: Optional[str] = None,
     ) -> None:
         self._dialect: Dialect = dialect
         self._response_values: list[tuple[*Ts]] = response_values
         self._columns: tuple[str] = columns
         self._flavour: Type[TFlavour] = flavour
         self._select: Select = select
+        self._query: Optional[str] = query
 
         self._response_values_index: int = len(self._response_values)
 
@@ -49,6 +55,9 @@ class Response[TFlavour, *Ts]:
         return self._response_values_index > 1
 
     def response(self, **kwargs) -> TResponse[TFlavour, *Ts]:
+        if columnar.is_columnar(self._flavour):
+            return self._cast_to_columns()
+
         if not self.is_there_response:
             return tuple([])
 
@@ -124,22 +133,38 @@ class Response[TFlavour, *Ts]:
         }
         return selector.get(self._flavour, _default)(**kwargs)
 
+    def _cast_to_columns(self) -> dict[str, np.ndarray] | pd.DataFrame:
+        """Build one typed array per column straight from the fetched rows, without creating any intermediate row object"""
+        if self._select is not None:
+            python_types = self._get_decoder_plan().python_types
+        else:
+            python_types = [None] * len(self._columns)
+
+        def parser(value: Any, dtype: Optional[Type]) -> Any:
+            return self._caster.for_value(value, value_type=dtype).from_database
+
+        result = columnar.to_columns(self._columns, self._response_values, python_types, parser)
+
+        if columnar.is_dataframe(self._flavour):
+            return columnar.to_dataframe(result)
+        return result
+
     def _clean_response(self) -> TFlavour:
-        new_response: list[tuple] = []
-        for row in self._response_values:
-            new_row: list = []
-            for i, data in enumerate(row):
-                alias = self._columns[i]
-                clause = self._select[alias]
-                dtype = self.get_python_type(clause)
-                parse_data = self._caster.for_value(data, value_type=dtype).from_database
-                new_row.append(parse_data)
-            new_row = tuple(new_row)
-            if not isinstance(new_row, tuple):
-                new_row = tuple(new_row)
-
-            new_response.append(new_row)
-        return new_response
+        return self._get_decoder_plan().decode(self._response_values)
+
+    def _get_decoder_plan(self) -> DecoderPlan:
+        # COMMENT: the plan is stored next to the compiled statements. The model takes part of the key because two models could map the same table with different types
+        cache = getattr(self._dialect, "compiled_cache", None)
+        key = (DecoderPlan, self._select._table, self._query, self._columns) if cache is not None and self._query is not None else None
+
+        if key is not None and (plan := cache.get(key)) is not None:
+            return plan
+
+        python_types = [self.get_python_type(self._select[alias]) for alias in self._columns]
+        plan = DecoderPlan.from_types(self._caster, self._columns, python_types)
+        if key is not None:
+            cache[key] = plan
+        return plan
 
     @staticmethod
     def _is_parser_required[T: Table](clause_info: ClauseInfo[T]) -> bool:
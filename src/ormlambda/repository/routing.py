@@ -0,0 +1,278 @@
+from __future__ import annotations
+import contextlib
+import contextvars
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Generator, Iterable, Iterator, Literal, Optional, Sequence, Type, TYPE_CHECKING
+
+from ormlambda.repository import IRepositoryBase
+
+if TYPE_CHECKING:
+    from ormlambda.dialects import Dialect
+    from ormlambda.repository.batching import MultiRowStatement, ProgressCallback
+
+
+log = logging.getLogger(__name__)
+
+type ReplicaSelector = Literal["round_robin", "least_in_flight"]
+
+SELECTORS: tuple[ReplicaSelector, ...] = ("round_robin", "least_in_flight")
+
+# COMMENT: names of the DBAPI exceptions raised when the server can't be reached. Any other error is caused by the statement itself
+DISCONNECT_ERRORS: tuple[str, ...] = ("OperationalError", "InterfaceError", "PoolError")
+
+
+class Replica:
+    """Repository of a read replica along with the queries running on it and the moment it can be used again after an ejection"""
+
+    __slots__ = ("repository", "in_flight", "ejected_until")
+
+    def __init__(self, repository: IRepositoryBase) -> None:
+        self.repository = repository
+        self.in_flight: int = 0
+        self.ejected_until: float = 0.0
+
+    def __repr__(self) -> str:
+        return f"{Replica.__name__}(in_flight={self.in_flight}, healthy={self.healthy})"
+
+    @property
+    def healthy(self) -> bool:
+        return time.monotonic() >= self.ejected_until
+
+
+class RoutingRepository(IRepositoryBase):
+    """
+    Repository returned by 'create_engine' when it receives 'replicas'.
+
+    'read_sql' and 'stream_sql' run on a replica picked by 'selector' ('round_robin' or 'least_in_flight'). Everything else,
+    including DDL and metadata queries, runs on the primary, as well as the reads that:
+
+    - pass 'use_primary=True' (i.e. 'select(..., use_primary=True)') or run inside 'with engine.use_primary()'.
+    - run less than 'read_your_writes' seconds after a write from the same thread or asyncio task.
+    - find every replica ejected.
+
+    A replica that can't be reached is ejected for 'eject_for' seconds and the read is retried on the next one, and finally on the primary.
+    Every repository shares the 'events' of the primary, so listeners see the queries no matter where they run.
+    """
+
+    def __init__(
+        self,
+        primary: IRepositoryBase,
+        replicas: Sequence[IRepositoryBase],
+        *,
+        dialect: Optional[Dialect] = None,
+        selector: ReplicaSelector = "round_robin",
+        read_your_writes: float = 0.0,
+        eject_for: float = 30.0,
+    ) -> None:
+        if selector not in SELECTORS:
+            raise ValueError(f"'selector' must be one of {SELECTORS}. You passed '{selector}'")
+
+        self.primary = primary
+        self.replicas: tuple[Replica, ...] = tuple(Replica(x) for x in replicas)
+        self.selector: ReplicaSelector = selector
+        self.read_your_writes: float = float(read_your_writes)
+        self.eject_for: float = float(eject_for)
+
+        self.events = primary.events
+        for replica in self.replicas:
+            replica.repository.events = self.events
+
+        dbapi = getattr(dialect, "dbapi", None)
+        self._disconnect_errors: tuple[Type[BaseException], ...] = (
+            ConnectionError,
+            TimeoutError,
+            *(error for name in DISCONNECT_ERRORS if isinstance(error := getattr(dbapi, name, None), type)),
+        )
+
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
+        self._use_primary: contextvars.ContextVar[bool] = contextvars.ContextVar(f"use_primary_{id(self)}", default=False)
+        self._last_write: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(f"last_write_{id(self)}", default=None)
+
+    def __repr__(self) -> str:
+        return f"{RoutingRepository.__name__}(replicas={len(self.replicas)}, selector={self.selector!r})"
+
+    def __getattr__(self, name: str) -> Any:
+        # COMMENT: methods specific to the dialect (get_connection, pool, ...) belong to the primary
+        if name == "primary":
+            raise AttributeError(name)
+        return getattr(self.primary, name)
+
+    # region routing
+    @contextlib.contextmanager
+    def use_primary(self) -> Generator[None, None, None]:
+        """Run every read inside the block on the primary"""
+        token = self._use_primary.set(True)
+        try:
+            yield None
+        finally:
+            self._use_primary.reset(token)
+
+    def _reads_from_primary(self, use_primary: bool) -> bool:
+        # COMMENT: reads inside a session belong to its transaction, which is open on the primary
+        if use_primary or self._use_primary.get() or not self.replicas or getattr(self.primary, "current_session", None) is not None:
+            return True
+
+        last_write = self._last_write.get()
+        return last_write is not None and time.monotonic() - last_write < self.read_your_writes
+
+    def _choose(self) -> Optional[Replica]:
+        with self._lock:
+            start = next(self._counter)
+            n = len(self.replicas)
+            # COMMENT: rotating the starting point also spreads the ties of 'least_in_flight'
+            candidates = [replica for i in range(n) if (replica := self.replicas[(start + i) % n]).healthy]
+            if not candidates:
+                return None
+
+            if self.selector == "least_in_flight":
+                return min(candidates, key=lambda x: x.in_flight)
+            return candidates[0]
+
+    def _candidates(self, use_primary: bool) -> Iterator[Optional[Replica]]:
+        """Replicas to try one after the other, followed by None which stands for the primary"""
+        if not self._reads_from_primary(use_primary):
+            for _ in self.replicas:
+                replica = self._choose()
+                if replica is None:
+                    break
+                yield replica
+        yield None
+
+    @contextlib.contextmanager
+    def _in_flight(self, replica: Optional[Replica]) -> Generator[None, None, None]:
+        if replica is None:
+            yield None
+            return None
+
+        with self._lock:
+            replica.in_flight += 1
+        try:
+            yield None
+        finally:
+            with self._lock:
+                replica.in_flight -= 1
+
+    def _is_disconnect(self, error: BaseException) -> bool:
+        return isinstance(error, self._disconnect_errors)
+
+    def eject(self, replica: Replica) -> None:
+        """Stop sending reads to 'replica' for 'eject_for' seconds"""
+        replica.ejected_until = time.monotonic() + self.eject_for
+        log.warning(f"Replica ejected for {self.eject_for} seconds: {replica.repository!r}")
+        return None
+
+    def _wrote(self) -> None:
+        if self.read_your_writes > 0:
+            self._last_write.set(time.monotonic())
+        return None
+
+    # endregion
+
+    # region reads
+    def read_sql[TFlavour: Iterable](self, query: str, flavour: Type[TFlavour] = tuple, params: Optional[Iterable] = None, **kwargs) -> tuple[TFlavour]:
+        use_primary: bool = kwargs.pop("use_primary", False)
+
+        for replica in self._candidates(use_primary):
+            if replica is None:
+                return self.primary.read_sql(query, flavour, params, **kwargs)
+            try:
+                with self._in_flight(replica):
+                    return replica.repository.read_sql(query, flavour, params, **kwargs)
+            except Exception as error:
+                if not self._is_disconnect(error):
+                    raise
+                self.eject(replica)
+
+    def stream_sql[TFlavour: Iterable](
+        self,
+        query: str,
+        flavour: Type[TFlavour] = tuple,
+        params: Optional[Iterable] = None,
+        batch_size: int = 1000,
+        **kwargs,
+    ) -> Generator[tuple[TFlavour, ...], None, None]:
+        use_primary: bool = kwargs.pop("use_primary", False)
+
+        for replica in self._candidates(use_primary):
+            repository = self.primary if replica is None else replica.repository
+            started = False
+            try:
+                with self._in_flight(replica), contextlib.closing(repository.stream_sql(query, flavour, params, batch_size, **kwargs)) as batches:
+                    for batch in batches:
+                        started = True
+                        yield batch
+                return None
+            except Exception as error:
+                # COMMENT: once a batch has been yielded the stream can't be resumed on another server
+                if replica is None or started or not self._is_disconnect(error):
+                    raise
+                self.eject(replica)
+
+    # endregion
+
+    # region writes
+    def executemany_with_values(self, query: str, values) -> None:
+        try:
+            return self.primary.executemany_with_values(query, values)
+        finally:
+            self._wrote()
+
+    def execute_chunks(
+        self,
+        statement: MultiRowStatement,
+        rows: Sequence[Sequence[Any]],
+        *,
+        chunk_size: Optional[int] = None,
+        commit_per_chunk: bool = False,
+        on_chunk: Optional[ProgressCallback] = None,
+    ) -> int:
+        try:
+            return self.primary.execute_chunks(statement, rows, chunk_size=chunk_size, commit_per_chunk=commit_per_chunk, on_chunk=on_chunk)
+        finally:
+            self._wrote()
+
+    def load_data(self, query: str, *, disable_checks: bool = False) -> int:
+        try:
+            return self.primary.load_data(query, disable_checks=disable_checks)
+        finally:
+            self._wrote()
+
+    def execute_with_values(self, query: str, values) -> None:
+        try:
+            return self.primary.execute_with_values(query, values)
+        finally:
+            self._wrote()
+
+    def execute(self, query: str) -> None:
+        try:
+            return self.primary.execute(query)
+        finally:
+            self._wrote()
+
+    # endregion
+
+    def table_exists(self, name: str) -> bool:
+        return self.primary.table_exists(name)
+
+    def database_exists(self, name: str) -> bool:
+        return self.primary.database_exists(name)
+
+    @property
+    def database(self) -> Optional[str]:
+        return self.primary.database
+
+    @database.setter
+    def database(self, value: str) -> None:
+        self.primary.database = value
+        for replica in self.replicas:
+            replica.repository.database = value
+
+
+__all__ = [
+    "Replica",
+    "RoutingRepository",
+]
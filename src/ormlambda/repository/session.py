@@ -0,0 +1,165 @@
+from __future__ import annotations
+import contextlib
+from typing import Any, Callable, Generator, Hashable, Optional, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ormlambda.repository import BaseRepository
+    from ormlambda.repository.batching import MultiRowStatement
+
+
+class _PendingWrite:
+    """Values of consecutive deferred calls that share the same statement, in the order they were queued"""
+
+    __slots__ = ("key", "kind", "statement", "rows", "chunk_size")
+
+    def __init__(self, key: Hashable, kind: str, statement: str | MultiRowStatement, chunk_size: Optional[int] = None) -> None:
+        self.key = key
+        self.kind = kind
+        self.statement = statement
+        self.rows: list[Sequence[Any]] = []
+        self.chunk_size = chunk_size
+
+
+class Session[TCnx]:
+    """
+    Unit of work returned by 'engine.session()'.
+
+    Every statement run by the repository in the same thread (or asyncio task) while the session is open reuses its connection
+    and its transaction, which is committed once when the 'with' block ends and rolled back if it raises.
+
+    With 'defer=True', the writes sent through 'execute_with_values', 'executemany_with_values' and 'execute_chunks'
+    (insert, upsert, update and delete) are queued instead. 'flush' sends them in the order they were queued, merging consecutive
+    writes of the same statement, so the rows of back-to-back INSERTs go out in multi-row chunks and the values of back-to-back
+    UPDATEs or DELETEs in a single 'executemany'. Writes are never reordered.
+    The queue is flushed automatically before any read, before any other statement and at the end of the block.
+
+    Callbacks registered with 'after_commit' run after each 'commit' and once the block ends, which is when the writes of the
+    session become visible to everyone else.
+    """
+
+    def __init__(self, repository: BaseRepository, connection: TCnx, defer: bool = False) -> None:
+        self.repository = repository
+        self.connection: TCnx = connection
+        self.defer: bool = defer
+        self._pending: list[_PendingWrite] = []
+        self._flushing: bool = False
+        self._after_commit: dict[Hashable, Callable[[], None]] = {}
+
+    def __repr__(self) -> str:
+        return f"{Session.__name__}(defer={self.defer}, pending={self.pending})"
+
+    @property
+    def deferring(self) -> bool:
+        return self.defer and not self._flushing
+
+    @property
+    def pending(self) -> int:
+        """Number of deferred rows or values waiting to be flushed"""
+        return sum(len(x.rows) for x in self._pending)
+
+    def _queue(self, key: Hashable, kind: str, statement: str | MultiRowStatement, rows: Sequence[Sequence[Any]], chunk_size: Optional[int] = None) -> None:
+        # COMMENT: only the last write can be merged, otherwise the writes queued in between would run after the merged ones
+        if self._pending and self._pending[-1].key == key:
+            pending = self._pending[-1]
+        else:
+            pending = _PendingWrite(key, kind, statement, chunk_size)
+            self._pending.append(pending)
+        pending.rows.extend(rows)
+        return None
+
+    def queue_execute(self, query: str, values: Sequence[Any]) -> None:
+        return self._queue(("many", query), "many", query, [values])
+
+    def queue_executemany(self, query: str, values: Sequence[Sequence[Any]]) -> None:
+        return self._queue(("many", query), "many", query, values)
+
+    def queue_chunks(self, statement: MultiRowStatement, rows: Sequence[Sequence[Any]], chunk_size: Optional[int] = None) -> None:
+        key = ("chunks", statement.head, statement.row, statement.tail, statement.sep)
+        return self._queue(key, "chunks", statement, rows, chunk_size)
+
+    def flush(self) -> int:
+        """Send the deferred writes and return the number of statements (or groups of chunks) sent"""
+        if not self._pending:
+            return 0
+
+        pending, self._pending = self._pending, []
+        self._flushing = True
+        try:
+            for write in pending:
+                if write.kind == "chunks":
+                    self.repository.execute_chunks(write.statement, write.rows, chunk_size=write.chunk_size)
+                elif len(write.rows) == 1:
+                    self.repository.execute_with_values(write.statement, write.rows[0])
+                else:
+                    self.repository.executemany_with_values(write.statement, write.rows)
+        finally:
+            self._flushing = False
+        return len(pending)
+
+    def after_commit(self, key: Hashable, callback: Callable[[], None]) -> None:
+        """Run 'callback' once the current transaction ends. Callbacks registered under the same 'key' only run once"""
+        self._after_commit[key] = callback
+        return None
+
+    def _run_after_commit(self) -> None:
+        callbacks, self._after_commit = self._after_commit, {}
+        for callback in callbacks.values():
+            callback()
+        return None
+
+    def commit(self) -> None:
+        """Flush and commit what has been done so far. The session keeps the connection and starts a new transaction"""
+        self.flush()
+        self.connection.commit()
+        self._run_after_commit()
+        return None
+
+    def rollback(self) -> None:
+        """Discard the deferred writes and roll back the transaction. The session keeps the connection and starts a new one"""
+        self._pending.clear()
+        self.connection.rollback()
+        return None
+
+
+@contextlib.contextmanager
+def open_session[TCnx](repository: BaseRepository, defer: bool = False, identity_map: bool = False) -> Generator[Session[TCnx], None, None]:
+    """
+    Bind a connection of 'repository' to the current context until the block ends. A session opened inside another one joins it,
+    and in that case 'defer' is only taken into account if the outer one didn't defer.
+
+    With 'identity_map=True' an 'IdentityMap' is open for as long as the session, unless one was already open.
+    """
+    current: Optional[Session] = repository.current_session
+    if current is not None:
+        previous = current.defer
+        current.defer = previous or defer
+        try:
+            with repository.identity_map() if identity_map else contextlib.nullcontext():
+                yield current
+            if current.defer and not previous:
+                current.flush()
+        finally:
+            current.defer = previous
+        return None
+
+    # COMMENT: 'get_connection' commits when the block ends and rolls back if it raises
+    session: Optional[Session] = None
+    try:
+        with repository.identity_map() if identity_map else contextlib.nullcontext(), repository.get_connection() as cnx:
+            session = Session(repository, cnx, defer)
+            token = repository._session.set(session)
+            try:
+                yield session
+                session.flush()
+            finally:
+                repository._session.reset(token)
+    finally:
+        # COMMENT: once committed (or rolled back), since readers outside the session may have cached what it was replacing meanwhile
+        if session is not None:
+            session._run_after_commit()
+
+
+__all__ = [
+    "Session",
+    "open_session",
+]
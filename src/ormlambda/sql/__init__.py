@@ -1,12 +1,15 @@
 from .column import Column, ColumnProxy
 from .foreign_key import ForeignKey
-from .table import Table, TableProxy
+from .relationship import Relationship
+from .table import Table, TableProxy, Row
 
 
 __all__ = (
     "Column",
     "ColumnProxy",
     "ForeignKey",
+    "Relationship",
+    "Row",
     "Table",
     "TableProxy",
 )
@@ -0,0 +1,111 @@
+from __future__ import annotations
+import types
+from typing import Any, Hashable, Optional, TYPE_CHECKING
+
+from ormlambda.sql.elements import ClauseElement
+from ormlambda import util
+
+if TYPE_CHECKING:
+    from ormlambda.sql.context import FKChain
+
+
+type CacheKey = tuple[Hashable, ...]
+
+
+class _Uncacheable(Exception):
+    """Raised while walking an element that can not take part of a cache key"""
+
+
+def generate_cache_key(element: Any, literal_binds: bool = True) -> Optional[CacheKey]:
+    """
+    Build a hashable fingerprint that describes the structure of ``element``.
+
+    Two elements with the same fingerprint compile to the same SQL, so the key can be used to look up
+    already compiled statements. Returns ``None`` when some part of the element can not be fingerprinted
+    (i.e. unhashable literal values), in which case the element must always be compiled.
+
+    When ``literal_binds`` is False, the literal operands of comparers are going to be rendered as placeholders,
+    so only their shape (type and number of items) takes part of the key instead of their values.
+
+    The key never contains ``Column`` or ``ColumnProxy`` objects themselves because their ``__eq__`` method
+    returns a ``Comparer`` instead of a bool, which would break dictionary lookups.
+    """
+    try:
+        return _generate_key(element, literal_binds)
+    except _Uncacheable:
+        return None
+
+
+def _path_key(path: FKChain) -> CacheKey:
+    return (path.base, tuple(path.steps))
+
+
+def _bind_shape(value: Any) -> CacheKey:
+    # COMMENT: it must reflect everything that changes the rendered placeholder. See 'Caster.bindparam'
+    if value is None:
+        return (None,)
+    if isinstance(value, tuple | list):
+        return (type(value), tuple(type(x) for x in value))
+    return (type(value),)
+
+
+@util.preload_module(
+    "ormlambda.sql.column",
+    "ormlambda.sql.table",
+    "ormlambda.sql.foreign_key",
+    "ormlambda.sql.comparer",
+    "ormlambda.sql.clauses",
+)
+def _generate_key(obj: Any, literal_binds: bool = True) -> Hashable:
+    ColumnProxy = util.preloaded.sql_column.ColumnProxy
+    Column = util.preloaded.sql_column.Column
+    TableProxy = util.preloaded.sql_table.TableProxy
+    ForeignKey = util.preloaded.sql_foreign_key.ForeignKey
+    Comparer = util.preloaded.sql_comparer.Comparer
+    Seek = util.preloaded.sql_clauses.Seek
+
+    if obj is None or isinstance(obj, type):
+        return obj
+
+    if isinstance(obj, ColumnProxy):
+        column = obj._column
+        return (ColumnProxy, column.table, column.column_name, _path_key(obj.path), _generate_key(obj.alias))
+
+    if isinstance(obj, Comparer) and not literal_binds:
+        operands = tuple(_generate_key(x, literal_binds) if isinstance(x, ClauseElement) else _bind_shape(x) for x in (obj.left_condition, obj.right_condition))
+        return (type(obj), obj.compare, operands, _generate_key(obj._flags), _generate_key(obj.join), _generate_key(obj.alias))
+
+    if isinstance(obj, Seek) and not literal_binds:
+        # COMMENT: every page of a keyset pagination compiles to the same SQL, only the bound values change
+        return (Seek, _generate_key(obj.columns), obj.order_type, tuple(_bind_shape(x) for x in obj.values))
+
+    if isinstance(obj, Column):
+        return (Column, obj.table, obj.column_name)
+
+    if isinstance(obj, TableProxy):
+        return (TableProxy, obj._table_class, _path_key(obj.path))
+
+    if isinstance(obj, ForeignKey):
+        return obj
+
+    if isinstance(obj, list | tuple):
+        return (type(obj), tuple(_generate_key(x, literal_binds) for x in obj))
+
+    if isinstance(obj, types.FunctionType):
+        # COMMENT: lambdas are created again on every call, so we use the code object and the values they capture instead of its identity
+        closure = tuple(_generate_key(cell.cell_contents) for cell in obj.__closure__) if obj.__closure__ else ()
+        return (types.FunctionType, obj.__code__, closure, _generate_key(obj.__defaults__))
+
+    if isinstance(obj, ClauseElement):
+        attrs = getattr(obj, "__dict__", None)
+        if attrs is None:
+            raise _Uncacheable(obj)
+        return (type(obj), tuple((name, _generate_key(value, literal_binds)) for name, value in attrs.items()))
+
+    try:
+        hash(obj)
+    except TypeError:
+        raise _Uncacheable(obj)
+
+    # COMMENT: the type avoids collisions between values that compare equal such as 1, 1.0 and True
+    return (type(obj), obj)
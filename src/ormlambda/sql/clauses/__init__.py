@@ -2,10 +2,12 @@ from .alias import Alias  # noqa: F401
 from .delete import Delete  # noqa: F401
 from .group_by import GroupBy  # noqa: F401
 from .insert import Insert  # noqa: F401
+from .load_data import LoadData  # noqa: F401
 from .joins import JoinSelector  # noqa: F401
 from .limit import Limit  # noqa: F401
 from .offset import Offset  # noqa: F401
 from .order import Order  # noqa: F401
+from .seek import Seek  # noqa: F401
 from .select import Select  # noqa: F401
 from .where import Where  # noqa: F401
 from .having import Having  # noqa: F401
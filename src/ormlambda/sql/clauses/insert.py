@@ -20,6 +20,8 @@ class Insert[T: Table](ClauseElement):
         self.table = type(self.values[0])
 
         self.cleaned_values = []
+        # COMMENT: group of placeholders of one row, filled in by the compiler so that the statement can be repeated for many rows
+        self.row_template: str = ""
 
 
 __all__ = ["Insert"]
@@ -0,0 +1,21 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Sequence, Type, TYPE_CHECKING
+
+from ormlambda.sql.elements import ClauseElement
+
+if TYPE_CHECKING:
+    from ormlambda import Table
+    from ormlambda.sql import Column
+
+
+class LoadData[T: Table](ClauseElement):
+    __visit_name__ = "load_data"
+
+    def __init__(self, table: Type[T], path: str | Path, columns: Sequence[Column]) -> None:
+        self.table: Type[T] = table
+        self.path: Path = Path(path)
+        self.columns: tuple[Column, ...] = tuple(columns)
+
+
+__all__ = ["LoadData"]
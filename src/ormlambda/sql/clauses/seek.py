@@ -0,0 +1,47 @@
+from __future__ import annotations
+import typing as tp
+
+from ormlambda.common.enums import OrderType
+from ormlambda.sql.elements import ClauseElement
+from ormlambda.sql.functions.interface import IFunction
+
+if tp.TYPE_CHECKING:
+    from ormlambda import ColumnProxy
+
+
+class Seek[TProp](ClauseElement, IFunction):
+    """
+    Keyset predicate that keeps the rows placed after 'values' in the order given by 'columns' and 'order_type'.
+
+    It's added to the WHERE clause in place of an OFFSET, so the server starts reading the index right after the last row of the previous page.
+    """
+
+    __visit_name__ = "seek"
+
+    def __init__(
+        self,
+        columns: tp.Sequence[ColumnProxy[TProp]],
+        order_type: tp.Sequence[OrderType],
+        values: tp.Sequence[tp.Any],
+    ) -> None:
+        if not (len(columns) == len(order_type) == len(values)):
+            raise ValueError(f"'{Seek.__name__}' expects the same number of columns, order types and values. You passed {len(columns)}, {len(order_type)} and {len(values)}")
+
+        self.columns: tuple[ColumnProxy[TProp], ...] = tuple(columns)
+        self.order_type: tuple[OrderType, ...] = tuple(OrderType(x) for x in order_type)
+        self.values: tuple[tp.Any, ...] = tuple(values)
+        self.alias = None
+
+    @property
+    def is_uniform(self) -> bool:
+        """True when every column is sorted in the same direction, so the predicate can be written as a single row comparison"""
+        return len(set(self.order_type)) == 1
+
+    def used_columns(self) -> tuple[ColumnProxy[TProp], ...]:
+        return self.columns
+
+    @property
+    def dtype(self) -> tp.Any: ...
+
+
+__all__ = ["Seek"]
@@ -20,12 +20,19 @@ from .metadata import (
     CheckTypes,
     Default,
     NotNull,
+    Deferred,
 )
 
 
+# COMMENT: loaded value of the deferred columns that were modified before being read
+UNLOADED = object()
+
+
 class Column[TProp](ClauseElement):
     __visit_name__ = "column"
     PRIVATE_CHAR: ClassVar[str] = "_"
+    # COMMENT: key of the instance '__dict__' present only in instances fetched from the database. It holds the value each modified column had when loaded
+    CHANGES: ClassVar[str] = "__changes__"
 
     __slots__ = (
         "_dtype",
@@ -36,6 +43,7 @@ class Column[TProp](ClauseElement):
         "is_auto_increment",
         "is_unique",
         "is_not_null",
+        "is_deferred",
         "default_value",
         "sql_type",
         "__private_name",
@@ -57,6 +65,7 @@ class Column[TProp](ClauseElement):
         is_auto_increment: bool = False,
         is_unique: bool = False,
         is_not_null: bool = False,
+        is_deferred: bool = False,
         check_types: bool = True,
         default: Optional[Any] = None,
     ) -> None: ...
@@ -70,6 +79,7 @@ class Column[TProp](ClauseElement):
         is_auto_increment: bool = False,
         is_unique: bool = False,
         is_not_null: bool = False,
+        is_deferred: bool = False,
         check_types: bool = True,
         column_name: Optional[str] = None,
         default: Optional[Any] = None,
@@ -93,6 +103,7 @@ class Column[TProp](ClauseElement):
         self.is_auto_increment: bool = is_auto_increment
         self.is_unique: bool = is_unique
         self.is_not_null: bool = is_not_null
+        self.is_deferred: bool = is_deferred
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}[{type(self.dtype).__name__}] => {self.column_name} {"PK" if self.is_primary_key else ''}"
@@ -117,8 +128,30 @@ class Column[TProp](ClauseElement):
             type_ = self.dtype.python_type
             if not isinstance(value, type_):
                 raise ValueError(f"The '{self.column_name}' Column from '{self.table.__table_name__}' table, expected '{str(self.dtype)}' type. You passed '{type(value).__name__}' type")
+        if self.CHANGES in obj.__dict__:
+            self._track_change(obj, value)
         setattr(obj, self.__private_name, value)
 
+    def _track_change(self, obj: Table, value: Any) -> None:
+        """Remember the loaded value of the column the first time it changes, and forget it if the column gets it back"""
+        changes: Optional[dict[str, Any]] = obj.__dict__[self.CHANGES]
+        name = self.column_name
+
+        if changes is not None and name in changes:
+            original = changes[name]
+            if original is value or (original is not UNLOADED and original == value):
+                del changes[name]
+            return None
+
+        current = obj.__dict__.get(self.__private_name, UNLOADED)
+        if current is value or (current is not UNLOADED and current == value):
+            return None
+
+        if changes is None:
+            changes = obj.__dict__[self.CHANGES] = {}
+        changes[name] = current
+        return None
+
     def __hash__(self) -> int:
         return hash(
             (
@@ -150,6 +183,7 @@ class Column[TProp](ClauseElement):
                 setattr(x, "is_auto_generated", True),
             ),
             NotNull: lambda x, _: setattr(x, "is_not_null", True),
+            Deferred: lambda x, _: setattr(x, "is_deferred", True),
         }
 
         def get_handler(obj_type: ObjType) -> Optional[Callable[[Column, ObjType], None]]:
@@ -43,3 +43,9 @@ class NotNull(Metadata):
     """Marks a column as not-null"""
 
     ...
+
+
+class Deferred(Metadata):
+    """Leaves the column out of the selects of the whole model. It's fetched the first time it's read"""
+
+    ...
@@ -83,6 +83,9 @@ class Compiled:
     string: str = ""
     "The string representation of the ``statement``"
 
+    params: list[Any]
+    "Values bound to the placeholders of ``string``, in the order they appear."
+
     _gen_time: float
     "The time when the statement was generated."
 
@@ -106,6 +109,7 @@ class Compiled:
 
         if statement is not None:
             self.statement = statement
+        self.params = []
         self.string = self.process(self.statement, **kw)
 
     @property
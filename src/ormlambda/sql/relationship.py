@@ -0,0 +1,147 @@
+from __future__ import annotations
+from typing import Any, Callable, Iterable, Iterator, Optional, Type, TYPE_CHECKING
+
+from ormlambda.common.errors import RelationshipNotLoadedError
+
+if TYPE_CHECKING:
+    from ormlambda import Table
+    from ormlambda.sql import ForeignKey
+
+
+class Relationship[TParent: Table, TChild: Table]:
+    """
+    Reverse (one-to-many) side of a 'ForeignKey' declared on the child model.
+
+    >>> class City(Table):
+    >>>     __table_name__ = "city"
+    >>>     city_id: int = Column(int, is_primary_key=True)
+    >>>     addresses = Relationship["City", "Address"](lambda: Address.City)
+
+    Rows of the parent aren't joined with its children. Instead, 'select(load=[City.addresses])' collects the keys of the
+    parents fetched and runs one 'WHERE address.city_id IN (...)' query per 'chunk_size' keys, attaching to each parent the
+    tuple of its children. Accessing the attribute of a parent that wasn't loaded that way raises RelationshipNotLoadedError.
+    """
+
+    __slots__ = (
+        "_foreign_key",
+        "_resolved",
+        "chunk_size",
+        "parent",
+        "name",
+    )
+
+    def __init__(self, foreign_key: Callable[[], ForeignKey[TChild, TParent]], *, chunk_size: int = 1000) -> None:
+        if chunk_size < 1:
+            raise ValueError(f"'chunk_size' must be a positive integer. You passed '{chunk_size}'")
+
+        # COMMENT: the child model usually imports the parent one, so the foreign key is resolved on first use
+        self._foreign_key = foreign_key
+        self._resolved: Optional[tuple[Type[TChild], str, str]] = None
+        self.chunk_size: int = chunk_size
+        self.parent: Optional[Type[TParent]] = None
+        self.name: Optional[str] = None
+
+    def __set_name__(self, owner: Type[TParent], name: str) -> None:
+        self.parent = owner
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"{Relationship.__name__}(parent={self.parent.__name__ if self.parent else None}, name={self.name})"
+
+    def __get__(self, obj: Optional[TParent], objtype=None) -> Relationship[TParent, TChild] | tuple[TChild, ...]:
+        if obj is None:
+            return self
+        try:
+            return obj.__dict__[self.attribute]
+        except KeyError:
+            # COMMENT: an AttributeError would fall back to 'Table.__getattr__', which returns None
+            raise RelationshipNotLoadedError(type(obj).__name__, self.name) from None
+
+    def __set__(self, obj: TParent, value: Iterable[TChild]) -> None:
+        obj.__dict__[self.attribute] = tuple(value)
+        return None
+
+    @property
+    def attribute(self) -> str:
+        return f"__relationship_{self.name}"
+
+    def _resolve(self) -> tuple[Type[TChild], str, str]:
+        if self._resolved is not None:
+            return self._resolved
+
+        foreign_key = self._foreign_key()
+        comparer = foreign_key.resolved_function()
+        left, right = comparer.left_condition, comparer.right_condition
+
+        child: Type[TChild] = foreign_key.tleft
+        # COMMENT: the condition of the foreign key may have been written either way round
+        if left.table is not child:
+            left, right = right, left
+
+        if self.parent is not None and not issubclass(self.parent, foreign_key.tright):
+            raise ValueError(f"'{self.parent.__name__}.{self.name}' must reverse a foreign key that points to '{self.parent.__name__}', not to '{foreign_key.tright.__name__}'")
+
+        self._resolved = (child, left._column.column_name, right._column.column_name)
+        return self._resolved
+
+    @property
+    def child(self) -> Type[TChild]:
+        return self._resolve()[0]
+
+    @property
+    def child_column(self) -> str:
+        """Column of the child that holds the key of the parent"""
+        return self._resolve()[1]
+
+    @property
+    def parent_column(self) -> str:
+        return self._resolve()[2]
+
+    def keys(self, parents: Iterable[TParent]) -> list[Any]:
+        """Distinct non-null keys of 'parents', in order of appearance"""
+        name = self.parent_column
+        return list(dict.fromkeys(key for parent in parents if (key := getattr(parent, name)) is not None))
+
+    def chunks(self, keys: list[Any]) -> Iterator[list[Any]]:
+        for i in range(0, len(keys), self.chunk_size):
+            yield keys[i : i + self.chunk_size]
+
+    def where(self, chunk: list[Any]) -> Callable[[TChild], Any]:
+        name = self.child_column
+        return lambda x: getattr(x, name).contains(chunk)
+
+    def attach(self, parents: Iterable[TParent], children: Iterable[TChild]) -> None:
+        """Group 'children' by the key of their parent and set each group on the parent it belongs to"""
+        groups: dict[Any, list[TChild]] = {}
+        name = self.child_column
+        for child in children:
+            groups.setdefault(getattr(child, name), []).append(child)
+
+        parent_column = self.parent_column
+        attribute = self.attribute
+        for parent in parents:
+            parent.__dict__[attribute] = tuple(groups.get(getattr(parent, parent_column), ()))
+        return None
+
+
+def iter_instances[T: Table](response: Any, table: Type[T]) -> Iterator[T]:
+    """Instances of 'table' found in the response of a select, either alone or inside the tuples of a select of several models"""
+    if isinstance(response, table):
+        yield response
+        return None
+
+    if not isinstance(response, tuple):
+        return None
+
+    for item in response:
+        if isinstance(item, table):
+            yield item
+        elif isinstance(item, tuple):
+            yield from (x for x in item if isinstance(x, table))
+    return None
+
+
+__all__ = [
+    "Relationship",
+    "iter_instances",
+]
@@ -1,2 +1,3 @@
 from .table import Table, TableMeta  # noqa: F401
 from .table_proxy import TableProxy  # noqa: F401
+from .table_row import Row  # noqa: F401
@@ -3,7 +3,6 @@ from typing import Any, Optional, Type, dataclass_transform, TYPE_CHECKING
 import json
 
 from ormlambda.sql.ddl import CreateTable, DropTable
-from ormlambda import util
 from ormlambda.common import DOT
 
 if TYPE_CHECKING:
@@ -11,7 +10,9 @@ if TYPE_CHECKING:
     from ormlambda.dialects import Dialect
     from ormlambda import ForeignKey
 
-from .table_constructor import __init_constructor__
+from ormlambda.sql.column.column import UNLOADED
+from .table_constructor import __init_constructor__, DEFERRED_LOADER, CHANGES
+from .table_metadata import TableMetadata
 
 
 def get_db_table_names(table_name: str) -> tuple[Optional[str], str]:
@@ -50,6 +51,7 @@ class TableMeta(type):
             raise Exception(f"class variable '__table_name__' of '{cls_object.__name__}' class must be 'str'")
 
         self = __init_constructor__(cls_object)
+        self.__table_metadata__ = TableMetadata.from_table(self)
 
         return self
 
@@ -85,12 +87,17 @@ class Table(metaclass=TableMeta):
 
     __table_name__: str = ...
     __db_name__: Optional[str] = None
+    __table_metadata__: TableMetadata
 
     def __str__(self) -> str:
         params = self.to_dict()
         return json.dumps(params, ensure_ascii=False, indent=2)
 
     def __getattr__[T](self, _name: str) -> Column[T]:
+        # COMMENT: deferred columns are missing from '__dict__' until they're read for the first time
+        loader = self.__dict__.get(DEFERRED_LOADER, None)
+        if loader is not None and loader.defers(_name):
+            return loader.load(self, _name)
         return self.__dict__.get(_name, None)
 
     def __repr__(self: "Table") -> str:
@@ -101,7 +108,7 @@ class Table(metaclass=TableMeta):
                 return value[:20] + "..."
             return value
 
-        dicc: dict[str, str] = {x: str(getattr(self, x)) for x in self.__annotations__}
+        dicc: dict[str, str] = {x: str(getattr(self, x)) for x in self.get_metadata().column_map}
         equal_loop = ["=".join((x, __cast_long_variables(y))) for x, y in dicc.items()]
         return f"{self.__class__.__name__}({', '.join(equal_loop)})"
 
@@ -111,6 +118,14 @@ class Table(metaclass=TableMeta):
             return getattr(self, name)
         return None
 
+    def get_changes(self) -> dict[str, Any]:
+        """
+        Columns modified since the instance was fetched from the database, mapped to the value they had.
+        Deferred columns modified before being read map to None. Instances created by hand have no changes.
+        """
+        changes = self.__dict__.get(CHANGES, None) or {}
+        return {name: None if value is UNLOADED else value for name, value in changes.items()}
+
     def to_dict(self) -> dict[str, str | int]:
         def make_hashable(item: Any) -> Any:
             if isinstance(item, dict):
@@ -126,33 +141,31 @@ class Table(metaclass=TableMeta):
             return item
 
         dicc: dict[str, Any] = {}
-        for x in self.__annotations__:
+        for x in self.get_metadata().column_map:
             value = getattr(self, x)
             dicc[x] = make_hashable(value)
         return dicc
 
-    @util.preload_module("ormlambda.sql")
+    @classmethod
+    def get_metadata(cls) -> TableMetadata:
+        # COMMENT: look into the class namespace instead of using getattr to avoid returning the metadata inherited from another model
+        metadata = cls.__dict__.get("__table_metadata__", None)
+        if metadata is None:
+            metadata = TableMetadata.from_table(cls)
+            cls.__table_metadata__ = metadata
+        return metadata
+
     @classmethod
     def get_pk(cls) -> Optional[Column]:
-        Column = util.preloaded.sql_column.Column
-        ColumnProxy = util.preloaded.sql_column.ColumnProxy
-        for obj in cls.__dict__.values():
-            if isinstance(obj, Column | ColumnProxy) and obj.is_primary_key:
-                return obj
-        return None
+        return cls.get_metadata().pk
 
-    @util.preload_module("ormlambda.sql")
     @classmethod
     def get_columns(cls) -> tuple[Column, ...]:
-        Column = util.preloaded.sql_column.Column
-
-        return tuple([x for x in cls.__annotations__.values() if isinstance(x, Column)])
+        return cls.get_metadata().columns
 
     @classmethod
     def get_column[TProp](cls, name: str) -> Column[TProp]:
-        for key, value in cls.__annotations__.items():
-            if name == key:
-                return value
+        return cls.get_metadata().column_map.get(name, None)
 
     @classmethod
     def create_table(cls, dialect: Dialect) -> str:
@@ -174,12 +187,9 @@ class Table(metaclass=TableMeta):
             return f"`{cls.__table_name__}_{column}`"
         return cls.__table_name__
 
-    @util.preload_module("ormlambda.sql")
     @classmethod
     def foreign_keys(cls) -> dict[str, ForeignKey]:
-        ForeignKey = util.preloaded.sql_foreign_key.ForeignKey
-
-        return {key: value for key, value in cls.__dict__.items() if isinstance(value, ForeignKey)}
+        return dict(cls.get_metadata().foreign_keys)
 
     @classmethod
     def copy(cls, **attrs: Any) -> Type["Table"]:
@@ -193,4 +203,6 @@ class Table(metaclass=TableMeta):
 
         for key, value in attrs.items():
             setattr(new_table, key, value)
+
+        new_table.__table_metadata__ = TableMetadata.from_table(new_table)
         return new_table
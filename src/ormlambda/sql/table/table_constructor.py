@@ -1,5 +1,7 @@
-from typing import Any, Type, dataclass_transform
+from typing import Any, Callable, Optional, Type, dataclass_transform
 
+from ormlambda.sql import Column
+from ormlambda.util import LRUCache
 from .fields import get_fields
 
 
@@ -41,3 +43,50 @@ def __init_constructor__[T](cls: Type[T]) -> Type[T]:
 
     setattr(cls, "__init__", init_fn)
     return cls
+
+
+# COMMENT: key of the instance '__dict__' that holds the 'DeferredLoader' of the result it was fetched in
+DEFERRED_LOADER: str = "__deferred_loader__"
+CHANGES: str = Column.CHANGES
+
+# COMMENT: generated constructors are shared by every select that fetches the same columns of a model in the same positions
+_ROW_CONSTRUCTORS: LRUCache[tuple[Type, tuple[tuple[str, Optional[int]], ...]], Callable[[tuple], Any]] = LRUCache(1024)
+
+
+def __row_constructor__[T](cls: Type[T], positions: dict[str, int], deferred: frozenset[str] = frozenset()) -> Callable[[tuple], T]:
+    """
+    Return a function that builds an instance of 'cls' from a row fetched from the database.
+
+    'positions' maps each column name to its index in the row. Columns that weren't selected are set to None, as the generated '__init__' does,
+    except the 'deferred' ones, which are left unset so that reading them for the first time fetches them.
+    Values are trusted, so they're stored straight into the instance without going through 'Column.__set__' and its type checking.
+    Instances are flagged as loaded, so 'Column.__set__' records which columns change from then on.
+    """
+    layout = tuple((column.column_name, positions.get(column.column_name, None)) for column in cls.get_columns() if column.column_name not in deferred)
+    key = (cls, layout)
+
+    constructor = _ROW_CONSTRUCTORS.get(key)
+    if constructor is not None:
+        return constructor
+
+    items = [f"{Column.PRIVATE_CHAR + name!r}: {'None' if index is None else f'row[{index}]'}" for name, index in layout]
+    items.append(f"{Column.CHANGES!r}: None")
+
+    wrapper_fn = "\n".join(
+        [
+            "def wrapper(__new__, cls):",
+            "\tdef __from_row__(row):",
+            "\t\tself = __new__(cls)",
+            f"\t\tself.__dict__.update({{{', '.join(items)}}})",
+            "\t\treturn self",
+            "\treturn __from_row__",
+        ]
+    )
+
+    namespace = {}
+
+    exec(wrapper_fn, None, namespace)
+    constructor = namespace["wrapper"](object.__new__, cls)
+
+    _ROW_CONSTRUCTORS[key] = constructor
+    return constructor
@@ -0,0 +1,88 @@
+from __future__ import annotations
+from types import MappingProxyType
+from typing import Mapping, Optional, Type, TYPE_CHECKING
+
+from ormlambda import util
+
+if TYPE_CHECKING:
+    from ormlambda import Table, ForeignKey
+    from ormlambda.sql import Column
+
+
+class TableMetadata:
+    """
+    Read-only description of the columns and relationships of a 'Table' subclass.
+
+    It's built once per model by 'TableMeta' (and again for each class returned by 'Table.copy') so that the helpers used
+    inside per-row and per-query loops don't need to scan the class namespace with isinstance checks on every call.
+    """
+
+    __slots__ = (
+        "table",
+        "columns",
+        "column_map",
+        "positions",
+        "primary_keys",
+        "auto_generated",
+        "auto_increment",
+        "deferred",
+        "foreign_keys",
+    )
+
+    table: Type[Table]
+    columns: tuple[Column, ...]
+    column_map: Mapping[str, Column]
+    positions: Mapping[str, int]
+    primary_keys: tuple[Column, ...]
+    auto_generated: frozenset[str]
+    auto_increment: frozenset[str]
+    deferred: frozenset[str]
+    foreign_keys: Mapping[str, ForeignKey]
+
+    def __init__(self, table: Type[Table], columns: tuple[Column, ...], foreign_keys: dict[str, ForeignKey]) -> None:
+        setattr_ = super().__setattr__
+
+        setattr_("table", table)
+        setattr_("columns", columns)
+        setattr_("column_map", MappingProxyType({x.column_name: x for x in columns}))
+        setattr_("positions", MappingProxyType({x.column_name: i for i, x in enumerate(columns)}))
+        setattr_("primary_keys", tuple(x for x in columns if x.is_primary_key))
+        setattr_("auto_generated", frozenset(x.column_name for x in columns if x.is_auto_generated))
+        setattr_("auto_increment", frozenset(x.column_name for x in columns if x.is_auto_increment))
+        setattr_("deferred", frozenset(x.column_name for x in columns if x.is_deferred))
+        setattr_("foreign_keys", MappingProxyType(foreign_keys))
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"'{TableMetadata.__name__}' of '{self.table.__name__}' is read-only")
+
+    def __repr__(self) -> str:
+        return f"{TableMetadata.__name__}(table={self.table.__name__}, columns={list(self.column_map)})"
+
+    @property
+    def pk(self) -> Optional[Column]:
+        return self.primary_keys[0] if self.primary_keys else None
+
+    @util.preload_module(
+        "ormlambda.sql.column",
+        "ormlambda.sql.foreign_key",
+    )
+    @classmethod
+    def from_table(cls, table: Type[Table]) -> TableMetadata:
+        Column = util.preloaded.sql_column.Column
+        ForeignKey = util.preloaded.sql_foreign_key.ForeignKey
+
+        columns: dict[str, Column] = {}
+        foreign_keys: dict[str, ForeignKey] = {}
+
+        # COMMENT: walk the MRO so that the classes created by 'Table.copy' (which have an empty namespace) see the columns of the original model
+        for klass in reversed(table.__mro__):
+            namespace = vars(klass)
+            for name, value in namespace.get("__annotations__", {}).items():
+                if isinstance(value, Column):
+                    columns[name] = value
+
+            for name, value in namespace.items():
+                if isinstance(value, ForeignKey):
+                    foreign_keys[name] = value
+
+        return cls(table, tuple(columns.values()), foreign_keys)
@@ -0,0 +1,147 @@
+from __future__ import annotations
+from typing import Any, Callable, Optional, Type, TYPE_CHECKING
+
+from ormlambda.util import LRUCache
+from .table_constructor import __row_constructor__
+
+if TYPE_CHECKING:
+    from .table import Table
+
+
+class Row[T: Table]:
+    """
+    Read-only projection of a model, generated once per model by '__row_projection__'.
+
+    Values live in one slot per column instead of a per-instance '__dict__', so attributes are read by column name as in
+    the model itself while each row takes a fraction of its memory. The hash only depends on the primary key and is computed once,
+    which makes deduplicating large results cheap. Call 'to_model' to get the full 'Table' instance when it's needed.
+    """
+
+    __slots__ = ("_hash",)
+
+    __model__: Type[T]
+    __fields__: tuple[str, ...] = ()
+    __pk__: Optional[str] = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"'{type(self).__name__}' is read-only. Call 'to_model' to get an instance you can modify")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"'{type(self).__name__}' is read-only")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{name}={getattr(self, name)!r}' for name in self.__fields__)})"
+
+    def __getitem__(self, name: str) -> Any:
+        return getattr(self, name) if name in self.__fields__ else None
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return values_of(self) == values_of(other)
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+
+        if self.__pk__ is None:
+            # COMMENT: without a primary key the row is hashed as the model does, by every value
+            value = hash(self.to_model())
+        else:
+            value = hash((self.__model__.__table_name__, getattr(self, self.__pk__)))
+        _HASH_SLOT.__set__(self, value)
+        return value
+
+    def __reduce__(self) -> tuple[Callable[..., Row[T]], tuple[Any, ...]]:
+        # COMMENT: the generated class can't be imported, so the row is rebuilt from its model
+        return __rebuild_row__, (self.__model__, values_of(self))
+
+    def to_dict(self) -> dict[str, Any]:
+        return dict(zip(self.__fields__, values_of(self)))
+
+    def to_model(self) -> T:
+        """Build the full instance of the model from the values of the row"""
+        return __row_constructor__(self.__model__, {name: i for i, name in enumerate(self.__fields__)})(values_of(self))
+
+
+_HASH_SLOT = Row.__dict__["_hash"]
+
+
+def values_of(row: Row) -> tuple[Any, ...]:
+    return tuple(getattr(row, name) for name in row.__fields__)
+
+
+# COMMENT: 'Row' subclasses generated for each model. Models are few, so they're never evicted in practice
+_ROW_PROJECTIONS: LRUCache[Type, Type[Row]] = LRUCache(1024)
+_ROW_PROJECTION_CONSTRUCTORS: LRUCache[tuple[Type, tuple[Optional[int], ...]], Callable[[tuple], Row]] = LRUCache(1024)
+
+
+def __row_projection__[T: Table](cls: Type[T]) -> Type[Row[T]]:
+    """Return the read-only 'Row' class of 'cls', with one slot per column"""
+    projection = _ROW_PROJECTIONS.get(cls)
+    if projection is not None:
+        return projection
+
+    fields = tuple(column.column_name for column in cls.get_columns())
+    pk = cls.get_pk()
+    projection = type(
+        f"{cls.__name__}Row",
+        (Row,),
+        {
+            "__slots__": fields,
+            "__model__": cls,
+            "__fields__": fields,
+            "__pk__": pk.column_name if pk is not None else None,
+            "__module__": cls.__module__,
+            "__qualname__": f"{cls.__qualname__}Row",
+        },
+    )
+    _ROW_PROJECTIONS[cls] = projection
+    return projection
+
+
+def __row_projection_constructor__[T: Table](cls: Type[T], positions: dict[str, int]) -> Callable[[tuple], Row[T]]:
+    """
+    Same as '__row_constructor__' but the function returned builds the 'Row' of 'cls'.
+
+    Slots are filled through their descriptors, which skips the '__setattr__' that makes the row read-only.
+    """
+    projection = __row_projection__(cls)
+    layout = tuple(positions.get(name, None) for name in projection.__fields__)
+    key = (cls, layout)
+
+    constructor = _ROW_PROJECTION_CONSTRUCTORS.get(key)
+    if constructor is not None:
+        return constructor
+
+    setters = {f"_set_{i}": projection.__dict__[name].__set__ for i, name in enumerate(projection.__fields__)}
+    assignments = [f"\t\t_set_{i}(self, {'None' if index is None else f'row[{index}]'})" for i, index in enumerate(layout)]
+
+    wrapper_fn = "\n".join(
+        [
+            f"def wrapper(__new__, cls, {', '.join(setters)}):",
+            "\tdef __from_row__(row):",
+            "\t\tself = __new__(cls)",
+            *assignments,
+            "\t\treturn self",
+            "\treturn __from_row__",
+        ]
+    )
+
+    namespace = {}
+
+    exec(wrapper_fn, None, namespace)
+    constructor = namespace["wrapper"](object.__new__, projection, **setters)
+
+    _ROW_PROJECTION_CONSTRUCTORS[key] = constructor
+    return constructor
+
+
+def __rebuild_row__[T: Table](cls: Type[T], values: tuple[Any, ...]) -> Row[T]:
+    projection = __row_projection__(cls)
+    return __row_projection_constructor__(cls, {name: i for i, name in enumerate(projection.__fields__)})(values)
+
+
+__all__ = ["Row"]
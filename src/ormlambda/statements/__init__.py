@@ -1 +1,4 @@
 from .statements import Statements  # noqa: F401
+from .async_statements import AsyncStatements  # noqa: F401
+from .generative import GenerativeQuery  # noqa: F401
+from .pagination import Page  # noqa: F401
@@ -0,0 +1,276 @@
+from __future__ import annotations
+from typing import Any, AsyncIterator, Callable, Iterable, Optional, Type, TYPE_CHECKING
+
+from ormlambda.sql.types import ASTERISK
+from ormlambda.common.enums import JoinType, OrderType
+from ormlambda.repository import bulk_load as bulk
+from ormlambda.repository.batching import MultiRowStatement
+from ormlambda.sql import clauses
+from ormlambda.sql.relationship import Relationship, iter_instances
+from ormlambda.sql import functions as func
+
+from .base_statement import AsyncClusterResponse
+from .statements import Statements, clear_list, invalidate_cache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from ormlambda import Table
+    from ormlambda.engine.base import AsyncEngine
+    from ormlambda.repository.batching import ProgressCallback
+    from ormlambda.repository.bulk_load import BulkFormat, BulkSource
+    from ormlambda.sql.types import AliasType
+    from ormlambda.statements.pagination import Page
+    from ormlambda.statements.types import OrderTypes, SelectCols, TypeExists
+
+
+class AsyncStatements[T: Table](Statements[T]):
+    """
+    Asyncio mirror of 'Statements' for an 'AsyncEngine'.
+
+    The chainable methods (where, order, join, limit, ...) are inherited as they are, so queries are built by the same
+    'QueryBuilder' and compiled by the same dialect. Only the methods that reach the database are awaitable,
+    and 'stream' returns an asynchronous iterator.
+    """
+
+    _cluster_response = AsyncClusterResponse
+    # COMMENT: reading an attribute can't await, so deferred columns are selected along with the rest
+    _lazy_loads = False
+
+    def __init__(self, model: T, engine: AsyncEngine) -> None:
+        super().__init__(model, engine)
+
+    @property
+    def engine(self) -> AsyncEngine:
+        return self._engine
+
+    async def table_exists(self) -> bool:
+        return await self.engine.repository.table_exists(self._model.__table_name__)
+
+    async def create_table(self, if_exists: TypeExists = "fail") -> None:
+        name: str = self._model.__table_name__
+        if await self.engine.repository.table_exists(name):
+            if if_exists == "replace":
+                await self.drop_table()
+
+            elif if_exists == "fail":
+                raise ValueError(f"Table '{self._model.__table_name__}' already exists")
+
+            elif if_exists == "append":
+                counter: int = 0
+                char: str = ""
+                while await self.engine.repository.table_exists(name + char):
+                    counter += 1
+                    char = f"_{counter}"
+                name += char
+
+                new_model = self._model.copy(__table_name__=name)
+                return new_model.create_table(self.dialect)
+
+        query = self.model.create_table(self.dialect)
+        await self.engine.repository.execute(query)
+        return None
+
+    async def drop_table(self) -> None:
+        q = self.model.drop_table(self.dialect)
+        await self.engine.repository.execute(q)
+        return None
+
+    @clear_list
+    @invalidate_cache
+    async def insert(
+        self,
+        instances: T | list[T],
+        *,
+        chunk_size: Optional[int] = None,
+        commit_per_chunk: bool = False,
+        on_chunk: Optional[ProgressCallback] = None,
+    ) -> None:
+        statement, rows = self._prepare_insert(clauses.Insert(instances))
+        await self.engine.repository.execute_chunks(statement, rows, chunk_size=chunk_size, commit_per_chunk=commit_per_chunk, on_chunk=on_chunk)
+        return None
+
+    @clear_list
+    @invalidate_cache
+    async def upsert(
+        self,
+        instances: T | list[T],
+        *,
+        chunk_size: Optional[int] = None,
+        commit_per_chunk: bool = False,
+        on_chunk: Optional[ProgressCallback] = None,
+    ) -> None:
+        statement, rows = self._prepare_insert(clauses.Upsert(instances))
+        await self.engine.repository.execute_chunks(statement, rows, chunk_size=chunk_size, commit_per_chunk=commit_per_chunk, on_chunk=on_chunk)
+        return None
+
+    @clear_list
+    @invalidate_cache
+    async def delete(
+        self,
+        instances: Optional[T | list[T]] = None,
+        *,
+        chunk_size: Optional[int] = None,
+        commit_per_chunk: bool = False,
+        on_chunk: Optional[ProgressCallback] = None,
+    ) -> None:
+        statement, values = self._prepare_delete(instances)
+        if isinstance(statement, MultiRowStatement):
+            await self.engine.repository.execute_chunks(statement, values, chunk_size=chunk_size, commit_per_chunk=commit_per_chunk, on_chunk=on_chunk)
+            return None
+
+        await self.engine.repository.execute_with_values(statement, values)
+        return None
+
+    @clear_list
+    @invalidate_cache
+    async def update(self, dicc: dict[str, Any] | list[dict[str, Any]]) -> None:
+        query, values = self._prepare_update(dicc)
+        return await self.engine.repository.execute_with_values(query, values)
+
+    @clear_list
+    @invalidate_cache
+    async def flush(self, instances: T | Iterable[T]) -> int:
+        batches = self._prepare_flush(instances)
+        for query, rows, group in batches:
+            await self.engine.repository.executemany_with_values(query, rows)
+            self._flushed(group)
+        return sum(len(group) for _, _, group in batches)
+
+    @clear_list
+    @invalidate_cache
+    async def bulk_load(
+        self,
+        source: BulkSource,
+        *,
+        columns: Optional[Iterable[str]] = None,
+        format: Optional[BulkFormat] = None,
+        disable_checks: bool = False,
+        tmp_dir: Optional[str | Path] = None,
+    ) -> int:
+        rows, selected = self._prepare_bulk_load(source, columns, format)
+
+        async with bulk.async_infile(rows, selected, self.dialect.caster(), tmp_dir) as path:
+            query = self._compile(clauses.LoadData(self.model, path, selected))
+            return await self.engine.repository.load_data(query, disable_checks=disable_checks)
+
+    async def count[TProp](
+        self,
+        selection: Optional[SelectCols[T, TProp] | str] = ASTERISK,
+        alias: AliasType = "count",
+    ) -> Optional[int]:
+        return (await self.select_one(self._count_selector(selection, alias), flavour=dict))[alias]
+
+    async def max[TProp](self, column: SelectCols[T, TProp], alias: AliasType = "max") -> int:
+        return (await self.select_one(self._aggregate_selector(func.Max, column, alias), flavour=dict))[alias]
+
+    async def min[TProp](self, column: SelectCols[T, TProp], alias: AliasType = "min") -> int:
+        return (await self.select_one(self._aggregate_selector(func.Min, column, alias), flavour=dict))[alias]
+
+    async def sum[TProp](self, column: SelectCols[T, TProp], alias: AliasType = "sum") -> int:
+        return (await self.select_one(self._aggregate_selector(func.Sum, column, alias), flavour=dict))[alias]
+
+    @clear_list
+    async def select[TValue, TFlavour, *Ts](
+        self,
+        selector: Optional[tuple[TValue, *Ts]] = None,
+        *,
+        flavour: Optional[Type[TFlavour]] = None,
+        by: JoinType = JoinType.INNER_JOIN,
+        alias: Optional[AliasType[T]] = None,
+        avoid_duplicates: bool = False,
+        only_query: bool = False,
+        load: Iterable[Relationship] = (),
+        defer: Optional[Callable[[T], Any]] = None,
+        load_only: Optional[Callable[[T], Any]] = None,
+        readonly: bool = False,
+        **kwargs,
+    ):
+        if selector is None:
+            selector = lambda x: x  # noqa: E731
+            alias = None
+
+        self._add_select(selector, by, alias, avoid_duplicates, not (flavour or readonly), defer, load_only)
+
+        if only_query:
+            return self.query(sep="\n")
+
+        load = self._check_load(load, flavour, readonly)
+        response = await self._prepare_select(flavour, readonly=readonly).cluster_data()
+
+        for relationship in load:
+            parents = list(iter_instances(response, relationship.parent))
+            children = []
+            for chunk in relationship.chunks(relationship.keys(parents)):
+                children.extend(await AsyncStatements(relationship.child, self._engine).where(relationship.where(chunk)).select())
+            relationship.attach(parents, children)
+        return response
+
+    async def select_one[TValue, TFlavour, *Ts](
+        self,
+        selector: Optional[tuple[TValue, *Ts]] = None,
+        *,
+        flavour: Optional[Type[TFlavour]] = None,
+        by: JoinType = JoinType.INNER_JOIN,
+        **kwargs,
+    ):
+        self.limit(1)
+
+        response = await self.select(selector=selector, flavour=flavour, by=by, **kwargs)
+        return self._first(response, flavour)
+
+    async def first[TValue, TFlavour, *Ts](
+        self,
+        selector: Optional[tuple[TValue, *Ts]] = None,
+        *,
+        flavour: Optional[Type[TFlavour]] = None,
+        by: JoinType = JoinType.INNER_JOIN,
+        **kwargs,
+    ):
+        return await self.select_one(selector=selector, flavour=flavour, by=by, **kwargs)
+
+    @clear_list
+    async def get(self, pk: Any, *, use_primary: bool = False) -> Optional[T]:
+        instance = self._prepare_get(pk)
+        if instance is not None:
+            return instance
+        return await self.select_one(use_primary=use_primary) or None
+
+    @clear_list
+    def stream[TValue, TFlavour, *Ts](
+        self,
+        selector: Optional[tuple[TValue, *Ts]] = None,
+        *,
+        flavour: Optional[Type[TFlavour]] = None,
+        by: JoinType = JoinType.INNER_JOIN,
+        alias: Optional[AliasType[T]] = None,
+        avoid_duplicates: bool = False,
+        batch_size: int = 1000,
+        readonly: bool = False,
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        """Use it with 'async for'. Call 'aclose' on the iterator (or use 'contextlib.aclosing') to give the connection back before the end"""
+        if batch_size < 1:
+            raise ValueError(f"'batch_size' must be a positive integer. You passed '{batch_size}'")
+
+        if selector is None:
+            selector = lambda x: x  # noqa: E731
+
+        self._add_select(selector, by, alias, avoid_duplicates)
+        return self._prepare_select(flavour, readonly=readonly).stream(batch_size, **kwargs)
+
+    @clear_list
+    async def paginate[TKey, TFlavour](
+        self,
+        order_by: Callable[[T], TKey],
+        page_size: int,
+        after: Optional[str] = None,
+        *,
+        selector: Optional[Callable[[T], Any]] = None,
+        flavour: Optional[Type[TFlavour]] = None,
+        order_type: OrderTypes = OrderType.ASC,
+        by: JoinType = JoinType.INNER_JOIN,
+        **kwargs,
+    ) -> Page[T | TFlavour]:
+        keyset, response, items = self._prepare_paginate(order_by, page_size, after, selector, order_type, by)
+        return keyset.page(await response.cluster_data(), page_size, lambda rows: self._page_items(items, rows, flavour, **kwargs))
@@ -1,59 +1,136 @@
 from __future__ import annotations
-from typing import Any, Type, Iterable, Literal, TYPE_CHECKING
+import contextlib
+from typing import Any, AsyncIterator, Callable, Iterator, Optional, Type, Iterable, Literal, TYPE_CHECKING
 from collections import defaultdict
 
 
 from ormlambda import Table
 
 from ormlambda.common.errors import FunctionFunctionError
+from ormlambda.repository import columnar
+from ormlambda.repository.identity_map import current_identity_map
+from .deferred import DeferredLoader
+from ormlambda.sql.table.table_constructor import __row_constructor__
+from ormlambda.sql.table.table_row import __row_projection_constructor__
 from ormlambda import util
 
 
 if TYPE_CHECKING:
-    from ormlambda.engine.base import Engine
+    from ormlambda.engine.base import AsyncEngine, Engine
     from ormlambda.sql.clauses import Select
-    from ormlambda import ColumnProxy
+    from ormlambda.engine.result_cache import ResultCache
 
 
 ORDER_QUERIES = Literal["select", "join", "where", "order", "with", "group by", "limit", "offset"]
 
 
-type ResponseType = Iterable[dict[str, Any]]
+type ResponseType = Iterable[tuple[Any, ...]]
 
 
 class ClusterResponse[T, TFlavour]:
-    def __init__(self, select: Select[T], engine: Engine, flavour: TFlavour, query: str) -> None:
+    def __init__(
+        self,
+        select: Select[T],
+        engine: Engine,
+        flavour: TFlavour,
+        query: str,
+        params: Optional[tuple[Any, ...]] = None,
+        use_primary: bool = False,
+        tables: frozenset[str] = frozenset(),
+        deferred: Optional[dict[Type[Table], frozenset[str]]] = None,
+        readonly: bool = False,
+    ) -> None:
         self._select: Select[T] = select
         self.engine = engine
         self.flavour = flavour
         self.query = query
+        self.params = params
+        self.use_primary = use_primary
+        self.tables = tables
+        self.deferred = deferred or {}
+        self.readonly = readonly
 
-    @util.preload_module("ormlambda.sql.functions")
-    def cluster(self, response_sql: ResponseType) -> tuple[dict[Type[Table], tuple[Table, ...]]]:
-        # We'll create a default list of dicts *once* we know how many rows are in _response_sql
+    @property
+    def _routing(self) -> dict[str, Any]:
+        # COMMENT: only passed when it's set, so repositories without replicas never receive it
+        return {"use_primary": True} if self.use_primary else {}
+
+    @property
+    def _result_cache(self) -> Optional[ResultCache]:
+        """Cache of the engine when this read can use it"""
+        cache: Optional[ResultCache] = getattr(self.engine, "result_cache", None)
+        if cache is None or self.use_primary or not self.tables:
+            return None
 
+        # COMMENT: a session may read its own uncommitted writes, which must neither be served from nor stored in the cache
+        if getattr(self.engine.repository, "current_session", None) is not None:
+            return None
+        return cache
+
+    @property
+    def _database(self) -> Optional[str]:
+        """Database the query runs on. Compiled queries don't name it, so it's part of the key of the cached results"""
+        return getattr(self.engine.repository, "database", None)
+
+    @util.preload_module("ormlambda.sql.functions")
+    def _get_constructors(self) -> tuple[Callable[[tuple], Table], ...]:
+        """Return one generated constructor per model found in the select, in order of appearance"""
         IFunction = util.preloaded.sql_functions.IFunction
 
-        tables: dict[Table, Iterable[ColumnProxy]] = defaultdict(list)
-        for clause in self._select.columns:
+        positions: dict[Type[Table], dict[str, int]] = defaultdict(dict)
+        for i, clause in enumerate(self._select.columns):
             if isinstance(clause, IFunction):
                 raise FunctionFunctionError(clause)
 
-            tables[clause.table].append(clause)
+            positions[clause.table][clause.column_name] = i
+
+        if self.readonly:
+            return tuple(__row_projection_constructor__(table, columns) for table, columns in positions.items())
+
+        identity_map = current_identity_map(self.engine.repository)
+        if identity_map is None:
+            return tuple(__row_constructor__(table, columns, self.deferred.get(table, frozenset())) for table, columns in positions.items())
+
+        constructors = []
+        for table, columns in positions.items():
+            constructor = __row_constructor__(table, columns, self.deferred.get(table, frozenset()))
+            pk = table.get_pk()
+            # COMMENT: partial instances never go into the map, otherwise a later select of every column would return one of them
+            if pk is not None and pk.column_name in columns and len(columns) == len(table.get_columns()):
+                constructor = identity_map.constructor(table, constructor, columns[pk.column_name])
+            constructors.append(constructor)
+        return tuple(constructors)
+
+    def _hydrate(self, constructors: tuple[Callable[[tuple], Table], ...], response_sql: ResponseType) -> list[tuple[Table, ...]]:
+        # COMMENT: the 'tuple' flavour returns the value itself instead of a 1-item tuple when a single column is selected
+        if len(self._select.columns) == 1:
+            response_sql = [(x,) for x in response_sql]
+
+        if len(constructors) == 1:
+            (constructor,) = constructors
+            result = [(constructor(row),) for row in response_sql]
+        else:
+            result = [tuple([constructor(row) for constructor in constructors]) for row in response_sql]
+
+        if self.deferred:
+            self._track_deferred(result)
+        return result
 
-        res = []
-        for dicc_cols in response_sql:
-            converted_row = []
-            for table, columns in tables.items():
-                dicc = {}
-                for col in columns:
-                    if not hasattr(col, "column_name"):
-                        pass
-                    dicc[col.column_name] = dicc_cols[col.alias]
-                converted_row.append(table(**dicc))
-            res.append(tuple(converted_row))
+    def _track_deferred(self, result: list[tuple[Table, ...]]) -> None:
+        """Give the instances of each model with deferred columns a loader shared by the whole result"""
+        for table, columns in self.deferred.items():
+            loader = DeferredLoader(table, self.engine, columns)
+            loader.track(instance for models in result for instance in models if isinstance(instance, table))
+        return None
 
-        tuple_response = tuple(res)
+    def cluster(self, response_sql: ResponseType) -> tuple[dict[Type[Table], tuple[Table, ...]]]:
+        # We'll create a default list of dicts *once* we know how many rows are in _response_sql
+        constructors = self._get_constructors()
+
+        with self.engine.events.hydrating(self._select, self.query, self.params) as event:
+            tuple_response = tuple(self._hydrate(constructors, response_sql))
+            if event:
+                event.hydrated(len(tuple_response))
 
         if not tuple_response:
             return tuple_response
@@ -65,22 +142,139 @@ class ClusterResponse[T, TFlavour]:
             return tuple([x[0] for x in tuple_response])
         return tuple_response
 
+    def hydrate(self, rows: Iterable[tuple[Any, ...]]) -> list[T | tuple[Table, ...]]:
+        """Build the models of rows that hold one value per selected column, as 'stream' yields them"""
+        constructors = self._get_constructors()
+
+        with self.engine.events.hydrating(self._select, self.query, self.params) as event:
+            models = [tuple(constructor(row) for constructor in constructors) for row in rows]
+            if self.deferred:
+                self._track_deferred(models)
+            result = [x[0] if len(x) == 1 else x for x in models]
+            if event:
+                event.hydrated(len(result))
+        return result
+
     def cluster_data(self, **kwargs) -> TFlavour[T, ...]:
         if not self.flavour:
             return self._return_model()
 
         return self._return_flavour(self.flavour, **kwargs)
 
+    def stream(self, batch_size: int, **kwargs) -> Iterator[T | tuple[Table, ...] | TFlavour]:
+        """Yield the rows one by one while they're fetched from the database in chunks of 'batch_size'"""
+        # COMMENT: 'closing' gives the pooled connection back as soon as this generator is closed instead of waiting for the garbage collector
+        if columnar.is_columnar(self.flavour):
+            # COMMENT: columnar flavours yield one set of arrays per batch instead of one item per row
+            with contextlib.closing(self._stream_flavour(self.flavour, batch_size, **kwargs)) as batches:
+                yield from batches
+            return None
+
+        if self.flavour:
+            with contextlib.closing(self._stream_flavour(self.flavour, batch_size, **kwargs)) as batches:
+                for batch in batches:
+                    yield from batch
+            return None
+
+        constructors = self._get_constructors()
+        with contextlib.closing(self._stream_flavour(tuple, batch_size)) as batches:
+            for batch in batches:
+                for row in self._hydrate(constructors, batch):
+                    yield row[0] if len(row) == 1 else row
+        return None
+
+    def _stream_flavour[TValue](self, flavour: Type[TValue], batch_size: int, **kwargs) -> Iterator[tuple[TValue, ...]]:
+        return self.engine.repository.stream_sql(
+            query=self.query,
+            flavour=flavour,
+            params=self.params,
+            batch_size=batch_size,
+            select=self._select,
+            **self._routing,
+            **kwargs,
+        )
+
     def _return_flavour[TValue](self, flavour: Type[TValue], **kwargs) -> tuple[TValue]:
+        cache = self._result_cache
+        # COMMENT: extra arguments are options of the flavour, which aren't part of the key
+        if cache is None or kwargs:
+            return self._read_flavour(flavour, **kwargs)
+        return cache.fetch(self.query, self.params, flavour, self.tables, lambda: self._read_flavour(flavour), self._database)
+
+    def _read_flavour[TValue](self, flavour: Type[TValue], **kwargs) -> tuple[TValue]:
         return self.engine.repository.read_sql(
             query=self.query,
             flavour=flavour,
+            params=self.params,
             select=self._select,
+            **self._routing,
             **kwargs,
         )
 
     def _return_model(self) -> tuple[tuple[T]]:
-        response_sql = self._return_flavour(flavour=dict)
+        response_sql = self._return_flavour(flavour=tuple)
+
+        if response_sql and isinstance(response_sql, Iterable):
+            return self.cluster(response_sql)
+
+        return response_sql
+
+
+class AsyncClusterResponse[T, TFlavour](ClusterResponse[T, TFlavour]):
+    """Same as 'ClusterResponse' for an 'AsyncEngine'. Rows are fetched by awaiting the repository and hydrated with the same constructors"""
+
+    engine: AsyncEngine
+
+    async def cluster_data(self, **kwargs) -> TFlavour[T, ...]:
+        if not self.flavour:
+            return await self._return_model()
+
+        return await self._return_flavour(self.flavour, **kwargs)
+
+    async def stream(self, batch_size: int, **kwargs) -> AsyncIterator[T | tuple[Table, ...] | TFlavour]:
+        if columnar.is_columnar(self.flavour):
+            async with contextlib.aclosing(self._stream_flavour(self.flavour, batch_size, **kwargs)) as batches:
+                async for batch in batches:
+                    yield batch
+            return
+
+        if self.flavour:
+            async with contextlib.aclosing(self._stream_flavour(self.flavour, batch_size, **kwargs)) as batches:
+                async for batch in batches:
+                    for row in batch:
+                        yield row
+            return
+
+        constructors = self._get_constructors()
+        async with contextlib.aclosing(self._stream_flavour(tuple, batch_size)) as batches:
+            async for batch in batches:
+                for row in self._hydrate(constructors, batch):
+                    yield row[0] if len(row) == 1 else row
+
+    async def _return_flavour[TValue](self, flavour: Type[TValue], **kwargs) -> tuple[TValue]:
+        cache = self._result_cache
+        if cache is None or kwargs:
+            return await self._read_flavour(flavour, **kwargs)
+
+        key = cache.key(self.query, self.params, flavour, self._database)
+        hit, result = cache.lookup(key)
+        if not hit:
+            result = await self._read_flavour(flavour)
+            cache.store(key, result, self.tables)
+        return result
+
+    async def _read_flavour[TValue](self, flavour: Type[TValue], **kwargs) -> tuple[TValue]:
+        return await self.engine.repository.read_sql(
+            query=self.query,
+            flavour=flavour,
+            params=self.params,
+            select=self._select,
+            **self._routing,
+            **kwargs,
+        )
+
+    async def _return_model(self) -> tuple[tuple[T]]:
+        response_sql = await self._return_flavour(flavour=tuple)
 
         if response_sql and isinstance(response_sql, Iterable):
             return self.cluster(response_sql)
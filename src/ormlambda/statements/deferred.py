@@ -0,0 +1,90 @@
+from __future__ import annotations
+import threading
+import weakref
+from typing import Any, Iterable, Type, TYPE_CHECKING
+
+from ormlambda import Column
+from ormlambda.sql.table.table_constructor import DEFERRED_LOADER
+from ormlambda import util
+
+if TYPE_CHECKING:
+    from ormlambda import Table
+    from ormlambda.engine.base import Engine
+
+
+class DeferredLoader[T: Table]:
+    """
+    Deferred columns of the instances of 'table' built from the same result.
+
+    The first time one of them is read on any instance, it's fetched along with the primary key for every instance of the result
+    that still lacks it, with one 'WHERE pk IN (...)' query per 'chunk_size' instances, and stored in each of them.
+    """
+
+    __slots__ = (
+        "table",
+        "engine",
+        "columns",
+        "chunk_size",
+        "_instances",
+        "_lock",
+    )
+
+    def __init__(self, table: Type[T], engine: Engine, columns: Iterable[str], chunk_size: int = 1000) -> None:
+        self.table = table
+        self.engine = engine
+        # COMMENT: 'Column.__get__' looks for the private name, which is the one '__getattr__' receives
+        self.columns: dict[str, str] = {Column.PRIVATE_CHAR + name: name for name in columns}
+        self.chunk_size: int = chunk_size
+        self._instances: list[weakref.ref[T]] = []
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"{DeferredLoader.__name__}(table={self.table.__name__}, columns={list(self.columns.values())})"
+
+    def track(self, instances: Iterable[T]) -> None:
+        for instance in instances:
+            instance.__dict__[DEFERRED_LOADER] = self
+            self._instances.append(weakref.ref(instance))
+        return None
+
+    def defers(self, private_name: str) -> bool:
+        return private_name in self.columns
+
+    def load(self, instance: T, private_name: str) -> Any:
+        with self._lock:
+            # COMMENT: another thread may have loaded it while we were waiting for the lock
+            if private_name not in instance.__dict__:
+                self._fetch(private_name)
+        return instance.__dict__.get(private_name, None)
+
+    @util.preload_module("ormlambda.statements")
+    def _fetch(self, private_name: str) -> None:
+        Statements = util.preloaded.statements.Statements
+
+        name = self.columns[private_name]
+        pk = self.table.get_pk().column_name
+        private_pk = Column.PRIVATE_CHAR + pk
+
+        pending: dict[Any, list[T]] = {}
+        for ref in self._instances:
+            instance = ref()
+            if instance is not None and private_name not in instance.__dict__:
+                pending.setdefault(instance.__dict__.get(private_pk, None), []).append(instance)
+        self._instances = [ref for ref in self._instances if ref() is not None]
+
+        keys = [x for x in pending if x is not None]
+        for i in range(0, len(keys), self.chunk_size):
+            chunk = keys[i : i + self.chunk_size]
+            rows = Statements(self.table, self.engine).where(lambda x: getattr(x, pk).contains(chunk)).select(lambda x: (getattr(x, pk), getattr(x, name)), flavour=tuple)
+            for key, value in rows:
+                for instance in pending.get(key, ()):
+                    instance.__dict__[private_name] = value
+
+        # COMMENT: rows deleted since the select are left as None, like the columns that weren't selected
+        for instances in pending.values():
+            for instance in instances:
+                instance.__dict__.setdefault(private_name, None)
+        return None
+
+
+__all__ = ["DeferredLoader"]
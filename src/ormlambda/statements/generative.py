@@ -0,0 +1,161 @@
+from __future__ import annotations
+from functools import partial
+from typing import Any, Callable, Iterator, Optional, Type, TYPE_CHECKING
+
+from ormlambda import OrderType
+from ormlambda.common.enums import UnionEnum
+from ormlambda.common.global_checker import GlobalChecker
+from ormlambda.sql import clauses
+
+from .query_builder import QueryBuilder
+from .statements import Statements
+
+if TYPE_CHECKING:
+    from ormlambda import Table
+    from ormlambda.engine.base import Engine
+    from ormlambda.sql.types import ColumnType
+    from ormlambda.statements.types import OrderTypes, WhereTypes
+
+
+type Step = Callable[[QueryBuilder], None]
+
+
+class GenerativeQuery[T: Table]:
+    """
+    Immutable counterpart of the chainable methods of 'Statements'.
+
+    Each call to where, having, order, groupby, limit or offset returns a new 'GenerativeQuery' that points to its parent
+    and only stores the clause it adds, already resolved. Nothing is ever mutated, so a base query can be built once
+    and shared by many threads:
+
+    >>> spain = ORM(Address, db).generative().where(lambda x: x.City.Country.country == "Spain")
+    >>> spain.where(lambda x: x.address_id > 10).select()
+
+    The methods that reach the database (select, select_one, first, get, count, max, min, sum, stream, paginate, update and delete) replay
+    the chain into a new 'Statements' each time they're called.
+    """
+
+    __slots__ = (
+        "_model",
+        "_engine",
+        "_statements",
+        "_parent",
+        "_step",
+    )
+
+    def __init__(
+        self,
+        model: Type[T],
+        engine: Engine,
+        statements: Type[Statements] = Statements,
+        *,
+        _parent: Optional[GenerativeQuery[T]] = None,
+        _step: Optional[Step] = None,
+    ) -> None:
+        self._model = model
+        self._engine = engine
+        self._statements = statements
+        self._parent = _parent
+        self._step = _step
+
+    def __repr__(self) -> str:
+        return f"<{GenerativeQuery.__name__}: {self._model.__table_name__}>"
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if hasattr(self, "_step"):
+            raise AttributeError(f"'{GenerativeQuery.__name__}' is immutable. Chain a new clause instead of modifying '{name}'")
+        return super().__setattr__(name, value)
+
+    @property
+    def model(self) -> Type[T]:
+        return self._model
+
+    @property
+    def engine(self) -> Engine:
+        return self._engine
+
+    def _add(self, step: Step) -> GenerativeQuery[T]:
+        return GenerativeQuery(self._model, self._engine, self._statements, _parent=self, _step=step)
+
+    def _get_steps(self) -> Iterator[Step]:
+        steps: list[Step] = []
+        node = self
+        while node._step is not None:
+            steps.append(node._step)
+            node = node._parent
+        return reversed(steps)
+
+    def build(self) -> Statements[T]:
+        """Return a new 'Statements' with every clause of the chain already added"""
+        statements = self._statements(self._model, self._engine)
+        for step in self._get_steps():
+            step(statements._query_builder)
+        return statements
+
+    # region chainable methods
+    def where(self, conditions: WhereTypes[T], restrictive: bool = True) -> GenerativeQuery[T]:
+        result = GlobalChecker.resolved_callback_object(self._model, conditions)
+        union = UnionEnum.AND if restrictive else UnionEnum.OR
+        return self._add(partial(QueryBuilder.add_where, comparer=result, union=union))
+
+    def having(self, conditions: ColumnType, restrictive: bool = True) -> GenerativeQuery[T]:
+        result = GlobalChecker.resolved_callback_object(self._model, conditions)
+        union = UnionEnum.AND if restrictive else UnionEnum.OR
+        return self._add(partial(QueryBuilder.add_having, comparer=result, union=union))
+
+    def order[TValue](self, columns: str | Callable[[T], TValue], order_type: OrderTypes = OrderType.ASC) -> GenerativeQuery[T]:
+        return self._add(partial(QueryBuilder.add_statement, clause=Statements._resolve_order(self._model, columns, order_type)))
+
+    def groupby[TProp](self, column: ColumnType[TProp] | Callable[[T], Any]) -> GenerativeQuery[T]:
+        result = GlobalChecker.resolved_callback_object(self._model, column)
+        return self._add(partial(QueryBuilder.add_statement, clause=clauses.GroupBy(*result)))
+
+    def limit(self, number: int) -> GenerativeQuery[T]:
+        return self._add(partial(QueryBuilder.add_statement, clause=clauses.Limit(number=number)))
+
+    def offset(self, number: int) -> GenerativeQuery[T]:
+        return self._add(partial(QueryBuilder.add_statement, clause=clauses.Offset(number=number)))
+
+    # endregion
+
+    # region methods that reach the database
+    def select(self, *args, **kwargs):
+        return self.build().select(*args, **kwargs)
+
+    def select_one(self, *args, **kwargs):
+        return self.build().select_one(*args, **kwargs)
+
+    def first(self, *args, **kwargs):
+        return self.build().first(*args, **kwargs)
+
+    def get(self, *args, **kwargs):
+        return self.build().get(*args, **kwargs)
+
+    def stream(self, *args, **kwargs):
+        return self.build().stream(*args, **kwargs)
+
+    def count(self, *args, **kwargs):
+        return self.build().count(*args, **kwargs)
+
+    def max(self, *args, **kwargs):
+        return self.build().max(*args, **kwargs)
+
+    def min(self, *args, **kwargs):
+        return self.build().min(*args, **kwargs)
+
+    def sum(self, *args, **kwargs):
+        return self.build().sum(*args, **kwargs)
+
+    def paginate(self, *args, **kwargs):
+        return self.build().paginate(*args, **kwargs)
+
+    def update(self, *args, **kwargs):
+        return self.build().update(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        return self.build().delete(*args, **kwargs)
+
+    # endregion
+
+    def query(self, *args, **kwargs) -> str:
+        return self.build().query(*args, **kwargs)
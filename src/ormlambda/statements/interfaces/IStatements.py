@@ -1,9 +1,12 @@
 from __future__ import annotations
-from typing import Any, Callable, Iterable, Optional, Type, overload, TYPE_CHECKING
+from typing import Any, Callable, Iterable, Iterator, Literal, Optional, Type, overload, TYPE_CHECKING
 from abc import abstractmethod
 
 
 if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
     from ormlambda import Table
     from ormlambda.sql.types import TupleJoinType, ColumnType
     from ormlambda.sql.types import compileOptions
@@ -11,6 +14,11 @@ if TYPE_CHECKING:
 
     from ormlambda.sql.clauses.join import JoinContext
     from ormlambda.common.enums import JoinType
+    from ormlambda.repository.batching import ProgressCallback
+    from ormlambda.repository.bulk_load import BulkFormat, BulkSource
+    from pathlib import Path
+    from ormlambda.statements.generative import GenerativeQuery
+    from ormlambda.statements.pagination import Page
 
     from ..types import OrderTypes
     from ..types import Tuple
@@ -47,16 +55,19 @@ class IStatements[T: Table](Element):
         ...
 
     @overload
-    def insert(self, values: list[T]) -> None:
+    def insert(self, values: list[T], *, chunk_size: Optional[int] = ..., commit_per_chunk: bool = ..., on_chunk: Optional[ProgressCallback] = ...) -> None:
         """
         PARAMS
         ------
         - values: Recieves a list of the same objects as the model
+        - chunk_size: maximum number of rows sent in each multi-row statement. By default it adapts to the latency of each chunk
+        - commit_per_chunk: commit after each chunk instead of once at the end. Raises ValueError inside a session
+        - on_chunk: called with a 'ChunkProgress' after each chunk is executed
         """
         ...
 
     @abstractmethod
-    def insert(self, values: T | list[T]) -> None: ...
+    def insert(self, values: T | list[T], *, chunk_size: Optional[int] = ..., commit_per_chunk: bool = ..., on_chunk: Optional[ProgressCallback] = ...) -> None: ...
 
     # endregion
     # region upsert
@@ -70,16 +81,19 @@ class IStatements[T: Table](Element):
         ...
 
     @overload
-    def upsert(self, values: list[T]) -> None:
+    def upsert(self, values: list[T], *, chunk_size: Optional[int] = ..., commit_per_chunk: bool = ..., on_chunk: Optional[ProgressCallback] = ...) -> None:
         """
         PARAMS
         ------
         - values: Recieves a list of the same objects as the model
+        - chunk_size: maximum number of rows sent in each multi-row statement. By default it adapts to the latency of each chunk
+        - commit_per_chunk: commit after each chunk instead of once at the end. Raises ValueError inside a session
+        - on_chunk: called with a 'ChunkProgress' after each chunk is executed
         """
         ...
 
     @abstractmethod
-    def upsert(self, values: list[T]) -> None:
+    def upsert(self, values: T | list[T], *, chunk_size: Optional[int] = ..., commit_per_chunk: bool = ..., on_chunk: Optional[ProgressCallback] = ...) -> None:
         """
         Try to insert new values in the table, if they exist, update them
         """
@@ -110,6 +124,51 @@ class IStatements[T: Table](Element):
     @abstractmethod
     def update(self, dicc) -> None: ...
 
+    # endregion
+    # region flush
+    @abstractmethod
+    def flush(self, instances: T | Iterable[T]) -> int:
+        """
+        Write the columns modified on instances fetched from the database since they were loaded (or last flushed).
+
+        Instances that changed the same columns share one UPDATE that only sets those columns, sent with 'executemany'.
+        Instances without changes, as well as those created by hand, are skipped. Return the number of instances written.
+        Modified auto-generated columns, such as an auto-increment primary key, raise ValueError before anything is sent.
+
+        >>> address = ORM(Address, db).get(1)
+        >>> address.phone = "555-0100"
+        >>> ORM(Address, db).flush([address])
+        """
+        ...
+
+    # endregion
+    # region bulk_load
+    @abstractmethod
+    def bulk_load(
+        self,
+        source: BulkSource,
+        *,
+        columns: Optional[Iterable[str]] = ...,
+        format: Optional[BulkFormat] = ...,
+        disable_checks: bool = ...,
+        tmp_dir: Optional[str | Path] = ...,
+    ) -> int:
+        """
+        Load rows into the table with 'LOAD DATA LOCAL INFILE'. The engine must be created with 'allow_local_infile=True'.
+
+        PARAMS
+        ------
+        - source: model instances, dicts keyed by column name, or the path of a CSV (with header) or NDJSON file
+        - columns: columns to load. By default the CSV header, or every column that is not auto-generated
+        - format: 'csv' or 'ndjson', inferred from the extension of the file when it's None
+        - disable_checks: turn off 'unique_checks' and 'foreign_key_checks' during the load
+        - tmp_dir: directory where the temporary file is written
+
+        Rows are written through the casters of the dialect into a temporary file, which is removed after the load.
+        Return the number of rows loaded.
+        """
+        ...
+
     # endregion
     # region limit
     @abstractmethod
@@ -127,6 +186,7 @@ class IStatements[T: Table](Element):
         self,
         selection: Optional[SelectCols[T, TProp]] = ...,
         alias: AliasType[T] = ...,
+        use_primary: bool = ...,
     ) -> Optional[int]: ...
 
     # endregion
@@ -138,9 +198,9 @@ class IStatements[T: Table](Element):
     def delete(self, instance: T) -> None: ...
 
     @overload
-    def delete(self, instance: list[T]) -> None: ...
+    def delete(self, instance: list[T], *, chunk_size: Optional[int] = ..., commit_per_chunk: bool = ..., on_chunk: Optional[ProgressCallback] = ...) -> None: ...
     @abstractmethod
-    def delete(self, instance: Optional[T | list[T]] = ...) -> None: ...
+    def delete(self, instance: Optional[T | list[T]] = ..., *, chunk_size: Optional[int] = ..., commit_per_chunk: bool = ..., on_chunk: Optional[ProgressCallback] = ...) -> None: ...
 
     # endregion
 
@@ -185,6 +245,7 @@ class IStatements[T: Table](Element):
         self,
         column: SelectCols[T, TProp],
         alias: AliasType[T] = ...,
+        use_primary: bool = ...,
     ) -> int: ...
     # endregion
     # region min
@@ -193,6 +254,7 @@ class IStatements[T: Table](Element):
         self,
         column: SelectCols[T, TProp],
         alias: AliasType[T] = ...,
+        use_primary: bool = ...,
     ) -> int: ...
     # endregion
     # region sum
@@ -201,6 +263,7 @@ class IStatements[T: Table](Element):
         self,
         column: SelectCols[T, TProp],
         alias: AliasType[T] = ...,
+        use_primary: bool = ...,
     ) -> int: ...
 
     @overload
@@ -226,6 +289,10 @@ class IStatements[T: Table](Element):
     def select[*TRes](self, selector: Callable[[T], tuple[*TRes]] = ..., *, flavour: Type[tuple], **kwargs) -> tuple[tuple[*TRes]]: ...
     @overload
     def select[TFlavour](self, selector: Callable[[T], tuple] = ..., *, flavour: Type[TFlavour], **kwargs) -> tuple[TFlavour, ...]: ...
+    @overload
+    def select(self, selector: Callable[[T], Any] = ..., *, flavour: Literal["columns"], **kwargs) -> dict[str, np.ndarray]: ...
+    @overload
+    def select(self, selector: Callable[[T], Any] = ..., *, flavour: Type[pd.DataFrame], **kwargs) -> pd.DataFrame: ...
 
     # FIXME [ ]: select when passing only one element out of the tuple no return tuple[tuple[T,...]] and it should return tuple[T]
 
@@ -240,7 +307,26 @@ class IStatements[T: Table](Element):
         alias=...,
         avoid_duplicates=...,
         only_query=...,
-    ): ...
+        use_primary=...,
+        load=...,
+        defer=...,
+        load_only=...,
+        readonly=...,
+    ):
+        """
+        'use_primary' reads from the primary even if the engine was created with replicas.
+
+        'load' takes relationships declared on the models selected, such as 'City.addresses', and fills them with one
+        'WHERE ... IN (...)' query per chunk of parents instead of one query per parent.
+
+        'defer' leaves out the columns it selects, such as 'lambda x: x.body', on top of those declared with 'is_deferred'.
+        'load_only' leaves out every column of a model but the ones it selects and the primary key. Only models selected
+        whole are affected. The first time a deferred column is read, it's fetched for every instance of the result at once.
+
+        'readonly' returns a 'Row' per model instead of the model itself. Rows keep the values in slots, hash by primary key
+        and can't be modified, which suits large results that are only read. Call 'to_model' on a row to get the model back.
+        """
+        ...
 
     # endregion
     # region select_one
@@ -309,6 +395,90 @@ class IStatements[T: Table](Element):
 
     # endregion
 
+    # region get
+    @abstractmethod
+    def get(self, pk: Any, *, use_primary: bool = False) -> Optional[T]:
+        """
+        Return the instance whose primary key is 'pk', or None if there's no such row.
+
+        Inside 'engine.identity_map()' the instance already loaded is returned without querying the database.
+        """
+        ...
+
+    # endregion
+
+    # region stream
+    @overload
+    def stream(self, *, batch_size: int = ...) -> Iterator[T]: ...
+    @overload
+    def stream[TProp](self, selector: Callable[[T], TProp], *, by: JoinType = ..., batch_size: int = ...) -> Iterator[TProp]: ...
+    @overload
+    def stream[*TRes](self, selector: Callable[[T], tuple[*TRes]], *, by: JoinType = ..., batch_size: int = ...) -> Iterator[tuple[*TRes]]: ...
+    @overload
+    def stream[TFlavour](self, selector: Callable[[T], Any] = ..., *, flavour: Type[TFlavour], by: JoinType = ..., batch_size: int = ..., **kwargs) -> Iterator[TFlavour]: ...
+
+    @abstractmethod
+    def stream(
+        self,
+        selector=...,
+        *,
+        flavour=...,
+        by=...,
+        alias=...,
+        avoid_duplicates=...,
+        batch_size=...,
+        use_primary=...,
+        defer=...,
+        load_only=...,
+        readonly=...,
+    ):
+        """
+        Same as 'select' but the rows are fetched from an unbuffered cursor in batches of 'batch_size' and yielded one by one,
+        so the whole result never lives in memory at once.
+
+        The pooled connection is held until the iterator is exhausted or closed.
+        """
+        ...
+
+    # endregion
+
+    # region paginate
+    @overload
+    def paginate[TKey](self, order_by: Callable[[T], TKey], page_size: int, after: Optional[str] = ..., *, order_type: OrderTypes = ..., by: JoinType = ...) -> Page[T]: ...
+    @overload
+    def paginate[TKey, *TRes](self, order_by: Callable[[T], TKey], page_size: int, after: Optional[str] = ..., *, selector: Callable[[T], tuple[*TRes]], order_type: OrderTypes = ..., by: JoinType = ...) -> Page[tuple[*TRes]]: ...
+    @overload
+    def paginate[TKey, TFlavour](self, order_by: Callable[[T], TKey], page_size: int, after: Optional[str] = ..., *, selector: Callable[[T], Any] = ..., flavour: Type[TFlavour], order_type: OrderTypes = ..., by: JoinType = ...) -> Page[TFlavour]: ...
+
+    @abstractmethod
+    def paginate(
+        self,
+        order_by,
+        page_size,
+        after=...,
+        *,
+        selector=...,
+        flavour=...,
+        order_type=...,
+        by=...,
+        use_primary=...,
+    ):
+        """
+        Keyset (seek) pagination. Return up to 'page_size' rows sorted by 'order_by' along with the token of the next page.
+
+        Instead of an OFFSET, the token passed as 'after' is turned into a predicate over the 'order_by' columns, so the server
+        starts reading right after the last row of the previous page no matter how deep the page is:
+
+        >>> page = ORM(Address, db).paginate(lambda x: (x.last_update, x.address_id), page_size=100)
+        >>> page = ORM(Address, db).paginate(lambda x: (x.last_update, x.address_id), page_size=100, after=page.next)
+
+        'order_by' accepts columns of related tables and 'order_type' one direction for all the columns or one per column.
+        The last column must be unique and none of them nullable: a page whose last row has NULL in any of them raises ValueError.
+        """
+        ...
+
+    # endregion
+
     # region groupby
     @overload
     def groupby[TRepo](self, column: list[SelectCols[T, TRepo]]) -> IStatements[T]: ...
@@ -321,3 +491,16 @@ class IStatements[T: Table](Element):
     def query(self, component: Optional[compileOptions]) -> str: ...
 
     # endregion
+
+    # region generative
+    @abstractmethod
+    def generative(self) -> GenerativeQuery[T]:
+        """
+        Return an immutable query over the same model and engine.
+
+        Its where, having, order, groupby, limit and offset methods return a new query that shares the clauses of its parent,
+        so base queries can be built once and reused concurrently from many threads.
+        """
+        ...
+
+    # endregion
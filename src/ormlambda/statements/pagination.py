@@ -0,0 +1,162 @@
+from __future__ import annotations
+import base64
+import binascii
+import datetime
+import decimal
+import hashlib
+import json
+import uuid
+from typing import Any, Callable, Iterable, NamedTuple, Optional, Sequence, Type, TYPE_CHECKING
+
+from ormlambda import ColumnProxy, OrderType
+from ormlambda.common.errors import InvalidCursorError
+from ormlambda.common.global_checker import GlobalChecker
+from ormlambda.sql import clauses
+
+if TYPE_CHECKING:
+    from ormlambda import Table
+    from ormlambda.statements.types import OrderTypes
+
+
+SEEK_ALIAS: str = "__seek_{index}"
+
+
+class Page[T](NamedTuple):
+    """
+    Rows of a page returned by 'paginate' and the token to pass as 'after' to get the next one.
+    'next' is None on the last page.
+    """
+
+    items: tuple[T, ...]
+    next: Optional[str]
+
+    @property
+    def has_next(self) -> bool:
+        return self.next is not None
+
+
+# COMMENT: the values of the last row are dumped into JSON, so any type returned by the driver that JSON can't represent is tagged with its name
+_ENCODERS: dict[type, tuple[str, Callable[[Any], Any]]] = {
+    decimal.Decimal: ("decimal", str),
+    datetime.datetime: ("datetime", datetime.datetime.isoformat),
+    datetime.date: ("date", datetime.date.isoformat),
+    datetime.time: ("time", datetime.time.isoformat),
+    datetime.timedelta: ("timedelta", lambda x: [x.days, x.seconds, x.microseconds]),
+    bytes: ("bytes", lambda x: base64.b64encode(x).decode("ascii")),
+    bytearray: ("bytes", lambda x: base64.b64encode(x).decode("ascii")),
+    uuid.UUID: ("uuid", str),
+}
+
+_DECODERS: dict[str, Callable[[Any], Any]] = {
+    "decimal": decimal.Decimal,
+    "datetime": datetime.datetime.fromisoformat,
+    "date": datetime.date.fromisoformat,
+    "time": datetime.time.fromisoformat,
+    "timedelta": lambda x: datetime.timedelta(*x),
+    "bytes": base64.b64decode,
+    "uuid": uuid.UUID,
+}
+
+
+def _encode_value(value: Any) -> Any:
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+
+    encoder = _ENCODERS.get(type(value))
+    if encoder is None:
+        raise TypeError(f"The value '{value}' of type '{type(value).__name__}' can't be stored in a pagination cursor")
+
+    name, encode = encoder
+    return {"$": name, "v": encode(value)}
+
+
+def _decode_value(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    return _DECODERS[value["$"]](value["v"])
+
+
+class Keyset[T: Table]:
+    """
+    Columns and directions used by 'paginate' to sort the rows and to build the seek predicate of the next page.
+
+    The token returned with each page holds the values of those columns in the last row, along with a fingerprint of 'order_by',
+    so a token can't be used to continue a pagination sorted by other columns.
+    The last column must be unique (i.e. the primary key) and none of them nullable, otherwise rows with the same values could be skipped.
+    Comparing with NULL matches no row, so a page whose last row has NULL in any of them raises ValueError instead of silently ending the pagination.
+    """
+
+    def __init__(
+        self,
+        model: Type[T],
+        order_by: Callable[[T], Any],
+        order_type: OrderTypes = OrderType.ASC,
+    ) -> None:
+        self.columns: tuple[ColumnProxy, ...] = tuple(GlobalChecker.resolved_callback_object(model, order_by))
+
+        for column in self.columns:
+            if not isinstance(column, ColumnProxy):
+                raise ValueError(f"'order_by' only accepts columns of '{model.__table_name__}' or its related tables. You passed '{type(column).__name__}'")
+
+        if isinstance(order_type, str) or not isinstance(order_type, Iterable):
+            order_type = [order_type] * len(self.columns)
+
+        self.order_type: tuple[OrderType, ...] = tuple(OrderType(x) for x in order_type)
+        if len(self.order_type) != len(self.columns):
+            raise ValueError(f"'order_type' must have one value per column of 'order_by'. Expected {len(self.columns)} but found {len(self.order_type)}")
+
+        spec = ",".join(f"{x.get_full_chain('.')} {y.value}" for x, y in zip(self.columns, self.order_type))
+        self.fingerprint: str = hashlib.blake2s(spec.encode(), digest_size=6).hexdigest()
+
+    def order(self) -> clauses.Order:
+        return clauses.Order(*self.columns, order_type=self.order_type)
+
+    def select_columns(self) -> list[ColumnProxy]:
+        """New proxies of the 'order_by' columns to append to the SELECT, so their alias doesn't clash with the selected ones"""
+        return [ColumnProxy(x._column, x._path, SEEK_ALIAS.format(index=i)) for i, x in enumerate(self.columns)]
+
+    def seek(self, token: str) -> clauses.Seek:
+        return clauses.Seek(self.columns, self.order_type, self.decode(token))
+
+    def encode(self, values: Sequence[Any]) -> str:
+        payload = json.dumps({"k": self.fingerprint, "v": [_encode_value(x) for x in values]}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).rstrip(b"=").decode("ascii")
+
+    def decode(self, token: str) -> tuple[Any, ...]:
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+            fingerprint, values = payload["k"], payload["v"]
+            values = tuple(_decode_value(x) for x in values)
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            raise InvalidCursorError(token, "it's malformed")
+
+        if fingerprint != self.fingerprint or len(values) != len(self.columns):
+            raise InvalidCursorError(token, "it was created for another 'order_by' or 'order_type'")
+        if None in values:
+            raise InvalidCursorError(token, "it holds NULL values, which no row can be sorted after")
+        return values
+
+    def page[TItem](self, rows: Sequence[tuple], page_size: int, to_items: Callable[[list[tuple]], Iterable[TItem]]) -> Page[TItem]:
+        """
+        Split the 'page_size' + 1 rows fetched into the items of the page and the token of the next one.
+        'to_items' receives the rows without the trailing 'order_by' columns.
+        """
+        n = len(self.columns)
+        rows = list(rows[: page_size + 1])
+        has_next = len(rows) > page_size
+        rows = rows[:page_size]
+
+        token = None
+        if has_next:
+            values = rows[-1][-n:]
+            nulls = [column.get_full_chain(".") for column, value in zip(self.columns, values) if value is None]
+            if nulls:
+                raise ValueError(f"Keyset pagination can't continue after a row with NULL in {nulls}. Sort by columns that aren't nullable")
+            token = self.encode(values)
+        return Page(tuple(to_items([row[:-n] for row in rows])), token)
+
+
+__all__ = [
+    "Page",
+    "Keyset",
+]
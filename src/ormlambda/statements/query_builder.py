@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Callable, Generator, Optional, TYPE_CHECKING, Iterable, overload, Concatenate
+from typing import Any, Callable, Generator, Optional, TYPE_CHECKING, Iterable, overload, Concatenate
 from ormlambda.sql.clauses import (
     Select,
     Where,
@@ -13,6 +13,7 @@ from ormlambda.sql.clauses import (
 
 from ormlambda.sql.functions import Count
 from ormlambda.sql.comparer import Comparer, ComparerCluster
+from ormlambda.sql.cache_key import generate_cache_key, CacheKey
 
 
 if TYPE_CHECKING:
@@ -32,9 +33,10 @@ class StandardSQLCompiler:
 
     def __init__(self, dialect: Dialect):
         self.dialect = dialect
+        self.params: list[Any] = []
 
-    def compile(self, components: QueryBuilder, joins: set[JoinSelector], sep: str = " ") -> str:
-        """Compile all components into final SQL"""
+    def compile(self, components: QueryBuilder, joins: set[JoinSelector], sep: str = " ", literal_binds: bool = True) -> str:
+        """Compile all components into final SQL. If 'literal_binds' is False, WHERE and HAVING literals are collected into 'params'"""
         query = []
 
         if components.select:
@@ -42,11 +44,11 @@ class StandardSQLCompiler:
         if joins:
             query.append(self._compile_joins(joins, sep=sep))
         if components.where.comparers:
-            query.append(components.where.compile(self.dialect, sep=sep).string)
+            query.append(self._compile_with_params(components.where, sep=sep, literal_binds=literal_binds))
         if components.group_by:
             query.append(components.group_by.compile(self.dialect).string)
         if components.having.comparers:
-            query.append(components.having.compile(self.dialect, sep=sep).string)
+            query.append(self._compile_with_params(components.having, sep=sep, literal_binds=literal_binds))
         if components.order:
             query.append(components.order.compile(self.dialect).string)
         if components.limit:
@@ -56,6 +58,18 @@ class StandardSQLCompiler:
 
         return sep.join(query)
 
+    def compile_params(self, components: QueryBuilder) -> list[Any]:
+        """Only collect the values that 'compile' would bind, in the same order"""
+        for clause in (components.where, components.having):
+            if clause.comparers:
+                self._compile_with_params(clause, literal_binds=False)
+        return self.params
+
+    def _compile_with_params(self, clause: ClauseElement, **kw: Any) -> str:
+        compiled = clause.compile(self.dialect, **kw)
+        self.params.extend(compiled.params)
+        return compiled.string
+
     @util.preload_module("ormlambda.sql.clauses")
     def _compile_joins(self, joins: set[JoinSelector], sep: str = " ") -> str:
         """Compile JOIN clauses"""
@@ -129,6 +143,7 @@ class QueryBuilder(IQuery):
         "count",
         "join_type",
         "used_columns",
+        "deferred",
     )
 
     def __init__(self):
@@ -148,6 +163,8 @@ class QueryBuilder(IQuery):
 
         self.join_type = JoinType.INNER_JOIN
         self.used_columns = ColumnIterable()
+        # COMMENT: columns left out of the select of each model, fetched the first time they're read
+        self.deferred: dict[type, frozenset[str]] = {}
         return None
 
     def clear(self) -> None:
@@ -234,8 +251,86 @@ class QueryBuilder(IQuery):
         return method(clause)
 
     def query(self, chr: str = " ", dialect: Optional[Dialect] = None) -> str:
+        """Return the SQL with every literal rendered inline"""
+        return self._compile(chr, dialect, literal_binds=True)[0]
+
+    def bind_query(self, chr: str = " ", dialect: Optional[Dialect] = None) -> tuple[str, tuple[Any, ...]]:
+        """Return the SQL with placeholders in place of WHERE and HAVING literals, along with the values to bind"""
+        return self._compile(chr, dialect, literal_binds=False)
+
+    def _compile(self, chr: str, dialect: Optional[Dialect], literal_binds: bool) -> tuple[str, tuple[Any, ...]]:
+        cache = getattr(dialect, "compiled_cache", None)
+        key = self.cache_key(literal_binds) if cache is not None else None
+
+        if key is not None:
+            key = (chr, literal_binds, key)
+            cached = cache.get(key)
+            if cached is not None:
+                query, aliases = cached
+                self._restore_select_aliases(aliases)
+                params = () if literal_binds else tuple(StandardSQLCompiler(dialect).compile_params(self))
+                return query, params
+
         all_joins = self.get_joins(dialect)
-        return StandardSQLCompiler(dialect).compile(self, all_joins, sep=chr)
+        compiler = StandardSQLCompiler(dialect)
+        query = compiler.compile(self, all_joins, sep=chr, literal_binds=literal_binds)
+
+        if key is not None:
+            cache[key] = (query, self._get_select_aliases())
+        return query, tuple(compiler.params)
+
+    def cache_key(self, literal_binds: bool = True) -> Optional[CacheKey]:
+        """
+        Structural fingerprint of every clause added so far.
+
+        It's used to reuse the SQL compiled by a previous QueryBuilder with the same model, FK paths, selected columns, comparison operators and clauses.
+        Values of WHERE and HAVING literals are left out when they are going to be bound ('literal_binds' False).
+        Returns None if any of the clauses cannot be fingerprinted.
+        """
+        structure = generate_cache_key(
+            (
+                self.join_type,
+                self.select,
+                self.order,
+                self.group_by,
+                self.limit,
+                self.offset,
+            )
+        )
+        conditions = generate_cache_key((self.where, self.having), literal_binds)
+
+        if structure is None or conditions is None:
+            return None
+        return (structure, conditions)
+
+    def _get_select_aliases(self) -> tuple[Optional[str], ...]:
+        if not self.select:
+            return ()
+        return tuple(col.alias if isinstance(col, ColumnProxy) else None for col in self.select.columns)
+
+    def _restore_select_aliases(self, aliases: tuple[Optional[str], ...]) -> None:
+        # COMMENT: compiling the select clause resolves the alias of each ColumnProxy and the response relies on them to map the fetched rows.
+        # When we skip the compilation, we need to set them again
+        if not self.select:
+            return None
+
+        for col, alias in zip(self.select.columns, aliases):
+            if isinstance(col, ColumnProxy):
+                col.alias = alias
+        return None
+
+    def tables(self) -> frozenset[str]:
+        """Name of every table the query reads, either selected, filtered or crossed by a join"""
+        names: set[str] = set()
+        for column in self.used_columns:
+            if not isinstance(column, ColumnProxy):
+                continue
+            path = column.path
+            if path.base is not None:
+                names.add(path.base.__table_name__)
+            names.update(step.tright.__table_name__ for step in path.steps if getattr(step, "tright", None) is not None)
+            names.add(column.table.__table_name__)
+        return frozenset(names)
 
     def get_joins(self, dialect) -> set[JoinSelector]:
         # When we applied filters in any table that we wont select any column, we need to add manually all neccessary joins to achieve positive result.
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import inspect
 from typing import Concatenate, Iterable, cast, override, Type, TYPE_CHECKING, Any, Callable, Optional
 
 from ormlambda.sql.types import ASTERISK, compileOptions
@@ -6,6 +7,7 @@ from ormlambda.sql.types import ASTERISK, compileOptions
 from ormlambda.sql.elements import ClauseElement
 
 if TYPE_CHECKING:
+    from pathlib import Path
     from ormlambda.engine.base import Engine
     from ormlambda.sql.types import AliasType
     from ormlambda import Table
@@ -15,18 +17,30 @@ if TYPE_CHECKING:
     from ormlambda.statements.types import TypeExists
     from ormlambda.statements.types import WhereTypes
     from ormlambda.dialects import Dialect
+    from ormlambda.repository.batching import ProgressCallback
+    from ormlambda.repository.bulk_load import BulkFormat, BulkSource
+    from .generative import GenerativeQuery
+    from .pagination import Page
 
 from ormlambda.statements.interfaces import IStatements
 from ormlambda.statements.base_statement import ClusterResponse
-
-from ormlambda import OrderType, Table
+from ormlambda.repository.columnar import is_columnar
+from ormlambda.repository.batching import MultiRowStatement
+from ormlambda.repository import bulk_load as bulk
+from ormlambda.repository.response import Response
+from ormlambda.repository.identity_map import current_identity_map
+from ormlambda.caster import Caster
+
+from ormlambda import Column, ColumnProxy, OrderType, Table
 from ormlambda.common.enums import JoinType, UnionEnum
 from ormlambda.sql.clauses.join import JoinContext, TupleJoinType
 
 from ormlambda.common.global_checker import GlobalChecker
 from .query_builder import QueryBuilder
+from .pagination import Keyset
 
 from ormlambda.sql import clauses
+from ormlambda.sql.relationship import Relationship, iter_instances
 from ormlambda.sql import functions as func
 from ormlambda.common import errors as error
 
@@ -34,6 +48,21 @@ from ormlambda.common import errors as error
 # COMMENT: It's so important to prevent information generated by other tests from being retained in the class.
 @staticmethod
 def clear_list[T, **P](f: Callable[Concatenate[Statements, P], T]) -> Callable[P, T]:
+    if inspect.iscoroutinefunction(f):
+        # COMMENT: the query builder must be cleared once the coroutine finishes, not when it's created
+        async def async_wrapper(self: Statements, *args: P.args, **kwargs: P.kwargs) -> T:
+            try:
+                return await f(self, *args, **kwargs)
+
+            except error.ColumnError as err:
+                err.set_clause(f.__name__)
+                raise
+
+            finally:
+                self._query_builder.clear()
+
+        return async_wrapper
+
     def wrapper(self: Statements, *args: P.args, **kwargs: P.kwargs) -> T:
         try:
             return f(self, *args, **kwargs)
@@ -50,7 +79,32 @@ def clear_list[T, **P](f: Callable[Concatenate[Statements, P], T]) -> Callable[P
     return wrapper
 
 
+def invalidate_cache[T, **P](f: Callable[Concatenate[Statements, P], T]) -> Callable[Concatenate[Statements, P], T]:
+    """Drop the cached results that read the table of the model once the write ends, even if it fails halfway"""
+    if inspect.iscoroutinefunction(f):
+
+        async def async_wrapper(self: Statements, *args: P.args, **kwargs: P.kwargs) -> T:
+            try:
+                return await f(self, *args, **kwargs)
+            finally:
+                self._invalidate()
+
+        return async_wrapper
+
+    def wrapper(self: Statements, *args: P.args, **kwargs: P.kwargs) -> T:
+        try:
+            return f(self, *args, **kwargs)
+        finally:
+            self._invalidate()
+
+    return wrapper
+
+
 class Statements[T: Table](IStatements[T]):
+    _cluster_response: Type[ClusterResponse] = ClusterResponse
+    # COMMENT: whether instances may fetch their deferred columns when they're read
+    _lazy_loads: bool = True
+
     def __init__(self, model: T, engine: Engine) -> None:
         self._query_builder = QueryBuilder()
         self._engine = engine
@@ -114,15 +168,91 @@ class Statements[T: Table](IStatements[T]):
 
     @override
     @clear_list
-    def insert(self, instances: T | list[T]) -> None:
-        insert = clauses.Insert(instances)
-        query = insert.compile(self.dialect).string
-        self.engine.repository.executemany_with_values(query, insert.cleaned_values)
+    @invalidate_cache
+    def insert(
+        self,
+        instances: T | list[T],
+        *,
+        chunk_size: Optional[int] = None,
+        commit_per_chunk: bool = False,
+        on_chunk: Optional[ProgressCallback] = None,
+    ) -> None:
+        statement, rows = self._prepare_insert(clauses.Insert(instances))
+        self.engine.repository.execute_chunks(
+            statement,
+            rows,
+            chunk_size=chunk_size,
+            commit_per_chunk=commit_per_chunk,
+            on_chunk=on_chunk,
+        )
         return None
 
     @override
     @clear_list
-    def delete(self, instances: Optional[T | list[T]] = None) -> None:
+    @invalidate_cache
+    def delete(
+        self,
+        instances: Optional[T | list[T]] = None,
+        *,
+        chunk_size: Optional[int] = None,
+        commit_per_chunk: bool = False,
+        on_chunk: Optional[ProgressCallback] = None,
+    ) -> None:
+        statement, values = self._prepare_delete(instances)
+        if isinstance(statement, MultiRowStatement):
+            self._engine.repository.execute_chunks(
+                statement,
+                values,
+                chunk_size=chunk_size,
+                commit_per_chunk=commit_per_chunk,
+                on_chunk=on_chunk,
+            )
+            return None
+
+        self._engine.repository.execute_with_values(statement, values)
+        # not necessary to call self._query_builder.clear() because select() method already call it
+        return None
+
+    def _compile(self, element: ClauseElement) -> str:
+        with self._engine.events.compiling(element) as event:
+            query = element.compile(self.dialect).string
+            if event:
+                event.compiled(query)
+        return query
+
+    def _prepare_insert(self, insert: clauses.Insert | clauses.Upsert) -> tuple[MultiRowStatement, list[tuple]]:
+        if isinstance(insert, clauses.Upsert):
+            self._expire()
+        query = self._compile(insert)
+        return MultiRowStatement.from_query(query, insert.row_template), insert.cleaned_values
+
+    def _invalidate(self) -> None:
+        cache = getattr(self._engine, "result_cache", None)
+        if cache is None:
+            return None
+
+        cache.invalidate(self.model)
+        # COMMENT: until the session commits, other readers still get the old rows and may cache them again
+        session = getattr(self._engine.repository, "current_session", None)
+        if session is not None:
+            session.after_commit((id(cache), self.model), lambda: cache.invalidate(self.model))
+        return None
+
+    def _expire(self) -> None:
+        # COMMENT: the rows written may belong to instances of the identity map, which would keep returning the old values
+        identity_map = current_identity_map(self._engine.repository)
+        if identity_map is not None:
+            identity_map.expire(self.model)
+        return None
+
+    def _prepare_delete(self, instances: Optional[T | list[T]]) -> tuple[MultiRowStatement, list[tuple]] | tuple[str, tuple]:
+        """
+        Return the statement that deletes 'instances' along with its values.
+
+        When the primary keys are the only condition, the DELETE is compiled for a single one and its placeholder is repeated
+        as many times as primary keys has each chunk. Otherwise the statement goes as it is.
+        """
+        self._expire()
         if instances and not isinstance(instances, Iterable):
             instances = (instances,)
 
@@ -132,28 +262,154 @@ class Statements[T: Table](IStatements[T]):
                 pk = instance.get_pk()
                 pks_values.append(instance[pk])
 
+            if not self._query_builder.where.comparers:
+                first = pks_values[:1]
+                self.where(lambda x: getattr(x, pk.column_name).contains(first))
+
+                delete = clauses.Delete(self.model, self._query_builder.where, None)
+                query = self._compile(delete)
+                return MultiRowStatement.from_query(query, Caster.PLACEHOLDER, last=True), [(x,) for x in pks_values]
+
             self.where(lambda x: getattr(x, pk.column_name).contains(pks_values))
 
         delete = clauses.Delete(self.model, self._query_builder.where, instances)
-        query = delete.compile(self.dialect).string
-        self._engine.repository.execute(query)
-        # not necessary to call self._query_builder.clear() because select() method already call it
-        return None
+        query = self._compile(delete)
+        return query, delete.cleaned_values
 
     @override
     @clear_list
-    def upsert(self, instances: T | list[T]) -> None:
-        upsert = clauses.Upsert(instances)
-        query = upsert.compile(self.dialect).string
-        self._engine.repository.executemany_with_values(query, upsert.cleaned_values)
+    @invalidate_cache
+    def upsert(
+        self,
+        instances: T | list[T],
+        *,
+        chunk_size: Optional[int] = None,
+        commit_per_chunk: bool = False,
+        on_chunk: Optional[ProgressCallback] = None,
+    ) -> None:
+        statement, rows = self._prepare_insert(clauses.Upsert(instances))
+        self._engine.repository.execute_chunks(
+            statement,
+            rows,
+            chunk_size=chunk_size,
+            commit_per_chunk=commit_per_chunk,
+            on_chunk=on_chunk,
+        )
         return None
 
     @override
     @clear_list
+    @invalidate_cache
+    def bulk_load(
+        self,
+        source: BulkSource,
+        *,
+        columns: Optional[Iterable[str]] = None,
+        format: Optional[BulkFormat] = None,
+        disable_checks: bool = False,
+        tmp_dir: Optional[str | Path] = None,
+    ) -> int:
+        rows, selected = self._prepare_bulk_load(source, columns, format)
+
+        with bulk.infile(rows, selected, self.dialect.caster(), tmp_dir) as path:
+            query = self._compile(clauses.LoadData(self.model, path, selected))
+            return self._engine.repository.load_data(query, disable_checks=disable_checks)
+
+    def _prepare_bulk_load(self, source: BulkSource, columns: Optional[Iterable[str]], format: Optional[BulkFormat]) -> tuple[bulk.BulkRows, list[Column]]:
+        self._expire()
+        rows = bulk.read_source(source, format)
+        return rows, self._get_bulk_load_columns(columns if columns is not None else rows.columns)
+
+    def _get_bulk_load_columns(self, names: Optional[Iterable[str]]) -> list[Column]:
+        metadata = self.model.get_metadata()
+        if names is None:
+            return [x for x in metadata.columns if x.column_name not in metadata.auto_generated]
+
+        selected = []
+        for name in names:
+            if name not in metadata.column_map:
+                raise ValueError(f"'{name}' is not a column of '{self.model.__table_name__}'")
+            selected.append(metadata.column_map[name])
+        return selected
+
+    @override
+    @clear_list
+    @invalidate_cache
     def update(self, dicc: dict[str, Any] | list[dict[str, Any]]) -> None:
+        query, values = self._prepare_update(dicc)
+        return self._engine.repository.execute_with_values(query, values)
+
+    def _prepare_update(self, dicc: dict[str, Any] | list[dict[str, Any]]) -> tuple[str, tuple]:
+        self._expire()
         update = clauses.Update(self.model, self._query_builder.where, dicc)
-        query = update.compile(self.dialect).string
-        return self._engine.repository.execute_with_values(query, update.cleaned_values)
+        query = self._compile(update)
+        return query, update.cleaned_values
+
+    @override
+    @clear_list
+    @invalidate_cache
+    def flush(self, instances: T | Iterable[T]) -> int:
+        batches = self._prepare_flush(instances)
+        for query, rows, group in batches:
+            self._engine.repository.executemany_with_values(query, rows)
+            self._flushed(group)
+        return sum(len(group) for _, _, group in batches)
+
+    def _prepare_flush(self, instances: T | Iterable[T]) -> list[tuple[str, list[tuple], list[T]]]:
+        """
+        Return one UPDATE per set of changed columns along with the values of each instance that changed exactly those columns.
+
+        Each UPDATE only sets the changed columns and is compiled once, for the first instance of its group, so the rest
+        go through 'executemany' with the same statement. Rows are found by the primary key they had when loaded.
+        """
+        if isinstance(instances, Table):
+            instances = (instances,)
+
+        pk = self.model.get_pk()
+        if pk is None:
+            raise ValueError(f"'{self.model.__table_name__}' has no primary key")
+
+        metadata = self.model.get_metadata()
+        groups: dict[tuple[str, ...], list[T]] = {}
+        for instance in instances:
+            if not isinstance(instance, self.model):
+                raise TypeError(f"'flush' expects instances of '{self.model.__name__}'. You passed '{type(instance).__name__}'")
+
+            changes = instance.get_changes()
+            # COMMENT: the database sets these columns, so the UPDATE would leave them out and the instance wouldn't match its row
+            generated = [name for name in changes if name in metadata.auto_generated or name in metadata.auto_increment]
+            if generated:
+                raise ValueError(f"'{self.model.__table_name__}' can't flush the auto-generated columns {generated}. Restore their loaded values before flushing")
+
+            names = tuple(x.column_name for x in metadata.columns if x.column_name in changes)
+            if names:
+                groups.setdefault(names, []).append(instance)
+
+        caster = self.dialect.caster()
+        batches = []
+        for names, group in groups.items():
+            first = group[0]
+            key = self._loaded_pk(first, pk.column_name)
+
+            where = clauses.Where()
+            where.add_comparer_tuple(GlobalChecker.resolved_callback_object(self.model, lambda x: getattr(x, pk.column_name) == key), UnionEnum.AND)
+            update = clauses.Update(self.model, where, {name: getattr(first, name) for name in names})
+            query = self._compile(update)
+
+            rows = [(*(caster.for_value(getattr(x, name)).to_database for name in names), self._loaded_pk(x, pk.column_name)) for x in group]
+            batches.append((query, rows, group))
+        return batches
+
+    @staticmethod
+    def _loaded_pk(instance: T, name: str) -> Any:
+        changes = instance.get_changes()
+        return changes[name] if name in changes else getattr(instance, name)
+
+    @staticmethod
+    def _flushed(instances: Iterable[T]) -> None:
+        for instance in instances:
+            instance.__dict__[Column.CHANGES] = None
+        return None
 
     @override
     def limit(self, number: int) -> IStatements[T]:
@@ -173,13 +429,21 @@ class Statements[T: Table](IStatements[T]):
         self,
         selection: Optional[SelectCols[T, TProp] | str] = ASTERISK,
         alias: AliasType = "count",
+        use_primary: bool = False,
     ) -> Optional[int]:
+        return self.select_one(self._count_selector(selection, alias), flavour=dict, use_primary=use_primary)[alias]
+
+    def _count_selector(self, selection: Optional[SelectCols[T, Any] | str], alias: AliasType) -> Callable[[T], func.Count]:
         if selection == ASTERISK:
-            return self.select_one(lambda x: func.Count(x, alias), flavour=dict)[alias]
+            return lambda x: func.Count(x, alias)
 
         # get first position because 'resolved_callback_object' return an, alway Iterable and we should only pass one column
         res = GlobalChecker.resolved_callback_object(self.model, selection)[0]
-        return self.select_one(lambda x: func.Count(res, alias), flavour=dict)[alias]
+        return lambda x: func.Count(res, alias)
+
+    def _aggregate_selector[TFunc](self, function: Callable[[Any, AliasType], TFunc], column: SelectCols[T, Any], alias: AliasType) -> Callable[[T], TFunc]:
+        res = GlobalChecker.resolved_callback_object(self.model, column)[0]
+        return lambda x: function(res, alias)
 
     @override
     def where(self, conditions: WhereTypes[T], restrictive: bool = True) -> IStatements[T]:
@@ -201,46 +465,47 @@ class Statements[T: Table](IStatements[T]):
 
     @override
     def order[TValue](self, columns: str | Callable[[T], TValue], order_type: OrderTypes = OrderType.ASC) -> IStatements[T]:
+        deferred_op = self._resolve_order(self.model, columns, order_type)
+        self._query_builder.add_statement(deferred_op)
+
+        return self
+
+    @staticmethod
+    def _resolve_order[TValue](model: Type[T], columns: str | Callable[[T], TValue], order_type: OrderTypes) -> clauses.Order:
         if isinstance(columns, str):
             callable_func = lambda x: columns  # noqa: E731
         else:
             callable_func = columns
 
-        res = GlobalChecker.resolved_callback_object(self.model, callable_func)
-        deferred_op = clauses.Order(*res, order_type=order_type)
-        self._query_builder.add_statement(deferred_op)
-
-        return self
+        res = GlobalChecker.resolved_callback_object(model, callable_func)
+        return clauses.Order(*res, order_type=order_type)
 
     @override
     def max[TProp](
         self,
         column: SelectCols[T, TProp],
         alias: AliasType = "max",
+        use_primary: bool = False,
     ) -> int:
-        res = GlobalChecker.resolved_callback_object(self.model, column)[0]
-
-        return self.select_one(lambda x: func.Max(res, alias), flavour=dict)[alias]
+        return self.select_one(self._aggregate_selector(func.Max, column, alias), flavour=dict, use_primary=use_primary)[alias]
 
     @override
     def min[TProp](
         self,
         column: SelectCols[T, TProp],
         alias: AliasType = "min",
+        use_primary: bool = False,
     ) -> int:
-        res = GlobalChecker.resolved_callback_object(self.model, column)[0]
-
-        return self.select_one(lambda x: func.Min(res, alias), flavour=dict)[alias]
+        return self.select_one(self._aggregate_selector(func.Min, column, alias), flavour=dict, use_primary=use_primary)[alias]
 
     @override
     def sum[TProp](
         self,
         column: SelectCols[T, TProp],
         alias: AliasType = "sum",
+        use_primary: bool = False,
     ) -> int:
-        res = GlobalChecker.resolved_callback_object(self.model, column)[0]
-
-        return self.select_one(lambda x: func.Sum(res, alias), flavour=dict)[alias]
+        return self.select_one(self._aggregate_selector(func.Sum, column, alias), flavour=dict, use_primary=use_primary)[alias]
 
     @override
     def join[LTable: Table, LProp, RTable: Table, RProp](self, joins: tuple[TupleJoinType[LTable, LProp, RTable, RProp]]) -> JoinContext[tuple[*TupleJoinType[LTable, LProp, RTable, RProp]]]:
@@ -257,37 +522,126 @@ class Statements[T: Table](IStatements[T]):
         alias: Optional[AliasType[T]] = None,
         avoid_duplicates: bool = False,
         only_query: bool = False,
+        use_primary: bool = False,
+        load: Iterable[Relationship] = (),
+        defer: Optional[Callable[[T], Any]] = None,
+        load_only: Optional[Callable[[T], Any]] = None,
+        readonly: bool = False,
         **kwargs,
     ):
         if selector is None:
             # COMMENT: if we do not specify any lambda function we assumed the user want to retreive only elements of the Model itself avoiding other models
-            result = self.select(
-                selector=lambda x: x,
-                flavour=flavour,
-                by=by,
-                avoid_duplicates=avoid_duplicates,
-                only_query=only_query,
-                **kwargs,
-            )
-            return result
-        select_clause = GlobalChecker.resolved_callback_object(self.model, selector)
+            selector = lambda x: x  # noqa: E731
+            alias = None
+
+        self._add_select(selector, by, alias, avoid_duplicates, not (flavour or readonly), defer, load_only)
+
+        if only_query:
+            return self.query(sep="\n")
+
+        load = self._check_load(load, flavour, readonly)
+        response = self._prepare_select(flavour, use_primary, readonly).cluster_data()
+
+        for relationship in load:
+            parents = list(iter_instances(response, relationship.parent))
+            children = []
+            for chunk in relationship.chunks(relationship.keys(parents)):
+                children.extend(type(self)(relationship.child, self._engine).where(relationship.where(chunk)).select(use_primary=use_primary))
+            relationship.attach(parents, children)
+        return response
+
+    @staticmethod
+    def _check_load(load: Iterable[Relationship], flavour: Optional[Type], readonly: bool = False) -> tuple[Relationship, ...]:
+        load = tuple(load)
+        if not load:
+            return load
+
+        if flavour or readonly:
+            raise ValueError("'load' attaches the related rows to the models selected, so it can't be combined with 'flavour' or 'readonly'")
+
+        for relationship in load:
+            if not isinstance(relationship, Relationship):
+                raise TypeError(f"'load' expects the relationships declared on the models, such as 'City.addresses'. You passed '{relationship!r}'")
+        return load
+
+    def _add_select(
+        self,
+        selector: tuple[Any, ...] | Callable[[T], Any],
+        by: JoinType,
+        alias: Optional[AliasType[T]],
+        avoid_duplicates: bool,
+        deferrable: bool = False,
+        defer: Optional[Callable[[T], Any]] = None,
+        load_only: Optional[Callable[[T], Any]] = None,
+    ) -> None:
+        columns = GlobalChecker.resolved_callback_object(self.model, selector)
+        if not deferrable:
+            if defer is not None or load_only is not None:
+                raise ValueError("'defer' and 'load_only' need models that fetch the columns left out, so they can't be combined with 'flavour' or 'readonly'")
+        elif self._lazy_loads:
+            columns = self._defer_columns(columns, defer, load_only)
+        # COMMENT: otherwise ('AsyncStatements') both are ignored and every column is selected, since reading one can't await its query
 
         select = clauses.Select(
             table=self.model,
-            columns=select_clause,
+            columns=columns,
             alias=alias,
             avoid_duplicates=avoid_duplicates,
         )
 
         self._query_builder.add_statement(select)
-
         self._query_builder.by = by
+        return None
 
-        if only_query:
-            return self.query(sep="\n")
+    def _defer_columns(self, columns: list[Any], defer: Optional[Callable[[T], Any]], load_only: Optional[Callable[[T], Any]]) -> list[Any]:
+        """
+        Leave out of 'columns' the deferred columns of the models selected whole and record them in the query builder.
+
+        A model defers the columns marked with 'is_deferred' and those passed in 'defer'. If 'load_only' names any of its columns,
+        every other one is deferred instead. Models selected partially or without a primary key are left as they are,
+        and the primary key is never deferred since it's what fetches the rest later.
+        """
+        selected: dict[Type[Table], set[str]] = {}
+        for column in columns:
+            if isinstance(column, ColumnProxy):
+                selected.setdefault(column.table, set()).add(column.column_name)
+
+        to_defer = {(x.table, x.column_name) for x in self._resolve_columns(defer)}
+        to_load = {(x.table, x.column_name) for x in self._resolve_columns(load_only)}
+
+        deferred: dict[Type[Table], frozenset[str]] = {}
+        for table, names in selected.items():
+            pk = table.get_pk()
+            if pk is None or names != {x.column_name for x in table.get_columns()}:
+                continue
+
+            only = {name for t, name in to_load if t is table}
+            if only:
+                skipped = names - only
+            else:
+                skipped = set(table.__table_metadata__.deferred) | {name for t, name in to_defer if t is table}
+            skipped.discard(pk.column_name)
+            if skipped:
+                deferred[table] = frozenset(skipped)
+
+        if not deferred:
+            return columns
+
+        self._query_builder.deferred = deferred
+        return [x for x in columns if not (isinstance(x, ColumnProxy) and x.column_name in deferred.get(x.table, ()))]
+
+    def _resolve_columns(self, selector: Optional[Callable[[T], Any]]) -> list[ColumnProxy]:
+        if selector is None:
+            return []
+        return [x for x in GlobalChecker.resolved_callback_object(self.model, selector) if isinstance(x, ColumnProxy)]
 
-        query = self.query()
-        return ClusterResponse(select, self._engine, flavour, query).cluster_data()
+    def _prepare_select[TFlavour](self, flavour: Optional[Type[TFlavour]], use_primary: bool = False, readonly: bool = False) -> ClusterResponse[T, TFlavour]:
+        with self._engine.events.compiling(self._query_builder) as event:
+            query, params = self._query_builder.bind_query(" ", self._dialect)
+            if event:
+                event.compiled(query, params)
+        tables = self._query_builder.tables() | {self.model.__table_name__}
+        return self._cluster_response(self._query_builder.select, self._engine, flavour, query.strip(), params, use_primary, tables, self._query_builder.deferred, readonly)
 
     @override
     def select_one[TValue, TFlavour, *Ts](
@@ -301,8 +655,35 @@ class Statements[T: Table](IStatements[T]):
         self.limit(1)
 
         response = self.select(selector=selector, flavour=flavour, by=by, **kwargs)
+        return self._first(response, flavour)
 
-        if not isinstance(response, Iterable):
+    @override
+    @clear_list
+    def get(self, pk: Any, *, use_primary: bool = False) -> Optional[T]:
+        instance = self._prepare_get(pk)
+        if instance is not None:
+            return instance
+        return self.select_one(use_primary=use_primary) or None
+
+    def _prepare_get(self, pk: Any) -> Optional[T]:
+        """Return the instance of the identity map for 'pk' or, when there's none, filter the query by it"""
+        column = self.model.get_pk()
+        if column is None:
+            raise ValueError(f"'{self.model.__table_name__}' has no primary key")
+
+        identity_map = current_identity_map(self._engine.repository)
+        # COMMENT: with other conditions the row could be filtered out, so the database has the last word
+        if identity_map is not None and not self._query_builder.where.comparers:
+            instance = identity_map.get(self.model, pk)
+            if instance is not None:
+                return instance
+
+        self.where(lambda x: getattr(x, column.column_name) == pk)
+        return None
+
+    @staticmethod
+    def _first[TFlavour](response: Any, flavour: Optional[Type[TFlavour]]) -> Any:
+        if not isinstance(response, Iterable) or is_columnar(flavour):
             return response
         if flavour:
             return response[0] if response else None
@@ -330,6 +711,97 @@ class Statements[T: Table](IStatements[T]):
             **kwargs,
         )
 
+    @override
+    @clear_list
+    def stream[TValue, TFlavour, *Ts](
+        self,
+        selector: Optional[tuple[TValue, *Ts]] = None,
+        *,
+        flavour: Optional[Type[TFlavour]] = None,
+        by: JoinType = JoinType.INNER_JOIN,
+        alias: Optional[AliasType[T]] = None,
+        avoid_duplicates: bool = False,
+        batch_size: int = 1000,
+        use_primary: bool = False,
+        defer: Optional[Callable[[T], Any]] = None,
+        load_only: Optional[Callable[[T], Any]] = None,
+        readonly: bool = False,
+        **kwargs,
+    ):
+        if batch_size < 1:
+            raise ValueError(f"'batch_size' must be a positive integer. You passed '{batch_size}'")
+
+        if selector is None:
+            selector = lambda x: x  # noqa: E731
+
+        self._add_select(selector, by, alias, avoid_duplicates, not (flavour or readonly), defer, load_only)
+
+        # COMMENT: the query must be compiled right now because 'clear_list' empties the query builder as soon as we return the iterator
+        return self._prepare_select(flavour, use_primary, readonly).stream(batch_size, **kwargs)
+
+    @override
+    @clear_list
+    def paginate[TKey, TFlavour](
+        self,
+        order_by: Callable[[T], TKey],
+        page_size: int,
+        after: Optional[str] = None,
+        *,
+        selector: Optional[Callable[[T], Any]] = None,
+        flavour: Optional[Type[TFlavour]] = None,
+        order_type: OrderTypes = OrderType.ASC,
+        by: JoinType = JoinType.INNER_JOIN,
+        use_primary: bool = False,
+        **kwargs,
+    ) -> Page[T | TFlavour]:
+        keyset, response, items = self._prepare_paginate(order_by, page_size, after, selector, order_type, by, use_primary)
+        return keyset.page(response.cluster_data(), page_size, lambda rows: self._page_items(items, rows, flavour, **kwargs))
+
+    def _prepare_paginate(
+        self,
+        order_by: Callable[[T], Any],
+        page_size: int,
+        after: Optional[str],
+        selector: Optional[Callable[[T], Any]],
+        order_type: OrderTypes,
+        by: JoinType,
+        use_primary: bool = False,
+    ) -> tuple[Keyset[T], ClusterResponse[T, tuple], ClusterResponse[T, None]]:
+        """
+        Return the keyset along with the response that fetches 'page_size' + 1 rows and the one that builds the items of the page.
+
+        The 'order_by' columns are appended to the selected ones, so the token can be built even when they belong to a related table
+        or weren't selected. One extra row tells whether there's a next page without running a COUNT.
+        """
+        if page_size < 1:
+            raise ValueError(f"'page_size' must be a positive integer. You passed '{page_size}'")
+
+        keyset = Keyset(self.model, order_by, order_type)
+
+        if after is not None:
+            self._query_builder.add_where([keyset.seek(after)], UnionEnum.AND)
+        self._query_builder.add_statement(keyset.order())
+        self._query_builder.add_statement(clauses.Limit(number=page_size + 1))
+
+        if selector is None:
+            selector = lambda x: x  # noqa: E731
+
+        columns = list(GlobalChecker.resolved_callback_object(self.model, selector))
+        self._query_builder.add_statement(clauses.Select(self.model, columns=[*columns, *keyset.select_columns()]))
+        self._query_builder.by = by
+
+        response = self._prepare_select(tuple, use_primary)
+        items = self._cluster_response(clauses.Select(self.model, columns=columns), self._engine, None, response.query, response.params)
+        return keyset, response, items
+
+    def _page_items[TFlavour](self, items: ClusterResponse[T, None], rows: list[tuple], flavour: Optional[Type[TFlavour]], **kwargs) -> Iterable[T | TFlavour]:
+        if not flavour:
+            return items.hydrate(rows)
+
+        # COMMENT: rows were already decoded when they were fetched, so they're only cast into the flavour
+        names = tuple(x.alias for x in items._select.columns)
+        return Response(self.dialect, rows, names, flavour).response(**kwargs)
+
     @override
     def groupby[TProp](self, column: ColumnType[TProp] | Callable[[T], Any]) -> IStatements[T]:
         result = GlobalChecker.resolved_callback_object(self.model, column)
@@ -337,6 +809,13 @@ class Statements[T: Table](IStatements[T]):
         self._query_builder.add_statement(deferred_op)
         return self
 
+    @override
+    def generative(self) -> GenerativeQuery[T]:
+        """Start an immutable query over the same model and engine. Its chained methods return new objects instead of modifying this one"""
+        from .generative import GenerativeQuery
+
+        return GenerativeQuery(self.model, self.engine, type(self))
+
     def query(self, element: Optional[compileOptions] = None, sep: str = " ") -> str:
         if not element:
             return self._query_builder.query(sep, self._dialect).strip()
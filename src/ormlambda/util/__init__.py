@@ -8,6 +8,9 @@ from . import preloaded as preloaded
 from .langhelpers import get_cls_kwargs as get_cls_kwargs
 from .langhelpers import PluginLoader as PluginLoader
 
+from ._collections import LRUCache as LRUCache
+from ._collections import CacheStats as CacheStats
+
 from .typing import is_literal as is_literal
 from .typing import is_pep695 as is_pep695
 
@@ -0,0 +1,113 @@
+from __future__ import annotations
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterator, NamedTuple, Optional
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache[K: Hashable, V]:
+    """Bounded, thread-safe mapping that discards the least recently used entry when full.
+
+    ``on_evict`` is called with ``(key, value)`` every time an entry is dropped to make room for a new one,
+    so callers can release resources attached to the value (cursors, prepared statements, ...).
+    """
+
+    __slots__ = (
+        "_data",
+        "_lock",
+        "maxsize",
+        "on_evict",
+        "hits",
+        "misses",
+        "evictions",
+    )
+
+    def __init__(self, maxsize: int = 128, on_evict: Optional[Callable[[K, V], Any]] = None) -> None:
+        if maxsize < 1:
+            raise ValueError(f"'maxsize' must be a positive integer. You passed '{maxsize}'")
+
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.RLock()
+        self.maxsize: int = maxsize
+        self.on_evict = on_evict
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def __repr__(self) -> str:
+        return f"{LRUCache.__name__}(maxsize={self.maxsize}, currsize={len(self)})"
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def __getitem__(self, key: K) -> V:
+        with self._lock:
+            value = self._data[key]
+            self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        evicted: list[tuple[K, V]] = []
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+            self._data[key] = value
+
+            while len(self._data) > self.maxsize:
+                evicted.append(self._data.popitem(last=False))
+                self.evictions += 1
+
+        # COMMENT: run callbacks outside the lock so that they can safely touch the cache again
+        if self.on_evict is not None:
+            for old_key, old_value in evicted:
+                self.on_evict(old_key, old_value)
+        return None
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[K]:
+        with self._lock:
+            return iter(list(self._data))
+
+    def pop(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def values(self) -> list[V]:
+        with self._lock:
+            return list(self._data.values())
+
+    def items(self) -> list[tuple[K, V]]:
+        with self._lock:
+            return list(self._data.items())
+
+    def clear(self) -> None:
+        """Drop every entry without calling ``on_evict`` and reset the counters"""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+        return None
+
+    def stats(self) -> CacheStats:
+        return CacheStats(self.hits, self.misses, self.evictions, self.maxsize, len(self._data))
@@ -0,0 +1,210 @@
+from __future__ import annotations
+import contextvars
+import itertools
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Iterable, Optional
+
+from ormlambda import Engine
+from ormlambda.dialects import mysql
+from ormlambda.dialects.mysql.repository import MySQLRepository
+from ormlambda.events import Events
+from ormlambda.repository import IdentityMap
+from ormlambda.repository.batching import MultiRowStatement
+from ormlambda.repository.session import Session
+
+
+type Answer = Callable[..., Any]
+type OnExecute = Callable[[FakeCursor, str, Any], None]
+
+# COMMENT: returned for the 'max_allowed_packet' the repository reads before sending chunks
+MAX_ALLOWED_PACKET = 4 * 1024 * 1024
+
+
+class FakeRepository:
+    """
+    Repository for the tests that don't need a database.
+
+    Reads are answered by 'answer(query, params, flavour, **kwargs)' when it's given, or else with 'rows'. Selects with the
+    'dict' flavour get the number of rows as 'count', which is what the aggregation methods read.
+    Every statement is recorded in 'queries' as '(query, params)', reads and writes alike, in the order they were received.
+    Files sent through 'load_data' are read when they're received and recorded in 'loads' along with the query.
+    """
+
+    def __init__(self, rows: Iterable[tuple] = (), *, answer: Optional[Answer] = None, name: str = "fake", error: Optional[Exception] = None) -> None:
+        self.rows: list[tuple] = list(rows)
+        self.answer = answer
+        self.name = name
+        self.error = error
+        self.events = Events()
+        self.queries: list[tuple[str, Any]] = []
+        self.loads: list[tuple[str, bytes, bool]] = []
+        self.session: Optional[Session] = None
+        self._identity_map: contextvars.ContextVar[Optional[IdentityMap]] = contextvars.ContextVar(f"identity_map_{id(self)}", default=None)
+
+    def __repr__(self) -> str:
+        return self.name
+
+    @property
+    def current_identity_map(self) -> Optional[IdentityMap]:
+        return self._identity_map.get()
+
+    @property
+    def current_session(self) -> Optional[Session]:
+        return self.session
+
+    @property
+    def statements(self) -> list[str]:
+        return [query for query, _ in self.queries]
+
+    def read_sql(self, query: str, flavour=tuple, params=None, **kwargs) -> Any:
+        if self.error is not None:
+            raise self.error
+
+        params = tuple(params or ())
+        self.queries.append((query, params))
+        if self.answer is not None:
+            return self.answer(query, params, flavour, **kwargs)
+        if flavour is dict:
+            return ({"count": len(self.rows)},)
+        return tuple(self.rows)
+
+    def execute(self, query: str) -> None:
+        self.queries.append((query, ()))
+        return None
+
+    def execute_with_values(self, query: str, values) -> None:
+        self.queries.append((query, tuple(values)))
+        return None
+
+    def executemany_with_values(self, query: str, values) -> None:
+        self.queries.append((query, [tuple(x) for x in values]))
+        return None
+
+    def execute_chunks(self, statement: MultiRowStatement, rows, **kwargs) -> int:
+        rows = list(rows)
+        self.queries.append((statement.sql(len(rows)), rows))
+        return len(rows)
+
+    def load_data(self, query: str, *, disable_checks: bool = False) -> int:
+        # COMMENT: the temporary file is removed once the load ends, so it's read right now
+        path = query.split("'")[1]
+        self.loads.append((query, Path(path).read_bytes(), disable_checks))
+        return 0
+
+
+def make_engine(repository: Optional[FakeRepository] = None, **attributes: Any) -> SimpleNamespace:
+    """Stand-in for an 'Engine' with everything 'Statements' reads from it. Extra attributes, such as 'result_cache', are set as they are"""
+    return SimpleNamespace(
+        repository=repository if repository is not None else FakeRepository(),
+        dialect=mysql.dialect(),
+        events=Events(),
+        **attributes,
+    )
+
+
+class FakeCursor:
+    """
+    Cursor of 'FakeConnection'. Statements are recorded in the log of its connection and passed to its 'on_execute' hook,
+    which sets the rows, column names and rowcount the cursor returns.
+    """
+
+    def __init__(self, connection: FakeConnection, prepared: bool = False) -> None:
+        self.connection = connection
+        self.prepared = prepared
+        self.operation: Optional[str] = None
+        self.closed = False
+        self.rows: list[tuple] = []
+        self.column_names: tuple[str, ...] = ()
+        self.rowcount = -1
+
+    def __enter__(self) -> FakeCursor:
+        return self
+
+    def __exit__(self, *args) -> None: ...
+
+    def execute(self, query: str, params=None) -> None:
+        if query.startswith("SELECT @@"):
+            self.rows, self.column_names, self.rowcount = [(MAX_ALLOWED_PACKET,)], (query[7:],), 1
+            return None
+
+        # COMMENT: as 'mysql.connector' does, prepared cursors only skip the PREPARE step when they receive the same string object again
+        if self.prepared and query is not self.operation:
+            self.connection.log.append(("prepare", query, None))
+            self.operation = query
+
+        self.connection.log.append(("execute", query, params))
+        self.rows, self.column_names, self.rowcount = [], (), 1
+        if self.connection.on_execute is not None:
+            self.connection.on_execute(self, query, params)
+        return None
+
+    def executemany(self, query: str, params) -> None:
+        self.connection.log.append(("executemany", query, params))
+        self.rowcount = len(params)
+        return None
+
+    def fetchone(self) -> Optional[tuple]:
+        return self.rows[0] if self.rows else None
+
+    def fetchall(self) -> list[tuple]:
+        return self.rows
+
+    def close(self) -> None:
+        if self.prepared:
+            self.connection.log.append(("close", self.operation or "", None))
+        self.closed = True
+        return None
+
+
+class FakeConnection:
+    """
+    Connection returned by 'FakeDBAPI.connect'. Statements, commits and rollbacks are recorded in 'log' as '(kind, query, params)',
+    along with the statements prepared and closed by prepared cursors.
+    """
+
+    def __init__(self, on_execute: Optional[OnExecute] = None, connection_id: int = 1, **config: Any) -> None:
+        self.on_execute = on_execute
+        self.config = config
+        self.connection_id = connection_id
+        self.log: list[tuple[str, str, Any]] = []
+
+    def cursor(self, buffered: bool = False, prepared: bool = False) -> FakeCursor:
+        return FakeCursor(self, prepared)
+
+    def commit(self) -> None:
+        self.log.append(("commit", "", None))
+
+    def rollback(self) -> None:
+        self.log.append(("rollback", "", None))
+
+    def reset_session(self) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class FakeDBAPI:
+    """Stand-in for the DBAPI module of the dialect. Every connection it opens is kept in 'opened'"""
+
+    paramstyle = "pyformat"
+
+    def __init__(self, on_execute: Optional[OnExecute] = None) -> None:
+        self.on_execute = on_execute
+        self.opened: list[FakeConnection] = []
+        self._ids = itertools.count(1)
+
+    def connect(self, **config: Any) -> FakeConnection:
+        connection = FakeConnection(self.on_execute, next(self._ids), **config)
+        self.opened.append(connection)
+        return connection
+
+    @property
+    def statements(self) -> list[str]:
+        return [query for connection in self.opened for kind, query, _ in connection.log if kind.startswith("execute")]
+
+
+def make_mysql_engine(on_execute: Optional[OnExecute] = None, **kwargs: Any) -> Engine:
+    """'Engine' over a real 'MySQLRepository' whose connections are 'FakeConnection', opened by the 'FakeDBAPI' in 'engine.dialect.dbapi'"""
+    dialect = mysql.dialect(dbapi=FakeDBAPI(on_execute))
+    kwargs.setdefault("pool_class", "queue")
+    return Engine(MySQLRepository(dialect=dialect, **kwargs), dialect, None)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import pytest
+
+from ormlambda.repository.batching import ChunkSizer, MultiRowStatement, estimate_row_size, estimate_value_size
+from ormlambda.statements import Statements
+from test.fakes import FakeRepository, make_engine
+from test.models import Address
+
+
+@pytest.fixture
+def repository() -> FakeRepository:
+    return FakeRepository()
+
+
+@pytest.fixture
+def model(repository: FakeRepository) -> Statements[Address]:
+    return Statements(Address, make_engine(repository))
+
+
+def addresses(n: int) -> list[Address]:
+    return [Address(address_id=i, address=f"address {i}", district="d", city_id=1, phone="") for i in range(1, n + 1)]
+
+
+def test_multi_row_statement() -> None:
+    statement = MultiRowStatement.from_query("INSERT INTO t (a, b) VALUES (%s, %s) ON DUPLICATE KEY UPDATE a = VALUES(a);", "(%s, %s)")
+
+    assert statement.sql(1) == "INSERT INTO t (a, b) VALUES (%s, %s) ON DUPLICATE KEY UPDATE a = VALUES(a);"
+    assert statement.sql(3) == "INSERT INTO t (a, b) VALUES (%s, %s), (%s, %s), (%s, %s) ON DUPLICATE KEY UPDATE a = VALUES(a);"
+
+    with pytest.raises(ValueError):
+        MultiRowStatement.from_query("SELECT 1", "(%s)")
+
+
+def test_estimate_counts_escaped_characters() -> None:
+    assert estimate_value_size("abc") == 5
+    assert estimate_value_size("a'b") == 6
+    assert estimate_value_size("ñ") == 4
+    assert estimate_value_size(None) == 4
+    assert estimate_row_size((1, "abc")) == estimate_value_size(1) + 5
+
+
+def test_chunks_respect_rows_and_bytes() -> None:
+    rows = [("x" * 8,)] * 10
+
+    assert [len(x) for x in ChunkSizer(10_000, chunk_size=4).split(rows)] == [4, 4, 2]
+    # COMMENT: each row takes 10 bytes plus 2 of overhead
+    assert [len(x) for x in ChunkSizer(36, row_overhead=2, chunk_size=100).split(rows)] == [3, 3, 3, 1]
+    # COMMENT: rows that don't fit in the packet on their own are still sent
+    assert [len(x) for x in ChunkSizer(5, chunk_size=100).split(rows[:2])] == [1, 1]
+
+
+def test_adaptive_chunk_size() -> None:
+    sizer = ChunkSizer(10_000_000, target_latency=1.0)
+    assert sizer.rows == 1000
+
+    assert sizer.record(1000, 0.1) == 2000
+    assert sizer.record(2000, 10.0) == 1000
+    assert sizer.record(1000, 1.25) == 800
+
+    fixed = ChunkSizer(10_000_000, chunk_size=10)
+    assert fixed.record(10, 100.0) == 10
+
+    with pytest.raises(ValueError):
+        ChunkSizer(100, chunk_size=0)
+
+
+def test_insert_uses_multi_row_values(model: Statements[Address], repository: FakeRepository) -> None:
+    model.insert(addresses(3))
+
+    ((query, rows),) = repository.queries
+    assert query.startswith("INSERT INTO address (")
+    assert query.count("(%s, %s, %s, %s, %s, %s, %s, %s, %s)") == 3
+    assert [x[0] for x in rows] == [1, 2, 3]
+
+
+def test_upsert_keeps_update_clause(model: Statements[Address], repository: FakeRepository) -> None:
+    model.upsert(addresses(2))
+
+    ((query, _),) = repository.queries
+    assert query.count("(%s, %s, %s, %s, %s, %s, %s, %s, %s)") == 2
+    assert query.endswith("address.last_update = VALUES(address.last_update);")
+
+
+def test_delete_repeats_primary_key_placeholder(model: Statements[Address], repository: FakeRepository) -> None:
+    model.delete(addresses(3))
+
+    ((query, rows),) = repository.queries
+    assert query == "DELETE FROM address WHERE `address`.address_id IN (%s, %s, %s)"
+    assert rows == [(1,), (2,), (3,)]
@@ -0,0 +1,70 @@
+from __future__ import annotations
+import pytest
+
+from ormlambda.common.global_checker import GlobalChecker
+from ormlambda.common.enums import UnionEnum
+from ormlambda.dialects import mysql
+from ormlambda.sql import clauses
+from ormlambda.sql.clauses import Where
+from ormlambda.statements.query_builder import QueryBuilder
+from test.models import Address
+
+
+@pytest.fixture
+def dialect():
+    return mysql.dialect()
+
+
+def build(where) -> QueryBuilder:
+    qb = QueryBuilder()
+    qb.add_where(GlobalChecker.resolved_callback_object(Address, where), UnionEnum.AND)
+    qb.add_statement(clauses.Select(Address, GlobalChecker.resolved_callback_object(Address, lambda x: x.address)))
+    return qb
+
+
+def test_bind_query_uses_placeholders(dialect) -> None:
+    query, params = build(lambda x: (x.address_id == 10, x.City.Country.country == "Spain")).bind_query(" ", dialect)
+
+    assert "WHERE (`address`.address_id = %s AND `address_City_Country`.country = %s)" in query
+    assert params == (10, "Spain")
+
+
+def test_bind_query_same_sql_for_different_values(dialect) -> None:
+    query_10, params_10 = build(lambda x: x.address_id == 10).bind_query(" ", dialect)
+    query_11, params_11 = build(lambda x: x.address_id == 11).bind_query(" ", dialect)
+
+    assert query_10 == query_11
+    assert (params_10, params_11) == ((10,), (11,))
+    assert dialect.compiled_cache.stats().hits == 1
+
+
+def test_contains_expands_one_placeholder_per_item(dialect) -> None:
+    query, params = build(lambda x: x.address_id.contains((1, 2, 3))).bind_query(" ", dialect)
+    other_query, _ = build(lambda x: x.address_id.contains((1, 2))).bind_query(" ", dialect)
+
+    assert query.endswith("`address`.address_id IN (%s, %s, %s)")
+    assert other_query.endswith("`address`.address_id IN (%s, %s)")
+    assert params == (1, 2, 3)
+
+
+def test_query_keeps_literals_inline(dialect) -> None:
+    query = build(lambda x: x.address_id == 10).query(" ", dialect)
+    assert query.endswith("WHERE `address`.address_id = 10")
+
+
+def test_update_binds_where_values(dialect) -> None:
+    where = Where()
+    where.add_comparer_tuple(GlobalChecker.resolved_callback_object(Address, lambda x: x.address_id == 3), UnionEnum.AND)
+    update = clauses.Update(Address, where, {"address": "new address"})
+
+    assert update.compile(dialect).string == "UPDATE address SET address=%s WHERE `address`.address_id = %s"
+    assert update.cleaned_values == ("new address", 3)
+
+
+def test_delete_binds_where_values(dialect) -> None:
+    where = Where()
+    where.add_comparer_tuple(GlobalChecker.resolved_callback_object(Address, lambda x: x.address_id.contains([1, 2])), UnionEnum.AND)
+    delete = clauses.Delete(Address, where, None)
+
+    assert delete.compile(dialect).string == "DELETE FROM address WHERE `address`.address_id IN (%s, %s)"
+    assert delete.cleaned_values == (1, 2)
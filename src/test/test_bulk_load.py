@@ -0,0 +1,87 @@
+from __future__ import annotations
+import datetime
+import json
+from pathlib import Path
+
+import pytest
+import shapely as shp
+
+from ormlambda.dialects import mysql
+from ormlambda.repository import bulk_load as bulk
+from ormlambda.sql import clauses
+from ormlambda.statements import Statements
+from test.fakes import FakeRepository, make_engine
+from test.models import Address, TableType
+
+
+@pytest.fixture
+def repository() -> FakeRepository:
+    return FakeRepository()
+
+
+def statements[T](model: type[T], repository: FakeRepository) -> Statements[T]:
+    return Statements(model, make_engine(repository))
+
+
+def test_encode_value() -> None:
+    assert bulk.encode_value(None) == b"\\N"
+    assert bulk.encode_value(True) == b"1"
+    assert bulk.encode_value(0.1) == b"0.1"
+    assert bulk.encode_value("a\tb\\c\nd") == b"a\\tb\\\\c\\nd"
+    assert bulk.encode_value(b"\x00\x01") == b"\\0\x01"
+    assert bulk.encode_value(datetime.datetime(2020, 1, 1, 10, 30)) == b"2020-01-01 10:30:00"
+
+
+def test_format_is_inferred_from_extension() -> None:
+    assert bulk.get_format("rows.csv") == "csv"
+    assert bulk.get_format(Path("rows.jsonl")) == "ndjson"
+    assert bulk.get_format([{"a": 1}]) is None
+
+    with pytest.raises(ValueError):
+        bulk.get_format("rows.parquet")
+
+
+def test_load_data_reads_functions_into_variables() -> None:
+    columns = (TableType.pk, TableType.points)
+    query = clauses.LoadData(TableType, "/tmp/it's.tsv", columns).compile(mysql.dialect()).string
+
+    assert query.startswith("LOAD DATA LOCAL INFILE '/tmp/it\\'s.tsv' INTO TABLE table_type CHARACTER SET utf8mb4")
+    assert query.endswith("(pk, @_1) SET points = ST_GeomFromText(@_1)")
+
+
+def test_bulk_load_instances_and_dicts(repository: FakeRepository) -> None:
+    model = statements(TableType, repository)
+    rows = [
+        TableType(pk=1, strings="a\tb", points=shp.Point(5, 5), jsons={"a": 1}),
+        {"pk": 2, "integers": 3},
+    ]
+    model.bulk_load(rows, columns=["pk", "strings", "integers", "points", "jsons"], disable_checks=True)
+
+    ((query, content, disable_checks),) = repository.loads
+    assert query.endswith("(pk, strings, integers, @_3, jsons) SET points = ST_GeomFromText(@_3)")
+    assert content == b'1\ta\\tb\t\\N\tPOINT (5 5)\t{"a": 1}\n2\t\\N\t3\t\\N\t\\N\n'
+    assert disable_checks
+
+
+def test_bulk_load_files(tmp_path: Path, repository: FakeRepository) -> None:
+    model = statements(Address, repository)
+
+    csv_file = tmp_path / "address.csv"
+    csv_file.write_text("address_id,address,phone\n1,47 MySakila Drive,\n")
+    model.bulk_load(csv_file, tmp_dir=tmp_path)
+
+    ndjson_file = tmp_path / "address.ndjson"
+    ndjson_file.write_text(json.dumps({"address_id": 2, "address": "28 MySQL Boulevard"}) + "\n\n")
+    model.bulk_load(ndjson_file, columns=["address_id", "address"], tmp_dir=tmp_path)
+
+    (csv_query, csv_content, _), (ndjson_query, ndjson_content, _) = repository.loads
+    assert csv_query.endswith("(address_id, address, phone)")
+    assert csv_content == b"1\t47 MySakila Drive\t\\N\n"
+    assert ndjson_query.endswith("(address_id, address)")
+    assert ndjson_content == b"2\t28 MySQL Boulevard\n"
+    assert list(tmp_path.glob("*.tsv")) == []
+
+
+def test_bulk_load_unknown_column(repository: FakeRepository) -> None:
+    with pytest.raises(ValueError):
+        statements(Address, repository).bulk_load([], columns=["unknown"])
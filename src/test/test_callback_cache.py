@@ -0,0 +1,123 @@
+from __future__ import annotations
+import datetime
+import itertools
+import types
+
+import pytest
+
+from ormlambda import Count
+from ormlambda.common.callback_cache import CallbackCache
+from ormlambda.common.global_checker import GlobalChecker
+from ormlambda.sql.column import ColumnProxy
+from ormlambda.sql.comparer import Comparer
+from test.models import Address
+
+CONFIG = {"id": 1}
+COUNTER = itertools.count()
+
+
+@pytest.fixture
+def cache() -> CallbackCache:
+    return CallbackCache(maxsize=16)
+
+
+def resolve(cache: CallbackCache, lambda_func):
+    return cache.resolve(Address, lambda_func, GlobalChecker._resolve_callback)
+
+
+def test_captured_values_are_rebound(cache: CallbackCache) -> None:
+    results = [resolve(cache, lambda x: x.address_id == pk) for pk in (1, 2, 3)]
+
+    assert [comparer.right_condition for (comparer,) in results] == [1, 2, 3]
+    assert cache.stats().hits == 2
+    assert cache.stats().currsize == 1
+
+
+def test_each_call_returns_new_instances(cache: CallbackCache) -> None:
+    (first,) = resolve(cache, lambda x: x.address)
+    (second,) = resolve(cache, lambda x: x.address)
+
+    assert isinstance(first, ColumnProxy)
+    assert first is not second
+    first.alias = "changed"
+    assert second.alias != "changed"
+
+
+def test_contains_keeps_tuple_conversion(cache: CallbackCache) -> None:
+    for ids in ([1, 2], [3, 4, 5]):
+        (comparer,) = resolve(cache, lambda x: x.address_id.contains(ids))
+        assert isinstance(comparer, Comparer)
+        assert comparer.right_condition == tuple(ids)
+
+
+def test_transformed_values_are_cached_by_value(cache: CallbackCache) -> None:
+    for value in ("a", "b", "a"):
+        (comparer,) = resolve(cache, lambda x: x.address == value.upper())
+        assert comparer.right_condition == value.upper()
+
+
+def test_unsupported_elements_are_not_cached(cache: CallbackCache) -> None:
+    results = [resolve(cache, lambda x: Count(x.address_id)) for _ in range(2)]
+
+    assert results[0][0] is not results[1][0]
+    assert len(cache._uncacheable) == 1
+
+
+def test_cache_can_be_disabled() -> None:
+    cache = CallbackCache(maxsize=0)
+    (comparer,) = resolve(cache, lambda x: x.address_id == 1)
+
+    assert comparer.right_condition == 1
+    assert cache.stats() is None
+
+
+def test_mutable_globals_are_read_on_every_call(cache: CallbackCache) -> None:
+    (first,) = resolve(cache, lambda x: x.address_id == CONFIG["id"])
+    CONFIG["id"] = 2
+    (second,) = resolve(cache, lambda x: x.address_id == CONFIG["id"])
+
+    assert (first.right_condition, second.right_condition) == (1, 2)
+
+
+def test_calls_to_globals_run_on_every_call(cache: CallbackCache) -> None:
+    values = [resolve(cache, lambda x: x.address_id == next(COUNTER))[0].right_condition for _ in range(3)]
+    assert values[1] == values[0] + 1 and values[2] == values[1] + 1
+
+    (first,) = resolve(cache, lambda x: x.last_update > datetime.datetime.now())
+    (second,) = resolve(cache, lambda x: x.last_update > datetime.datetime.now())
+    # COMMENT: a cached template would hand the very same datetime back
+    assert first.right_condition is not second.right_condition
+
+
+def test_calls_over_the_model_are_still_cached(cache: CallbackCache) -> None:
+    for ids in ([1, 2], [3]):
+        resolve(cache, lambda x: x.address_id.contains(ids))
+
+    assert cache.stats().hits == 1
+
+
+class Settings:
+    limit = 10
+
+
+settings_module = types.ModuleType("settings_module")
+
+
+def test_class_and_module_attributes_are_read_on_every_call(cache: CallbackCache, monkeypatch: pytest.MonkeyPatch) -> None:
+    def read_global():
+        return resolve(cache, lambda x: x.address_id > Settings.limit)[0].right_condition
+
+    def read_module():
+        return resolve(cache, lambda x: x.address_id > settings_module.limit)[0].right_condition
+
+    def read_captured(settings):
+        return resolve(cache, lambda x: x.address_id > settings.limit)[0].right_condition
+
+    monkeypatch.setattr(Settings, "limit", 10)
+    monkeypatch.setattr(settings_module, "limit", 100, raising=False)
+
+    assert (read_global(), read_module(), read_captured(Settings)) == (10, 100, 10)
+    Settings.limit = 20
+    settings_module.limit = 200
+    assert (read_global(), read_module(), read_captured(Settings)) == (20, 200, 20)
+    assert cache.stats().currsize == 0
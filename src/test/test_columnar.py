@@ -0,0 +1,87 @@
+from __future__ import annotations
+import datetime
+import sys
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ormlambda.common.global_checker import GlobalChecker
+from ormlambda.dialects import mysql
+from ormlambda.repository import columnar
+from ormlambda.repository.response import Response
+from ormlambda.sql import clauses
+from test.models import Address
+
+
+@pytest.fixture
+def select() -> clauses.Select:
+    columns = GlobalChecker.resolved_callback_object(Address, lambda x: (x.address_id, x.address, x.last_update))
+    select = clauses.Select(Address, columns)
+    select.compile(mysql.dialect())
+    return select
+
+
+ROWS = [
+    (1, "47 MySakila Drive", datetime.datetime(2014, 9, 25, 20, 30, 27)),
+    (2, "28 MySQL Boulevard", None),
+]
+COLUMNS = ("address_id", "address", "last_update")
+
+
+@pytest.mark.parametrize(
+    "python_type, dtype",
+    [
+        (int, "int64"),
+        (bool, "bool"),
+        (float, "float64"),
+        (datetime.datetime, "datetime64[us]"),
+        (datetime.date, "datetime64[D]"),
+        (Decimal, "object"),
+        (str, "object"),
+        (bytes, "object"),
+        (None, "object"),
+    ],
+)
+def test_numpy_dtype(python_type, dtype) -> None:
+    assert columnar.numpy_dtype(python_type) == dtype
+
+
+def test_columns_flavour_returns_typed_arrays(select) -> None:
+    result = Response(mysql.dialect(), ROWS, COLUMNS, columnar.COLUMNS, select).response()
+
+    assert list(result) == list(COLUMNS)
+    assert result["address_id"].dtype == np.int64
+    assert result["address"].tolist() == ["47 MySakila Drive", "28 MySQL Boulevard"]
+    assert result["last_update"].dtype == np.dtype("datetime64[us]")
+    assert np.isnat(result["last_update"][1])
+
+
+def test_null_integers_are_stored_as_floats() -> None:
+    result = columnar.to_columns(("pk",), [(1,), (None,)], (int,), lambda value, dtype: value)
+
+    assert result["pk"].dtype == np.float64
+    assert np.isnan(result["pk"][1])
+
+
+def test_empty_result_keeps_column_names(select) -> None:
+    result = Response(mysql.dialect(), [], COLUMNS, columnar.COLUMNS, select).response()
+
+    assert list(result) == list(COLUMNS)
+    assert all(len(x) == 0 for x in result.values())
+
+
+def test_dataframe_flavour(select) -> None:
+    df = Response(mysql.dialect(), ROWS, COLUMNS, pd.DataFrame, select).response()
+
+    assert isinstance(df, pd.DataFrame)
+    assert df.shape == (2, 3)
+    assert df["address_id"].tolist() == [1, 2]
+
+
+def test_missing_numpy_names_the_extra(select, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "numpy", None)
+
+    with pytest.raises(ModuleNotFoundError, match=r"ormlambda\[columns\]"):
+        Response(mysql.dialect(), ROWS, COLUMNS, "columns", select).response()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+import pytest
+
+from ormlambda.common.global_checker import GlobalChecker
+from ormlambda.dialects import mysql
+from ormlambda.sql import clauses
+from ormlambda.statements.query_builder import QueryBuilder
+from ormlambda.common.enums import UnionEnum
+from ormlambda.util import LRUCache
+from test.models import Address
+
+
+def build_query(dialect, country: str, select=lambda x: (x.address, x.City.city, x.City.Country)) -> tuple[str, QueryBuilder]:
+    qb = QueryBuilder()
+    qb.add_where(GlobalChecker.resolved_callback_object(Address, lambda x: x.City.Country.country == country), UnionEnum.AND)
+    qb.add_statement(clauses.Select(Address, GlobalChecker.resolved_callback_object(Address, select)))
+    qb.add_statement(clauses.Limit(3))
+    return qb.query(" ", dialect), qb
+
+
+@pytest.fixture
+def dialect():
+    return mysql.dialect()
+
+
+def test_cache_hit_returns_same_query(dialect) -> None:
+    first, _ = build_query(dialect, "Spain")
+    second, _ = build_query(dialect, "Spain")
+
+    assert first == second
+    stats = dialect.compiled_cache.stats()
+    assert (stats.hits, stats.misses, stats.currsize) == (1, 1, 1)
+
+
+def test_different_literal_is_a_different_entry(dialect) -> None:
+    spain, _ = build_query(dialect, "Spain")
+    france, _ = build_query(dialect, "France")
+
+    assert "'Spain'" in spain
+    assert "'France'" in france
+    assert dialect.compiled_cache.stats().misses == 2
+
+
+def test_cache_hit_restores_select_aliases(dialect) -> None:
+    _, compiled = build_query(dialect, "Spain", lambda x: (x.address, x.City.city, x.City.Country.country))
+    _, cached = build_query(dialect, "Spain", lambda x: (x.address, x.City.city, x.City.Country.country))
+
+    assert dialect.compiled_cache.stats().hits == 1
+    assert [x.alias for x in cached.select.columns] == [x.alias for x in compiled.select.columns]
+
+
+def test_cache_disabled() -> None:
+    dialect = mysql.dialect(compiled_cache_size=None)
+    first, _ = build_query(dialect, "Spain")
+    second, _ = build_query(dialect, "Spain")
+
+    assert dialect.compiled_cache is None
+    assert first == second
+
+
+def test_unhashable_values_skip_the_cache(dialect) -> None:
+    qb = QueryBuilder()
+    qb.add_where(GlobalChecker.resolved_callback_object(Address, lambda x: x.address_id == {"id": 1}), UnionEnum.AND)
+    qb.add_statement(clauses.Select(Address, GlobalChecker.resolved_callback_object(Address, lambda x: x.address_id)))
+
+    assert qb.cache_key() is None
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    evicted = []
+    cache = LRUCache(2, on_evict=lambda key, value: evicted.append(key))
+    cache["a"] = 1
+    cache["b"] = 2
+    cache.get("a")
+    cache["c"] = 3
+
+    assert evicted == ["b"]
+    assert list(cache) == ["a", "c"]
+    assert cache.stats() == (1, 0, 1, 2, 2)
+
+
+def test_lru_cache_invalid_size() -> None:
+    with pytest.raises(ValueError):
+        LRUCache(0)
@@ -0,0 +1,49 @@
+from __future__ import annotations
+import datetime
+import json
+
+import pytest
+
+from ormlambda.common.global_checker import GlobalChecker
+from ormlambda.dialects import mysql
+from ormlambda.repository.response import Response
+from ormlambda.sql import clauses
+from test.models import Address
+
+
+NOW = datetime.datetime(2014, 9, 25, 20, 30, 27)
+
+
+@pytest.fixture
+def dialect():
+    return mysql.dialect()
+
+
+@pytest.fixture
+def select(dialect) -> tuple[clauses.Select, str]:
+    select = clauses.Select(Address, GlobalChecker.resolved_callback_object(Address, lambda x: (x.address_id, x.address, x.last_update)))
+    return select, select.compile(dialect).string
+
+
+def test_decoder_matches_caster(dialect) -> None:
+    caster = dialect.caster()
+    for python_type, value in ((int, 1), (str, b"bytes"), (float, 2), (dict, json.dumps({"a": 1})), (None, 3)):
+        assert caster.decoder(python_type)(value) == caster.for_value(value, value_type=python_type).from_database
+
+
+def test_datetime_columns_are_skipped(dialect, select) -> None:
+    select, query = select
+    plan = Response(dialect, [], ("address_id", "address", "last_update"), tuple, select, query=query)._get_decoder_plan()
+
+    assert plan.decoders[2] is None
+    assert plan.decode([(1, "address", NOW), (None, None, None)]) == [(1, "address", NOW), (None, None, None)]
+
+
+def test_plan_is_cached_with_compiled_statement(dialect, select) -> None:
+    select, query = select
+    columns = ("address_id", "address", "last_update")
+
+    first = Response(dialect, [(1, "a", NOW)], columns, tuple, select, query=query)._get_decoder_plan()
+    second = Response(dialect, [(2, "b", NOW)], columns, tuple, select, query=query)._get_decoder_plan()
+
+    assert first is second
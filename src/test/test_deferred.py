@@ -0,0 +1,106 @@
+from __future__ import annotations
+import gc
+
+import pytest
+
+from ormlambda import Column, Table
+from ormlambda.statements import Statements
+from test.fakes import FakeRepository, make_engine
+
+
+class Article(Table):
+    __table_name__ = "article"
+
+    article_id: Column[int] = Column(int, is_primary_key=True, check_types=False)
+    title: Column[str] = Column(str, check_types=False)
+    summary: Column[str] = Column(str, check_types=False)
+    body: Column[str] = Column(str, is_deferred=True, check_types=False)
+
+
+ARTICLES = {
+    1: ("First", "short", "a very long body"),
+    2: ("Second", "shorter", "another long body"),
+    3: ("Third", "shortest", "the longest body"),
+}
+
+
+def answer(query: str, params: tuple, flavour, **kwargs) -> tuple:
+    """Answers with the columns named in the SELECT, filtered by the ids passed as params"""
+    names = ("article_id", "title", "summary", "body")
+    selected = query.split("FROM")[0]
+    positions = [i for i, name in enumerate(names) if f"`article`.{name} " in selected]
+    ids = params or tuple(ARTICLES)
+    return tuple(tuple((pk, *ARTICLES[pk])[i] for i in positions) for pk in ids if pk in ARTICLES)
+
+
+def articles():
+    return make_engine(FakeRepository(answer=answer))
+
+
+def test_deferred_column_is_fetched_once_for_the_whole_result() -> None:
+    engine = articles()
+    first, second, third = Statements(Article, engine).select()
+
+    query, _ = engine.repository.queries[0]
+    assert "body" not in query
+    assert (first.title, second.summary) == ("First", "shorter")
+
+    assert second.body == "another long body"
+    assert (first.body, third.body) == ("a very long body", "the longest body")
+
+    # COMMENT: one query for the articles and one that fetches 'body' for every one of them
+    (query, params), *rest = engine.repository.queries[1:]
+    assert not rest
+    assert "WHERE `article`.article_id IN (%s, %s, %s)" in query
+    assert params == (1, 2, 3)
+
+
+def test_defer_and_load_only_per_query() -> None:
+    engine = articles()
+    (article, *_) = Statements(Article, engine).select(load_only=lambda x: x.title)
+
+    query, _ = engine.repository.queries[0]
+    assert "summary" not in query and "body" not in query
+    assert article.article_id == 1 and article.title == "First"
+    assert article.summary == "short"
+
+    engine = articles()
+    (article, *_) = Statements(Article, engine).select(defer=lambda x: x.summary)
+    query, _ = engine.repository.queries[0]
+    assert "summary" not in query and "body" not in query
+
+    with pytest.raises(ValueError):
+        Statements(Article, engine).select(flavour=dict, defer=lambda x: x.summary)
+
+
+def test_explicit_selection_loads_deferred_columns() -> None:
+    engine = articles()
+    rows = Statements(Article, engine).select(lambda x: (x.article_id, x.body), flavour=tuple)
+    assert rows[0] == (1, "a very long body")
+
+    # COMMENT: flavours return every column, deferred or not
+    Statements(Article, engine).select(flavour=dict)
+    query, _ = engine.repository.queries[-1]
+    assert "`article`.body" in query
+    assert len(engine.repository.queries) == 2
+
+
+def test_released_and_hand_made_instances() -> None:
+    engine = articles()
+    first, second, third = Statements(Article, engine).select()
+
+    # COMMENT: instances dropped before the column is read aren't fetched
+    del first
+    gc.collect()
+    assert third.body == "the longest body"
+    _, params = engine.repository.queries[-1]
+    assert params == (2, 3)
+
+    # COMMENT: the value read is kept, and assigning one doesn't query either
+    second.body = "edited"
+    assert second.body == "edited"
+    assert len(engine.repository.queries) == 2
+
+    article = Article(article_id=4, title="Fourth")
+    assert article.body is None
+    assert len(engine.repository.queries) == 2
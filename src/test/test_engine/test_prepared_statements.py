@@ -0,0 +1,117 @@
+from __future__ import annotations
+import re
+
+import pytest
+
+from ormlambda import ORM, create_engine
+from ormlambda.engine import Engine
+from test.env import DATABASE_URL
+from test.fakes import FakeCursor, make_mysql_engine
+from test.models import Address
+
+
+@pytest.fixture
+def prepared_engine() -> Engine:
+    return create_engine(DATABASE_URL, pool_size=1, prepared_statement_cache_size=2)
+
+
+def test_prepared_engine_does_not_reset_session(prepared_engine: Engine) -> None:
+    assert prepared_engine.repository.use_prepared_statements
+    assert prepared_engine.repository.pool.reset_session is False
+
+
+def test_prepared_statements_return_same_rows(prepared_engine: Engine, sakila_engine: Engine) -> None:
+    prepared = ORM(Address, prepared_engine)
+    plain = ORM(Address, sakila_engine)
+
+    for pk in (1, 2, 3):
+        assert prepared.where(lambda x: x.address_id == pk).select_one() == plain.where(lambda x: x.address_id == pk).select_one()
+
+
+def test_prepared_statements_are_reused_across_checkouts(prepared_engine: Engine) -> None:
+    model = ORM(Address, prepared_engine)
+    repository = prepared_engine.repository
+
+    model.where(lambda x: x.address_id == 1).select_one()
+    model.where(lambda x: x.address_id == 2).select_one()
+
+    ((_, cache),) = repository._prepared_statements.values()
+    assert cache.stats().hits == 1
+    assert len(cache) == 1
+
+
+def test_least_recently_used_statement_is_closed(prepared_engine: Engine) -> None:
+    model = ORM(Address, prepared_engine)
+
+    model.where(lambda x: x.address_id == 1).select_one(lambda x: x.address)
+    model.where(lambda x: x.address_id == 1).select_one(lambda x: x.address2)
+    model.where(lambda x: x.address_id == 1).select_one(lambda x: x.district)
+
+    ((_, cache),) = prepared_engine.repository._prepared_statements.values()
+    assert len(cache) == 2
+    assert cache.stats().evictions >= 1
+
+
+@pytest.fixture
+def fake_engine() -> Engine:
+    # COMMENT: a single connection in the pool, so every checkout returns the same one
+    return make_mysql_engine(pool_size=1, max_overflow=0, prepared_statement_cache_size=2)
+
+
+def statements(engine: Engine, *kinds: str) -> list[tuple[str, str]]:
+    """Log of the only connection of 'engine', with the column each select reads instead of the whole query"""
+    (cnx,) = engine.dialect.dbapi.opened
+    return [(kind, re.match(r"SELECT `address`\.(\w+)", query).group(1)) for kind, query, _ in cnx.log if kind in kinds]
+
+
+def test_session_reset_is_disabled_only_for_prepared_statements(fake_engine: Engine) -> None:
+    assert fake_engine.repository.use_prepared_statements
+    assert fake_engine.repository.pool.reset_session is False
+
+    plain = make_mysql_engine(pool_size=1, max_overflow=0)
+    assert not plain.repository.use_prepared_statements
+    assert plain.repository.pool.reset_session is True
+
+
+def test_statements_are_prepared_once_per_connection(fake_engine: Engine) -> None:
+    model = ORM(Address, fake_engine)
+    for pk in (1, 2, 3):
+        model.where(lambda x: x.address_id == pk).select_one(lambda x: x.address)
+
+    assert statements(fake_engine, "prepare", "execute") == [("prepare", "address"), *[("execute", "address")] * 3]
+
+    # COMMENT: a reconnected connection has a new id, and the server has forgotten every statement prepared before
+    (cnx,) = fake_engine.dialect.dbapi.opened
+    cnx.connection_id += 1
+    model.where(lambda x: x.address_id == 1).select_one(lambda x: x.address)
+    assert statements(fake_engine, "prepare").count(("prepare", "address")) == 2
+
+
+def test_least_recently_used_statement_is_closed_offline(fake_engine: Engine) -> None:
+    model = ORM(Address, fake_engine)
+    for selector in (lambda x: x.address, lambda x: x.address2, lambda x: x.address, lambda x: x.district):
+        model.where(lambda x: x.address_id == 1).select_one(selector)
+
+    # COMMENT: 'address' was used again, so 'address2' is the least recently used when 'district' comes in
+    assert statements(fake_engine, "prepare", "close") == [
+        ("prepare", "address"),
+        ("prepare", "address2"),
+        ("close", "address2"),
+        ("prepare", "district"),
+    ]
+
+
+def test_failed_statements_are_closed_and_prepared_again() -> None:
+    def on_execute(cursor: FakeCursor, query: str, params) -> None:
+        if params == (0,):
+            raise ValueError("Lost connection")
+
+    engine = make_mysql_engine(on_execute, pool_size=1, max_overflow=0, prepared_statement_cache_size=2)
+    model = ORM(Address, engine)
+
+    with pytest.raises(ValueError):
+        model.where(lambda x: x.address_id == 0).select_one(lambda x: x.address)
+    model.where(lambda x: x.address_id == 1).select_one(lambda x: x.address)
+
+    assert statements(engine, "prepare", "close") == [("prepare", "address"), ("close", "address"), ("prepare", "address")]
+
@@ -0,0 +1,76 @@
+from __future__ import annotations
+import re
+
+import pytest
+
+from ormlambda import ORM, Engine
+from ormlambda.events import EventContext, Events
+from test.fakes import FakeCursor, make_mysql_engine
+from test.models import Country
+
+
+ROWS = [
+    {"country_id": 1, "country": "Afghanistan", "last_update": None},
+    {"country_id": 2, "country": "Algeria", "last_update": None},
+]
+
+
+def on_execute(cursor: FakeCursor, query: str, params) -> None:
+    if "unknown" in query:
+        raise ValueError("Unknown column")
+    cursor.column_names = tuple(re.findall(r"AS `(\w+)`", query.split(" FROM ")[0]))
+    cursor.rows = [tuple(row[name] for name in cursor.column_names) for row in ROWS]
+    cursor.rowcount = len(cursor.rows) if query.startswith("SELECT") else 1
+
+
+@pytest.fixture
+def engine() -> Engine:
+    return make_mysql_engine(on_execute)
+
+
+def record(events: Events) -> list[tuple[str, EventContext]]:
+    calls = []
+    for name in ("before_compile", "after_compile", "before_execute", "after_execute", "after_fetch", "after_hydrate", "on_error"):
+        events.listen(name, lambda context, name=name: calls.append((name, context)))
+    return calls
+
+
+def test_no_listeners_yield_none() -> None:
+    events = Events()
+    with events.executing("SELECT 1") as event:
+        assert event is None
+
+
+def test_select_dispatches_every_event(engine: Engine) -> None:
+    calls = record(engine.events)
+    countries = ORM(Country, engine).where(lambda x: x.country_id > 0).select()
+
+    assert len(countries) == 2
+    assert [name for name, _ in calls] == ["before_compile", "after_compile", "before_execute", "after_execute", "after_fetch", "after_hydrate"]
+
+    contexts = dict(calls)
+    assert contexts["after_compile"].params == (0,)
+    assert contexts["after_execute"].sql == contexts["after_compile"].sql
+    assert contexts["after_fetch"].rowcount == 2
+    assert contexts["after_hydrate"].rowcount == 2
+    # COMMENT: 'before_*' and 'after_*' receive the same object, so they can be correlated
+    assert contexts["before_execute"] is contexts["after_fetch"]
+    assert contexts["after_fetch"].finished >= contexts["after_fetch"].started
+
+
+def test_on_error_and_remove(engine: Engine) -> None:
+    errors = []
+    listener = engine.events.listen("on_error", errors.append)
+
+    with pytest.raises(ValueError):
+        engine.repository.execute("SELECT unknown")
+    assert [type(x.error) for x in errors] == [ValueError]
+    assert errors[0].sql == "SELECT unknown"
+
+    engine.events.remove("on_error", listener)
+    with pytest.raises(ValueError):
+        engine.repository.execute("SELECT unknown")
+    assert len(errors) == 1
+
+    with pytest.raises(ValueError):
+        engine.events.listen("after_commit", print)
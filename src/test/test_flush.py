@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import pytest
+
+from ormlambda import Column, Table
+from ormlambda.statements import Statements
+from test.fakes import FakeRepository, make_engine
+
+
+class Customer(Table):
+    __table_name__ = "customer"
+
+    customer_id: Column[int] = Column(int, is_primary_key=True, check_types=False)
+    name: Column[str] = Column(str, check_types=False)
+    email: Column[str] = Column(str, check_types=False)
+
+
+class Ticket(Table):
+    __table_name__ = "ticket"
+
+    ticket_id: Column[int] = Column(int, is_primary_key=True, is_auto_increment=True, check_types=False)
+    title: Column[str] = Column(str, check_types=False)
+
+
+ROWS = ((1, "Ada", "ada@mail.com"), (2, "Alan", "alan@mail.com"), (3, "Grace", "grace@mail.com"))
+
+
+def customer_engine():
+    return make_engine(FakeRepository(ROWS))
+
+
+def writes(engine) -> list[tuple[str, list[tuple]]]:
+    return [x for x in engine.repository.queries if not x[0].startswith("SELECT")]
+
+
+def test_changes_are_tracked_on_loaded_instances() -> None:
+    ada, alan, _ = Statements(Customer, customer_engine()).select()
+    assert ada.get_changes() == {}
+
+    ada.name = "Augusta"
+    assert ada.get_changes() == {"name": "Ada"}
+
+    # COMMENT: assigning the loaded value back is not a change
+    ada.name = "Ada"
+    alan.email = "alan@mail.com"
+    assert ada.get_changes() == alan.get_changes() == {}
+
+    # COMMENT: instances created by hand were never loaded, so there's nothing to compare with
+    new = Customer(customer_id=4, name="Edsger")
+    new.name = "Dijkstra"
+    assert new.get_changes() == {}
+
+
+def test_flush_groups_instances_by_changed_columns() -> None:
+    engine = customer_engine()
+    ada, alan, grace = Statements(Customer, engine).select()
+
+    ada.name = "Augusta"
+    grace.name = "Grace H."
+    alan.name = "A. Turing"
+    alan.email = "turing@mail.com"
+    customers = [ada, alan, grace]
+
+    assert Statements(Customer, engine).flush(customers) == 3
+
+    (by_name, rows_name), (by_both, rows_both) = writes(engine)
+    assert by_name.startswith("UPDATE customer SET name=%s WHERE")
+    assert rows_name == [("Augusta", 1), ("Grace H.", 3)]
+    assert by_both.startswith("UPDATE customer SET name=%s,email=%s WHERE")
+    assert rows_both == [("A. Turing", "turing@mail.com", 2)]
+
+    # COMMENT: flushed instances are clean again, so a second flush writes nothing
+    assert all(not x.get_changes() for x in customers)
+    assert Statements(Customer, engine).flush(customers) == 0
+    assert len(writes(engine)) == 2
+
+
+def test_flush_uses_the_loaded_primary_key() -> None:
+    engine = customer_engine()
+    ada, *_ = Statements(Customer, engine).select()
+    ada.customer_id = 10
+
+    Statements(Customer, engine).flush(ada)
+    ((query, rows),) = writes(engine)
+    assert query.startswith("UPDATE customer SET customer_id=%s WHERE")
+    assert rows == [(10, 1)]
+
+    with pytest.raises(TypeError):
+        Statements(Customer, engine).flush([object()])
+
+
+def test_auto_generated_columns_are_not_flushed() -> None:
+    engine = customer_engine()
+    first, second, _ = Statements(Ticket, engine).select()
+
+    second.title = "Renamed"
+    first.ticket_id = 10
+    with pytest.raises(ValueError, match="ticket_id"):
+        Statements(Ticket, engine).flush([second, first])
+
+    # COMMENT: nothing was sent and the changes are kept, so the instances still tell what differs from their rows
+    assert writes(engine) == []
+    assert first.get_changes() == {"ticket_id": 1}
+    assert second.get_changes() == {"title": "Alan"}
+
+
+def test_hand_made_instances_are_not_flushed() -> None:
+    engine = customer_engine()
+    new = Customer(customer_id=4, name="Edsger")
+    new.name = "Dijkstra"
+
+    # COMMENT: there is no loaded row to update, so nothing is sent for them
+    assert Statements(Customer, engine).flush([new]) == 0
+    assert Statements(Customer, engine).flush([]) == 0
+    assert writes(engine) == []
@@ -0,0 +1,66 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ormlambda.statements import GenerativeQuery, Statements
+from test.fakes import make_engine
+from test.models import Address
+
+
+@pytest.fixture
+def base() -> GenerativeQuery[Address]:
+    return Statements(Address, make_engine()).generative().where(lambda x: x.City.Country.country == "Spain")
+
+
+def test_chained_queries_do_not_modify_their_parent(base: GenerativeQuery[Address]) -> None:
+    first = base.where(lambda x: x.address_id > 10).order(lambda x: x.address_id, "DESC").limit(5)
+    second = base.where(lambda x: x.district == "Madrid")
+
+    base_query = base.select(lambda x: x.address_id, only_query=True)
+    assert "address_id > 10" not in base_query
+    assert "LIMIT" not in base_query
+
+    first_query = first.select(lambda x: x.address_id, only_query=True)
+    assert "`address`.address_id > 10" in first_query
+    assert first_query.endswith("ORDER BY `address`.address_id DESC\nLIMIT 5")
+    assert "Madrid" not in first_query
+
+    assert "`address`.district = 'Madrid'" in second.select(lambda x: x.address_id, only_query=True)
+    # COMMENT: the same object can be executed again and returns the same SQL
+    assert base.select(lambda x: x.address_id, only_query=True) == base_query
+
+
+def test_immutable(base: GenerativeQuery[Address]) -> None:
+    with pytest.raises(AttributeError):
+        base._step = None
+
+
+def test_shared_across_threads(base: GenerativeQuery[Address]) -> None:
+    def run(i: int) -> None:
+        base.where(lambda x: x.address_id == i).select()
+
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(run, range(200)))
+
+    queries = base.engine.repository.queries
+    assert len(queries) == 200
+    assert len({query for query, _ in queries}) == 1
+    assert sorted(params[1] for _, params in queries) == list(range(200))
+    assert all(params[0] == "Spain" for _, params in queries)
+
+
+def test_build_returns_new_statements(base: GenerativeQuery[Address]) -> None:
+    first, second = base.build(), base.build()
+
+    assert type(first) is Statements
+    assert first is not second
+    assert first._query_builder.where.comparers == second._query_builder.where.comparers
+
+
+def test_reads_reach_the_repository_with_their_params(base: GenerativeQuery[Address]) -> None:
+    assert base.where(lambda x: x.address_id == 1).select() == ()
+
+    ((query, params),) = base.engine.repository.queries
+    assert "WHERE `address_City_Country`.country = %s AND `address`.address_id = %s" in query
+    assert params == ("Spain", 1)
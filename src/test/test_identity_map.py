@@ -0,0 +1,111 @@
+from __future__ import annotations
+import datetime
+import gc
+
+from ormlambda.repository.identity_map import open_identity_map
+from ormlambda.statements import Statements
+from test.fakes import FakeRepository, make_engine
+from test.models import City, Country
+
+
+LAST_UPDATE = datetime.datetime(2024, 1, 2, 3, 4, 5)
+
+
+def city_rows() -> list[tuple]:
+    spain = (1, "Spain", LAST_UPDATE)
+    return [
+        (1, "Madrid", 1, LAST_UPDATE, *spain),
+        (2, "Sevilla", 1, LAST_UPDATE, *spain),
+        (3, "Lisboa", 2, LAST_UPDATE, 2, "Portugal", LAST_UPDATE),
+    ]
+
+
+def test_same_row_returns_same_instance() -> None:
+    engine = make_engine(FakeRepository(city_rows()))
+
+    with open_identity_map(engine.repository) as identity_map:
+        (madrid, spain), (sevilla, spain2), (lisboa, portugal) = Statements(City, engine).select(lambda x: (x, x.Country), avoid_duplicates=True)
+        assert spain is spain2
+        assert spain is not portugal
+
+        again = Statements(City, engine).select(lambda x: (x, x.Country), avoid_duplicates=True)
+        assert again[0][0] is madrid
+        assert again[2][1] is portugal
+        assert len(identity_map) == 5
+
+        # COMMENT: instances without every column aren't shared
+        (partial, _), *_ = Statements(City, engine).select(lambda x: (x.city_id, x.city, x.Country), avoid_duplicates=True)
+        assert partial is not madrid
+
+    (madrid2, spain3), (_, spain4), _ = Statements(City, engine).select(lambda x: (x, x.Country), avoid_duplicates=True)
+    assert madrid2 is not madrid
+    assert spain3 is not spain4
+
+
+def test_get_uses_the_map_until_the_table_is_written() -> None:
+    engine = make_engine(FakeRepository([(1, "Spain", LAST_UPDATE)]))
+    statements = Statements(Country, engine)
+
+    with open_identity_map(engine.repository):
+        spain = statements.get(1)
+        query, params = engine.repository.queries[-1]
+        assert query.endswith("WHERE `country`.country_id = %s LIMIT 1")
+        assert params == (1,)
+
+        assert statements.get(1) is spain
+        assert len(engine.repository.queries) == 1
+
+        # COMMENT: other conditions could filter the row out
+        statements.where(lambda x: x.country == "Spain").get(1)
+        assert len(engine.repository.queries) == 2
+
+        statements.where(lambda x: x.country_id == 1).update({"country": "España"})
+        engine.repository.rows = [(1, "España", LAST_UPDATE)]
+
+        spain2 = statements.get(1)
+        assert spain2 is not spain
+        assert spain2.country == "España"
+        assert len(engine.repository.queries) == 4
+
+    engine.repository.rows = []
+    assert statements.get(2) is None
+
+
+def test_instances_are_released() -> None:
+    engine = make_engine(FakeRepository(city_rows()))
+
+    with open_identity_map(engine.repository) as identity_map:
+        cities = Statements(City, engine).select()
+        assert len(identity_map) == 3
+
+        del cities
+        gc.collect()
+        assert len(identity_map) == 0
+
+
+def test_nested_blocks_share_the_outer_map() -> None:
+    engine = make_engine(FakeRepository([(1, "Spain", LAST_UPDATE)]))
+
+    with open_identity_map(engine.repository) as outer:
+        spain = Statements(Country, engine).get(1)
+        with open_identity_map(engine.repository) as inner:
+            assert inner is outer
+            assert Statements(Country, engine).get(1) is spain
+
+        # COMMENT: leaving the inner block neither closes nor clears the map
+        assert engine.repository.current_identity_map is outer
+        assert len(outer) == 1
+
+    assert engine.repository.current_identity_map is None
+    assert len(engine.repository.queries) == 1
+
+
+def test_rows_without_primary_key_are_not_shared() -> None:
+    # COMMENT: a LEFT JOIN without match returns NULL in every column of the joined table
+    engine = make_engine(FakeRepository([(1, "Madrid", None, LAST_UPDATE, None, None, None)]))
+
+    with open_identity_map(engine.repository) as identity_map:
+        madrid, country = Statements(City, engine).select(lambda x: (x, x.Country), avoid_duplicates=True)
+        assert country.country_id is None
+        assert len(identity_map) == 1
+        assert identity_map.get(City, 1) is madrid
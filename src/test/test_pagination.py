@@ -0,0 +1,116 @@
+from __future__ import annotations
+import datetime
+import decimal
+
+import pytest
+
+from ormlambda.common.errors import InvalidCursorError
+from ormlambda.statements import Statements
+from ormlambda.statements.pagination import Keyset
+from test.fakes import FakeRepository, make_engine
+from test.models import Address
+
+
+LAST_UPDATE = datetime.datetime(2024, 1, 2, 3, 4, 5)
+
+
+def make_statements(rows: list[tuple]) -> Statements[Address]:
+    return Statements(Address, make_engine(FakeRepository(rows)))
+
+
+def test_seek_with_row_comparison_on_related_table() -> None:
+    # COMMENT: address_id and district selected, followed by the 'order_by' columns
+    rows = [(i, f"district {i}", "Spain", i) for i in range(1, 4)]
+    statements = make_statements(rows)
+
+    def order_by(x):
+        return (x.City.Country.country, x.address_id)
+
+    page = statements.paginate(order_by, 2, selector=lambda x: (x.address_id, x.district), flavour=dict)
+
+    assert page.items == ({"address_id": 1, "district": "district 1"}, {"address_id": 2, "district": "district 2"})
+    assert page.has_next
+
+    query, params = statements.engine.repository.queries[-1]
+    assert "`address_City_Country`.country AS `__seek_0`" in query
+    assert "LEFT JOIN country AS `address_City_Country`" in query
+    assert "WHERE" not in query
+    assert query.endswith("ORDER BY `address_City_Country`.country ASC, `address`.address_id ASC LIMIT 3")
+    assert params == ()
+
+    statements.engine.repository.rows = rows[2:]
+    last = statements.where(lambda x: x.district != "Madrid").paginate(order_by, 2, page.next, selector=lambda x: (x.address_id, x.district), flavour=dict)
+
+    assert last.items == ({"address_id": 3, "district": "district 3"},)
+    assert last.next is None
+
+    query, params = statements.engine.repository.queries[-1]
+    assert "WHERE `address`.district != %s AND (`address_City_Country`.country, `address`.address_id) > (%s, %s) ORDER BY" in query
+    assert params == ("Madrid", "Spain", 2)
+
+
+def test_seek_with_mixed_directions_returns_models() -> None:
+    rows = [(1, "address", None, "district", 1, "28001", "600", None, LAST_UPDATE, LAST_UPDATE, 1)] * 2
+    statements = make_statements(rows)
+
+    def order_by(x):
+        return (x.last_update, x.address_id)
+
+    page = statements.paginate(order_by, 1, order_type=["DESC", "ASC"])
+    (address,) = page.items
+    assert isinstance(address, Address)
+    assert address.last_update == LAST_UPDATE
+
+    statements.paginate(order_by, 1, page.next, order_type=["DESC", "ASC"])
+    query, params = statements.engine.repository.queries[-1]
+    assert "WHERE (`address`.last_update < %s OR (`address`.last_update = %s AND `address`.address_id > %s)) ORDER BY `address`.last_update DESC, `address`.address_id ASC LIMIT 2" in query
+    assert params == (LAST_UPDATE, LAST_UPDATE, 1)
+
+
+def test_token_is_bound_to_its_order() -> None:
+    keyset = Keyset(Address, lambda x: (x.last_update, x.address_id))
+    token = keyset.encode((LAST_UPDATE, 10))
+
+    with pytest.raises(InvalidCursorError):
+        Keyset(Address, lambda x: (x.last_update, x.address_id), "DESC").decode(token)
+
+    with pytest.raises(InvalidCursorError):
+        Keyset(Address, lambda x: x.address_id).decode(token)
+
+    with pytest.raises(InvalidCursorError):
+        keyset.decode("not a token")
+
+
+def test_token_keeps_value_types() -> None:
+    values = (decimal.Decimal("1.10"), datetime.date(2024, 1, 2), datetime.timedelta(hours=25, microseconds=3), b"\x00\xff", 1.5, True, "text")
+    keyset = Keyset(Address, lambda x: (x.address_id, x.address, x.address2, x.district, x.city_id, x.postal_code, x.phone))
+
+    assert keyset.decode(keyset.encode(values)) == values
+
+
+def test_empty_page_and_invalid_size() -> None:
+    statements = make_statements([])
+
+    page = statements.paginate(lambda x: x.address_id, 10)
+    assert page.items == ()
+    assert not page.has_next and page.next is None
+
+    with pytest.raises(ValueError, match="page_size"):
+        statements.paginate(lambda x: x.address_id, 0)
+    assert len(statements.engine.repository.queries) == 1
+
+
+def test_null_keys_stop_the_pagination_loudly() -> None:
+    # COMMENT: 'address2' is nullable, and 'address2 > NULL' would return an empty page as if there were no more rows
+    rows = [(i, f"district {i}", None if i == 2 else "b", i) for i in range(1, 4)]
+    statements = make_statements(rows)
+
+    def order_by(x):
+        return (x.address2, x.address_id)
+
+    with pytest.raises(ValueError, match="address.address2"):
+        statements.paginate(order_by, 2, selector=lambda x: (x.address_id, x.district), flavour=dict)
+
+    keyset = Keyset(Address, order_by)
+    with pytest.raises(InvalidCursorError, match="NULL"):
+        keyset.decode(keyset.encode((None, 2)))
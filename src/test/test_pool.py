@@ -0,0 +1,134 @@
+from __future__ import annotations
+import itertools
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from ormlambda.dialects import mysql
+from ormlambda.dialects.mysql.repository import MySQLRepository
+from ormlambda.engine.pool import PoolTimeoutError, QueuePool
+
+
+class FakeConnection:
+    ids = itertools.count(1)
+
+    def __init__(self, **config) -> None:
+        self.id = next(self.ids)
+        self.config = config
+        self.alive = True
+        self.closed = False
+        self.commits = 0
+        self.resets = 0
+
+    def is_connected(self) -> bool:
+        return self.alive
+
+    def reset_session(self) -> None:
+        self.resets += 1
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def rollback(self) -> None: ...
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def checkout(pool: QueuePool) -> FakeConnection:
+    with pool.get_connection() as cnx:
+        return cnx
+
+
+def test_blocking_checkout_with_timeout() -> None:
+    pool = QueuePool(FakeConnection, pool_size=1, max_overflow=0, timeout=0.05)
+
+    with pool.get_connection() as cnx:
+        started = time.perf_counter()
+        with pytest.raises(PoolTimeoutError):
+            checkout(pool)
+        assert time.perf_counter() - started >= 0.05
+
+    def hold() -> None:
+        with pool.get_connection():
+            time.sleep(0.02)
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    time.sleep(0.005)
+    # COMMENT: waits for the thread to return the only connection instead of failing
+    pool.timeout = 1
+    assert checkout(pool) is cnx
+    thread.join()
+
+    stats = pool.stats()
+    assert stats.timeouts == 1
+    assert stats.checkouts == 3
+    assert stats.max_checkout_time > 0
+
+
+def test_overflow_is_closed_when_returned() -> None:
+    pool = QueuePool(FakeConnection, pool_size=1, max_overflow=1, timeout=0)
+
+    with pool.get_connection() as first, pool.get_connection() as second:
+        assert pool.stats().overflow == 1
+        with pytest.raises(PoolTimeoutError):
+            checkout(pool)
+
+    assert second.closed and not first.closed
+    assert pool.stats()[:4] == (1, 1, 0, 0)
+
+
+@pytest.mark.parametrize("use_lifo, expected", [(True, 0), (False, 1)])
+def test_lifo_and_fifo(use_lifo: bool, expected: int) -> None:
+    pool = QueuePool(FakeConnection, pool_size=2, use_lifo=use_lifo)
+    with pool.get_connection() as first, pool.get_connection() as second:
+        pass
+
+    # COMMENT: 'second' is returned before 'first'
+    assert checkout(pool) is (first, second)[expected]
+
+
+def test_pre_ping_and_recycle() -> None:
+    pool = QueuePool(FakeConnection, pool_size=1, pre_ping=True, recycle=60)
+    cnx = checkout(pool)
+    cnx.alive = False
+
+    new = checkout(pool)
+    assert new is not cnx and cnx.closed
+
+    pool.recycle = 0
+    time.sleep(0.001)
+    assert checkout(pool) is not new
+
+    stats = pool.stats()
+    assert (stats.invalidated, stats.recycled) == (1, 1)
+
+
+def test_repository_with_queue_pool() -> None:
+    dialect = mysql.dialect(dbapi=SimpleNamespace(connect=FakeConnection, paramstyle="pyformat"))
+    repository = MySQLRepository(
+        user="root",
+        database="sakila",
+        dialect=dialect,
+        pool_class="queue",
+        pool_size="2",
+        max_overflow="0",
+        pool_pre_ping="true",
+        pool_timeout="none",
+    )
+
+    assert isinstance(repository.pool, QueuePool)
+    assert (repository.pool.pool_size, repository.pool.max_overflow, repository.pool.pre_ping, repository.pool.timeout) == (2, 0, True, None)
+    assert repository.database == "sakila"
+
+    with repository.get_connection() as cnx:
+        assert cnx.config["database"] == "sakila"
+
+    assert cnx.commits == 1
+    assert cnx.resets == 1
+
+    with pytest.raises(ValueError):
+        MySQLRepository(dialect=dialect, pool_class="unknown")
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import pytest
+
+from ormlambda import Column, ForeignKey, Relationship, Table
+from ormlambda.common.errors import RelationshipNotLoadedError
+from ormlambda.sql.relationship import iter_instances
+from ormlambda.statements import Statements
+from test.fakes import FakeRepository, make_engine
+
+
+class Author(Table):
+    __table_name__ = "author"
+
+    author_id: Column[int] = Column(int, is_primary_key=True, check_types=False)
+    name: Column[str] = Column(str, check_types=False)
+
+    books = Relationship["Author", "Book"](lambda: Book.Author, chunk_size=2)
+
+
+class Book(Table):
+    __table_name__ = "book"
+
+    book_id: Column[int] = Column(int, is_primary_key=True, check_types=False)
+    title: Column[str] = Column(str, check_types=False)
+    author_id: Column[int] = Column(int, check_types=False)
+
+    Author = ForeignKey["Book", Author](Author, lambda b, a: b.author_id == a.author_id)
+
+
+AUTHORS = [(1, "Ursula"), (2, "Italo"), (3, "Jorge"), (4, "Nobody")]
+BOOKS = [(10, "Lathe", 1), (11, "Invisible Cities", 2), (12, "Earthsea", 1), (13, "Ficciones", 3), (14, "The Dispossessed", 1), (15, "Anonymous", None)]
+
+
+def library(authors: list[tuple] = AUTHORS):
+    def answer(query: str, params: tuple, flavour, **kwargs) -> tuple:
+        if "FROM book" in query:
+            return tuple(x for x in BOOKS if x[2] in params)
+        return tuple(authors[:1] if query.endswith("LIMIT 1") else authors)
+
+    return make_engine(FakeRepository(answer=answer))
+
+
+def test_children_are_loaded_in_chunks() -> None:
+    engine = library()
+    ursula, italo, jorge, nobody = Statements(Author, engine).select(load=[Author.books])
+
+    assert [x.title for x in ursula.books] == ["Lathe", "Earthsea", "The Dispossessed"]
+    assert [x.title for x in italo.books] == ["Invisible Cities"]
+    assert [x.title for x in jorge.books] == ["Ficciones"]
+    assert nobody.books == ()
+
+    # COMMENT: one query for the authors and one per chunk of 2 authors
+    (query, first), (_, second) = engine.repository.queries[1:]
+    assert "WHERE `book`.author_id IN (%s, %s)" in query
+    assert (first, second) == ((1, 2), (3, 4))
+
+
+def test_select_one_and_joined_models() -> None:
+    engine = library()
+    author = Statements(Author, engine).select_one(load=[Author.books])
+    assert [x.title for x in author.books] == ["Lathe", "Earthsea", "The Dispossessed"]
+
+    # COMMENT: parents are also found inside the tuples returned when several models are selected
+    book = Book(book_id=10, title="Lathe", author_id=1)
+    assert list(iter_instances(((book, author), (book, None)), Author)) == [author]
+
+
+def test_relationship_must_be_loaded() -> None:
+    engine = library()
+    author, *_ = Statements(Author, engine).select()
+
+    with pytest.raises(RelationshipNotLoadedError, match="load=\\[Author.books\\]"):
+        author.books
+
+    with pytest.raises(ValueError):
+        Statements(Author, engine).select(flavour=dict, load=[Author.books])
+
+    with pytest.raises(TypeError):
+        Statements(Author, engine).select(load=["books"])
+
+    assert (Author.books.child, Author.books.child_column, Author.books.parent_column) == (Book, "author_id", "author_id")
+
+
+def test_children_are_not_queried_without_keys() -> None:
+    engine = library([])
+    assert Statements(Author, engine).select(load=[Author.books]) == ()
+    assert len(engine.repository.queries) == 1
+
+    # COMMENT: repeated and NULL keys are left out of the IN list, and parents without key get no children
+    engine = library([(1, "Ursula"), (None, "Anonymous"), (1, "Ursula")])
+    ursula, anonymous, again = Statements(Author, engine).select(load=[Author.books])
+
+    (_, params), *rest = engine.repository.queries[1:]
+    assert params == (1,) and not rest
+    assert anonymous.books == ()
+    assert ursula.books == again.books and len(ursula.books) == 3
+
+
+def test_chunk_size_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="chunk_size"):
+        Relationship(lambda: Book.Author, chunk_size=0)
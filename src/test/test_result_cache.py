@@ -0,0 +1,129 @@
+from __future__ import annotations
+import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from ormlambda.engine.result_cache import DiskBackend, MemoryBackend, ResultCache
+from ormlambda.repository.session import Session
+from ormlambda.statements import Statements
+from test.fakes import FakeRepository, make_engine
+from test.models import Address, City, Country
+
+
+LAST_UPDATE = datetime.datetime(2024, 1, 2, 3, 4, 5)
+
+
+def make_cached_engine(rows: list[tuple], **kwargs):
+    return make_engine(FakeRepository(rows), result_cache=ResultCache(MemoryBackend(kwargs.pop("maxsize", 1024)), **kwargs))
+
+
+def test_writes_invalidate_every_table_read() -> None:
+    engine = make_cached_engine([(1, "Madrid", 1, LAST_UPDATE)])
+
+    def madrid():
+        return Statements(City, engine).where(lambda x: x.Country.country == "Spain").select()
+
+    assert madrid() == madrid()
+    assert Statements(City, engine).where(lambda x: x.Country.country == "France").count() == 1
+    assert Statements(City, engine).where(lambda x: x.Country.country == "France").count() == 1
+    assert len(engine.repository.queries) == 2
+    assert (engine.result_cache.hits, engine.result_cache.misses) == (2, 2)
+
+    # COMMENT: the country table is only reached through the join, and it's enough to drop the results
+    Statements(Country, engine).insert(Country(country_id=3, country="Italy"))
+    madrid()
+    assert len(engine.repository.queries) == 4
+
+    Statements(Address, engine).where(lambda x: x.address_id == 1).update({"district": "Centro"})
+    madrid()
+    assert len(engine.repository.queries) == 5
+
+    Statements(City, engine).where(lambda x: x.city_id == 1).delete()
+    madrid()
+    assert len(engine.repository.queries) == 7
+
+
+def test_entries_expire_and_are_evicted(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [1000.0]
+    monkeypatch.setattr("ormlambda.engine.result_cache.time.time", lambda: now[0])
+
+    engine = make_cached_engine([(1, "Spain", LAST_UPDATE)], ttl=10, maxsize=2)
+    statements = Statements(Country, engine)
+
+    for pk in (1, 1, 2, 3, 1):
+        statements.where(lambda x: x.country_id == pk).select()
+    # COMMENT: the entry of the first pk is the least recently used when the third one comes in
+    assert len(engine.repository.queries) == 4
+    assert len(engine.result_cache.backend) == 2
+
+    now[0] += 11
+    statements.where(lambda x: x.country_id == 1).select()
+    assert len(engine.repository.queries) == 5
+
+
+def test_disk_backend(tmp_path) -> None:
+    path = tmp_path / "cache.sqlite"
+    cache = ResultCache(DiskBackend(path, maxsize=2), ttl=None)
+
+    assert cache.fetch("SELECT 1", (1,), tuple, frozenset({"city", "country"}), lambda: ((1, "Madrid"),)) == ((1, "Madrid"),)
+    cache.fetch("SELECT 2", (), dict, frozenset({"address"}), lambda: ({"district": "Centro"},))
+    cache.close()
+
+    cache = ResultCache(DiskBackend(path, maxsize=2), ttl=None)
+    assert cache.fetch("SELECT 1", (1,), tuple, frozenset(), lambda: pytest.fail("not cached")) == ((1, "Madrid"),)
+    assert cache.lookup(cache.key("SELECT 1", ("1",), tuple)) == (False, None)
+
+    assert cache.invalidate(Country) == 1
+    assert cache.lookup(cache.key("SELECT 1", (1,), tuple)) == (False, None)
+
+    cache.fetch("SELECT 3", (), tuple, frozenset({"city"}), lambda: ())
+    cache.fetch("SELECT 4", (), tuple, frozenset({"city"}), lambda: ())
+    assert len(cache.backend) == 2
+    assert cache.lookup(cache.key("SELECT 2", (), dict)) == (False, None)
+    cache.close()
+
+
+def test_session_writes_invalidate_again_once_committed() -> None:
+    engine = make_cached_engine([(1, "Spain", LAST_UPDATE)])
+    session = Session(engine.repository, SimpleNamespace(commit=lambda: None))
+
+    engine.repository.session = session
+    Statements(Country, engine).where(lambda x: x.country_id == 1).update({"country": "Italy"})
+
+    # COMMENT: a reader outside the session caches the row the session hasn't committed yet
+    engine.repository.session = None
+    Statements(Country, engine).select()
+    Statements(Country, engine).select()
+    assert engine.result_cache.hits == 1
+
+    engine.repository.session = session
+    session.commit()
+
+    engine.repository.session = None
+    Statements(Country, engine).select()
+    assert engine.result_cache.hits == 1
+    assert engine.result_cache.misses == 2
+
+
+def test_results_are_kept_per_database_and_namespace(tmp_path) -> None:
+    engine = make_cached_engine([(1, "Spain", LAST_UPDATE)])
+    engine.repository.database = "sakila"
+    Statements(Country, engine).select()
+    Statements(Country, engine).select()
+
+    # COMMENT: the compiled query doesn't name the database, so the same SQL run on another one is a different entry
+    engine.repository.database = "world"
+    Statements(Country, engine).select()
+    assert (engine.result_cache.hits, engine.result_cache.misses) == (1, 2)
+    assert len(engine.repository.queries) == 2
+
+    path = tmp_path / "cache.sqlite"
+    first = ResultCache(DiskBackend(path), namespace="db1.local")
+    second = ResultCache(DiskBackend(path), namespace="db2.local")
+
+    first.fetch("SELECT 1", (), tuple, frozenset({"country"}), lambda: ((1, "Spain"),), "sakila")
+    assert second.fetch("SELECT 1", (), tuple, frozenset({"country"}), lambda: ((2, "France"),), "sakila") == ((2, "France"),)
+    assert first.fetch("SELECT 1", (), tuple, frozenset(), lambda: pytest.fail("not cached"), "sakila") == ((1, "Spain"),)
+    first.close()
+    second.close()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import pytest
+
+from ormlambda.dialects import mysql
+from ormlambda.engine import Engine
+from ormlambda.repository import RoutingRepository
+from ormlambda.statements import Statements
+from test.fakes import FakeRepository
+from test.models import Address
+
+
+def make_engine(*replicas: FakeRepository, **kwargs) -> tuple[Engine, FakeRepository]:
+    primary = FakeRepository(name="primary")
+    dialect = mysql.dialect()
+    return Engine(RoutingRepository(primary, replicas, dialect=dialect, **kwargs), dialect, None), primary
+
+
+def test_reads_go_to_replicas_and_writes_to_primary() -> None:
+    r1, r2 = FakeRepository(name="r1"), FakeRepository(name="r2")
+    engine, primary = make_engine(r1, r2)
+    statements = Statements(Address, engine)
+
+    for _ in range(4):
+        statements.select()
+    assert statements.count() == 0
+    assert (len(r1.queries), len(r2.queries)) == (3, 2)
+
+    statements.where(lambda x: x.address_id == 1).update({"district": "Madrid"})
+    statements.select(use_primary=True)
+    with engine.use_primary():
+        statements.select()
+
+    assert [x.split(" ", 1)[0] for x in primary.statements] == ["UPDATE", "SELECT", "SELECT"]
+    assert (len(r1.queries), len(r2.queries)) == (3, 2)
+    # COMMENT: listeners of the engine see the queries of every server
+    assert r1.events is r2.events is primary.events is engine.events
+
+
+def test_least_in_flight() -> None:
+    r1, r2 = FakeRepository(name="r1"), FakeRepository(name="r2")
+    engine, _ = make_engine(r1, r2, selector="least_in_flight")
+    engine.repository.replicas[0].in_flight = 3
+
+    for _ in range(3):
+        engine.repository.read_sql("SELECT 1")
+    assert (len(r1.queries), len(r2.queries)) == (0, 3)
+
+
+def test_unreachable_replica_is_ejected() -> None:
+    broken = FakeRepository(name="broken", error=ConnectionRefusedError())
+    healthy = FakeRepository(name="healthy")
+    engine, primary = make_engine(broken, healthy, eject_for=60)
+
+    for _ in range(3):
+        engine.repository.read_sql("SELECT 1")
+
+    assert len(healthy.queries) == 3
+    assert not engine.repository.replicas[0].healthy
+
+    # COMMENT: errors of the statement itself are raised instead of moving to another server
+    healthy.error = ValueError("syntax error")
+    with pytest.raises(ValueError):
+        engine.repository.read_sql("SELECT 1")
+    assert engine.repository.replicas[1].healthy
+
+    healthy.error = ConnectionResetError()
+    engine.repository.read_sql("SELECT 1")
+    assert primary.statements == ["SELECT 1"]
+
+
+def test_read_your_writes() -> None:
+    replica = FakeRepository(name="replica")
+    engine, primary = make_engine(replica, read_your_writes=60)
+
+    engine.repository.read_sql("SELECT 1")
+    engine.repository.execute("DELETE FROM address")
+    engine.repository.read_sql("SELECT 2")
+
+    assert replica.statements == ["SELECT 1"]
+    assert primary.statements == ["DELETE FROM address", "SELECT 2"]
@@ -0,0 +1,88 @@
+from __future__ import annotations
+import pickle
+import sys
+
+import pytest
+
+from ormlambda import Column, Row, Table
+from ormlambda.sql.table.table_row import __row_projection__
+from ormlambda.statements import Statements
+from test.fakes import FakeRepository, make_engine
+
+
+class Country(Table):
+    __table_name__ = "country"
+
+    country_id: Column[int] = Column(int, is_primary_key=True, check_types=False)
+    country: Column[str] = Column(str, check_types=False)
+
+
+ROWS = ((1, "Spain"), (2, "France"), (1, "Spain"))
+
+
+def answer(query: str, params: tuple, flavour, **kwargs) -> tuple:
+    rows = ROWS[:1] if query.endswith("LIMIT 1") else ROWS
+    # COMMENT: the 'tuple' flavour returns the value itself when a single column is selected
+    if "`country`.country " not in query:
+        return tuple(x[0] for x in rows)
+    return rows
+
+
+def countries():
+    return make_engine(FakeRepository(answer=answer))
+
+
+def test_readonly_select_returns_rows() -> None:
+    spain, france, again = Statements(Country, countries()).select(readonly=True)
+
+    assert isinstance(spain, Row) and type(spain) is __row_projection__(Country)
+    assert (spain.country_id, spain.country, spain["country"]) == (1, "Spain", "Spain")
+    assert spain == again and spain != france
+    assert len({spain, france, again}) == 2
+    assert spain.to_dict() == {"country_id": 1, "country": "Spain"}
+
+    # COMMENT: values live in slots, so rows take less memory than models
+    assert not hasattr(spain, "__dict__")
+    assert sys.getsizeof(spain) < sys.getsizeof(Country(1, "Spain").__dict__)
+
+
+def test_rows_are_read_only() -> None:
+    spain = Statements(Country, countries()).select_one(readonly=True)
+
+    with pytest.raises(AttributeError):
+        spain.country = "Portugal"
+
+    model = spain.to_model()
+    assert isinstance(model, Country)
+    assert (model.country_id, model.country) == (1, "Spain")
+    model.country = "Portugal"
+    assert spain.country == "Spain"
+
+    assert pickle.loads(pickle.dumps(spain)) == spain
+
+
+def test_partial_rows_and_invalid_combinations() -> None:
+    engine = countries()
+    (row, *_) = Statements(Country, engine).select(lambda x: x.country_id, readonly=True)
+    assert (row.country_id, row.country) == (1, None)
+
+    with pytest.raises(ValueError):
+        Statements(Country, engine).select(readonly=True, defer=lambda x: x.country)
+
+
+class Note(Table):
+    __table_name__ = "note"
+
+    text: Column[str] = Column(str, check_types=False)
+
+
+def test_rows_without_primary_key() -> None:
+    # COMMENT: the single column comes back flat, as the 'tuple' flavour returns it
+    engine = make_engine(FakeRepository(["a", "b", "a"]))
+    first, second, third = Statements(Note, engine).select(readonly=True)
+
+    assert first.__pk__ is None
+    assert first == third and first != second
+    assert hash(first) == hash(third) == hash(Note(text="a"))
+    assert len({first, second, third}) == 2
+    assert repr(first) == "NoteRow(text='a')"
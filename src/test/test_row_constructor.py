@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from ormlambda.common.global_checker import GlobalChecker
+from ormlambda.dialects import mysql
+from ormlambda.repository.response import Response
+from ormlambda.sql import clauses
+from ormlambda.sql.table.table_constructor import __row_constructor__
+from ormlambda.statements.base_statement import ClusterResponse
+from test.fakes import FakeRepository, make_engine
+from test.models import Address, City
+
+
+def cluster(selector, rows: list[tuple]):
+    dialect = mysql.dialect()
+    select = clauses.Select(Address, GlobalChecker.resolved_callback_object(Address, selector))
+    query = select.compile(dialect).string
+
+    def answer(query, params, flavour, select=None, **kwargs):
+        columns = tuple(x.alias for x in select.columns)
+        return Response(dialect, rows, columns, flavour, select, query=query).response(**kwargs)
+
+    engine = make_engine(FakeRepository(answer=answer))
+    return ClusterResponse(select, engine, None, query).cluster_data()
+
+
+def test_row_constructor_matches_init() -> None:
+    constructor = __row_constructor__(Address, {"address": 0, "address_id": 1})
+    address = constructor(("47 MySakila Drive", 1))
+
+    assert address == Address(address_id=1, address="47 MySakila Drive")
+    assert address.city_id is None
+
+
+def test_row_constructor_is_reused_for_the_same_layout() -> None:
+    assert __row_constructor__(Address, {"address_id": 0}) is __row_constructor__(Address, {"address_id": 0})
+    assert __row_constructor__(Address, {"address_id": 0}) is not __row_constructor__(Address, {"address_id": 1})
+
+
+def test_cluster_single_column() -> None:
+    result = cluster(lambda x: x.address_id, [(1,), (2,)])
+    assert result == (Address(address_id=1), Address(address_id=2))
+
+
+def test_cluster_joined_models() -> None:
+    result = cluster(lambda x: (x.address_id, x.City.city), [(1, "A Corua"), (2, "Abha")])
+    assert result == (
+        (Address(address_id=1), City(city="A Corua")),
+        (Address(address_id=2), City(city="Abha")),
+    )
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import pytest
+
+from ormlambda import ORM, Engine
+from test.fakes import make_mysql_engine
+from test.models import Country
+
+
+@pytest.fixture
+def engine() -> Engine:
+    # COMMENT: a single connection in the pool, so every checkout returns the same one
+    return make_mysql_engine(pool_size=1, max_overflow=0)
+
+
+def kinds(engine: Engine) -> list[str]:
+    (cnx,) = engine.dialect.dbapi.opened
+    return [f"{kind} {query.split(' ', 1)[0]}".strip() for kind, query, _ in cnx.log]
+
+
+def test_statements_share_one_transaction(engine: Engine) -> None:
+    ORM(Country, engine).insert(Country(country="Spain"))
+    assert kinds(engine) == ["execute INSERT", "commit"]
+
+    with engine.session() as session:
+        ORM(Country, engine).insert(Country(country="France"))
+        ORM(Country, engine).where(lambda x: x.country_id == 1).update({"country": "Portugal"})
+        assert engine.repository.current_session is session
+
+    assert kinds(engine)[2:] == ["execute INSERT", "execute UPDATE", "commit"]
+    assert engine.repository.current_session is None
+
+
+def test_deferred_writes_are_grouped(engine: Engine) -> None:
+    with engine.session(defer=True) as session:
+        ORM(Country, engine).insert([Country(country="Spain"), Country(country="France")])
+        ORM(Country, engine).insert(Country(country="Italy"))
+        ORM(Country, engine).where(lambda x: x.country_id == 1).update({"country": "Portugal"})
+        ORM(Country, engine).where(lambda x: x.country_id == 2).update({"country": "Greece"})
+
+        assert kinds(engine) == []
+        assert session.pending == 5
+
+        # COMMENT: reads flush the queue so they see the writes made before them
+        ORM(Country, engine).select()
+        assert session.pending == 0
+
+    (cnx,) = engine.dialect.dbapi.opened
+    assert kinds(engine) == ["execute INSERT", "executemany UPDATE", "execute SELECT", "commit"]
+
+    insert, update = cnx.log[0], cnx.log[1]
+    assert insert[1].count("(%s") == 3
+    assert insert[2] == [None, "Spain", None, None, "France", None, None, "Italy", None]
+    assert update[2] == [("Portugal", 1), ("Greece", 2)]
+
+
+def test_interleaved_writes_keep_their_order(engine: Engine) -> None:
+    with engine.session(defer=True):
+        ORM(Country, engine).where(lambda x: x.country_id == 1).update({"country": "x"})
+        ORM(Country, engine).where(lambda x: x.country_id == 1).update({"country": "y", "last_update": None})
+        ORM(Country, engine).where(lambda x: x.country_id == 1).update({"country": "z"})
+
+    (cnx,) = engine.dialect.dbapi.opened
+    assert [params for kind, _, params in cnx.log if kind != "commit"] == [("x", 1), ("y", None, 1), ("z", 1)]
+
+
+def test_insert_delete_insert_is_not_reordered(engine: Engine) -> None:
+    with engine.session(defer=True):
+        ORM(Country, engine).insert(Country(country_id=1, country="Spain"))
+        ORM(Country, engine).where(lambda x: x.country_id == 1).delete()
+        ORM(Country, engine).insert(Country(country_id=1, country="Spain"))
+
+    assert kinds(engine) == ["execute INSERT", "execute DELETE", "execute INSERT", "commit"]
+
+
+def test_nothing_is_sent_when_the_session_has_no_writes(engine: Engine) -> None:
+    with engine.session(defer=True) as session:
+        assert session.flush() == 0
+
+    assert kinds(engine) == ["commit"]
+
+
+def test_session_rolls_back_on_error(engine: Engine) -> None:
+    with pytest.raises(RuntimeError):
+        with engine.session(defer=True):
+            ORM(Country, engine).insert(Country(country="Spain"))
+            raise RuntimeError
+
+    assert kinds(engine) == ["rollback"]
+
+
+def test_after_commit_callbacks_run_when_the_block_ends(engine: Engine) -> None:
+    calls = []
+    with engine.session() as session:
+        session.after_commit("country", lambda: calls.append("replaced"))
+        session.after_commit("country", lambda: calls.append(kinds(engine)[-1]))
+        ORM(Country, engine).insert(Country(country="Spain"))
+        assert calls == []
+
+    # COMMENT: only the last callback of each key runs, and it already sees the commit
+    assert calls == ["commit"]
+
+
+def test_nested_sessions_join_the_outer_one(engine: Engine) -> None:
+    with engine.session(defer=True) as outer:
+        with engine.session() as inner:
+            assert inner is outer
+            ORM(Country, engine).insert(Country(country="Spain"))
+        # COMMENT: the outer block deferred, so the inner one leaves the write queued for it
+        assert outer.pending == 1
+
+    with engine.session() as outer:
+        with engine.session(defer=True):
+            ORM(Country, engine).insert(Country(country="France"))
+            assert outer.pending == 1
+        assert outer.pending == 0
+        assert not outer.deferring
+
+    assert kinds(engine) == ["execute INSERT", "commit", "execute INSERT", "commit"]
+
+
+def test_rollback_discards_deferred_writes(engine: Engine) -> None:
+    with engine.session(defer=True) as session:
+        ORM(Country, engine).insert(Country(country="Spain"))
+        session.rollback()
+        assert session.pending == 0
+        ORM(Country, engine).insert(Country(country="France"))
+
+    ((_, _, params),) = [x for x in engine.dialect.dbapi.opened[0].log if x[0] == "execute"]
+    assert kinds(engine) == ["rollback", "execute INSERT", "commit"]
+    assert "France" in params
+
+
+def test_chunks_never_commit_the_session(engine: Engine) -> None:
+    with pytest.raises(ValueError, match="commit_per_chunk"):
+        with engine.session():
+            ORM(Country, engine).insert(Country(country="Spain"))
+            ORM(Country, engine).insert([Country(country="France"), Country(country="Italy")], commit_per_chunk=True)
+
+    # COMMENT: progress is reported as the chunks are sent, but they're committed or rolled back along with the rest of the session
+    progress = []
+    with pytest.raises(RuntimeError):
+        with engine.session(defer=True):
+            ORM(Country, engine).insert([Country(country="France"), Country(country="Italy")], on_chunk=progress.append)
+            raise RuntimeError
+
+    assert len(progress) == 1
+    assert kinds(engine) == ["execute INSERT", "rollback", "execute INSERT", "rollback"]
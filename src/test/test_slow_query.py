@@ -0,0 +1,66 @@
+from __future__ import annotations
+import json
+from pathlib import Path
+
+import pytest
+
+from ormlambda import Engine
+from ormlambda.engine.slow_query import SlowQuery
+from test.fakes import FakeCursor, make_mysql_engine
+
+
+PLAN = {"query_block": {"select_id": 1, "table": {"table_name": "address", "access_type": "ALL"}}}
+
+
+def on_execute(cursor: FakeCursor, query: str, params) -> None:
+    if query.startswith("EXPLAIN"):
+        cursor.rows, cursor.column_names = [(json.dumps(PLAN),)], ("EXPLAIN",)
+    else:
+        cursor.rows, cursor.column_names = [(1,), (2,)], ("address_id",)
+    cursor.rowcount = len(cursor.rows)
+
+
+@pytest.fixture
+def engine() -> Engine:
+    return make_mysql_engine(on_execute)
+
+
+def test_slow_queries_are_explained(engine: Engine, tmp_path: Path) -> None:
+    records: list[SlowQuery] = []
+    path = tmp_path / "slow.log"
+
+    with engine.log_slow_queries(0, path=path, callback=records.append, explain_sample_rate=1) as slow_log:
+        engine.repository.read_sql("SELECT address_id FROM address WHERE address_id > %s", params=(0,))
+        engine.repository.execute("SET @a = 1")
+        slow_log.flush()
+
+    (select, setter) = records
+    assert (select.params, select.rowcount, select.explain) == ([0], 2, PLAN)
+    assert setter.explain is None
+    assert engine.dialect.dbapi.statements.count("EXPLAIN FORMAT=JSON SELECT address_id FROM address WHERE address_id > %s") == 1
+
+    lines = [json.loads(x) for x in path.read_text().splitlines()]
+    assert [x["sql"] for x in lines] == ["SELECT address_id FROM address WHERE address_id > %s", "SET @a = 1"]
+    assert lines[0]["explain"] == PLAN
+
+    # COMMENT: once closed, nothing else is recorded
+    engine.repository.execute("SET @a = 2")
+    assert len(records) == 2
+
+
+def test_threshold_and_sampling(engine: Engine) -> None:
+    records: list[SlowQuery] = []
+
+    with engine.log_slow_queries(60, callback=records.append) as slow_log:
+        engine.repository.execute("SELECT 1")
+        slow_log.flush()
+    assert records == []
+
+    with engine.log_slow_queries(0, callback=records.append, explain_sample_rate=0) as slow_log:
+        engine.repository.execute("SELECT 1")
+        slow_log.flush()
+    assert [x.explain for x in records] == [None]
+    assert not any(x.startswith("EXPLAIN") for x in engine.dialect.dbapi.statements)
+
+    with pytest.raises(ValueError):
+        engine.log_slow_queries(0)
@@ -0,0 +1,33 @@
+from __future__ import annotations
+import pytest
+
+from ormlambda import IStatements
+from test.models import Address
+
+
+def test_stream_yields_same_models_as_select(amodel: IStatements[Address]) -> None:
+    expected = amodel.where(lambda x: x.address_id <= 25).select()
+    streamed = tuple(amodel.where(lambda x: x.address_id <= 25).stream(batch_size=7))
+
+    assert streamed == expected
+
+
+def test_stream_with_selector_and_flavour(amodel: IStatements[Address]) -> None:
+    expected = amodel.where(lambda x: x.address_id <= 10).select(lambda x: (x.address_id, x.City.city), flavour=dict)
+    streamed = tuple(amodel.where(lambda x: x.address_id <= 10).stream(lambda x: (x.address_id, x.City.city), flavour=dict, batch_size=3))
+
+    assert streamed == expected
+
+
+def test_closing_stream_releases_connection(amodel: IStatements[Address]) -> None:
+    rows = amodel.stream(lambda x: x.address_id, flavour=tuple, batch_size=2)
+    assert next(rows) is not None
+    rows.close()
+
+    # the connection went back to the pool without unread results, so it can be used again
+    assert amodel.where(lambda x: x.address_id == 1).select_one(lambda x: x.address_id, flavour=tuple) == 1
+
+
+def test_stream_rejects_invalid_batch_size(amodel: IStatements[Address]) -> None:
+    with pytest.raises(ValueError):
+        amodel.stream(batch_size=0)
@@ -1,3 +1,4 @@
+import pytest
 from typing import Annotated
 
 
@@ -69,3 +70,30 @@ def test_hashable_table() -> None:
     )
 
     assert user == user2
+
+
+def test_metadata_is_built_once_per_model() -> None:
+    metadata = Person.get_metadata()
+
+    assert metadata is Person.get_metadata()
+    assert [x.column_name for x in metadata.columns] == ["pk_id", "name", "age", "email", "phone", "address"]
+    assert metadata.positions["email"] == 3
+    assert Person.get_pk() is metadata.column_map["pk_id"]
+    assert metadata.auto_increment == frozenset({"pk_id"})
+
+
+def test_metadata_is_read_only() -> None:
+    with pytest.raises(AttributeError):
+        Person.get_metadata().columns = ()
+
+    with pytest.raises(TypeError):
+        Person.get_metadata().column_map["name"] = None
+
+
+def test_copied_table_gets_its_own_metadata() -> None:
+    NewPerson = Person.copy(__table_name__="new_person")
+
+    assert NewPerson.get_metadata() is not Person.get_metadata()
+    assert NewPerson.get_metadata().table is NewPerson
+    assert NewPerson.get_columns() == Person.get_columns()
+    assert NewPerson.get_pk() is Person.get_pk()